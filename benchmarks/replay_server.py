@@ -0,0 +1,195 @@
+"""
+Local stand-in for lifeattiktok.com and metacareers.com.
+
+Serves the three endpoints the scrapers read:
+
+- POST .../posts: TikTok job search pages, paged by the offset/limit JSON body
+- POST /api/graphql/ with x-fb-friendly-name CareersJobSearchResultsV3DataQuery: Meta job search,
+  paged by search_input.page in the form-encoded variables when one is sent, and narrowed
+  by the offices, teams and q keys that MetaCareersScraper shards the search on
+- GET /profile/job_details/<id>: Meta job detail HTML with embedded application/json data
+
+Responses recorded from the live sites can be dropped into benchmarks/fixtures
+(tiktok_posts.json, meta_search.json, meta_job_details/<id>.html); anything not
+recorded is generated from benchmarks.synthetic.
+"""
+import os
+import json
+import time
+import threading
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks import synthetic
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _load_fixture(name):
+    path = os.path.join(FIXTURES_DIR, name)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+class ReplayData:
+    """
+    The job data served by the replay server.
+    """
+
+    def __init__(self, tiktok_count=1000, meta_count=1000, latency=0.0):
+        """
+        Args:
+            tiktok_count: Number of synthetic TikTok jobs when no recording exists
+            meta_count: Number of synthetic Meta jobs when no recording exists
+            latency: Seconds of artificial delay added to every response
+        """
+        recorded_posts = _load_fixture("tiktok_posts.json")
+        if recorded_posts is not None:
+            self.tiktok_jobs = recorded_posts.get("data", {}).get("job_post_list", [])
+        else:
+            self.tiktok_jobs = synthetic.tiktok_jobs(tiktok_count)
+
+        recorded_search = _load_fixture("meta_search.json")
+        if recorded_search is not None:
+            self.meta_search = recorded_search
+        else:
+            self.meta_search = {
+                "data": {
+                    "job_search_with_featured_jobs": {
+                        "all_jobs": synthetic.meta_jobs(meta_count),
+                        "featured_jobs": [],
+                    }
+                }
+            }
+        self.meta_page_size = 100
+        self.latency = latency
+
+    def meta_search_page(self, page, search_input=None):
+        search = self.meta_search.get("data", {}).get("job_search_with_featured_jobs", {})
+        jobs = self._meta_shard_jobs(search.get("all_jobs", []), search_input or {})
+        if page is None:
+            return {"data": {"job_search_with_featured_jobs": {**search, "all_jobs": jobs}}}
+        start = (page - 1) * self.meta_page_size
+        return {
+            "data": {
+                "job_search_with_featured_jobs": {
+                    **search,
+                    "all_jobs": jobs[start:start + self.meta_page_size],
+                    "page_info": {"has_next_page": start + self.meta_page_size < len(jobs)},
+                }
+            }
+        }
+
+    @staticmethod
+    def _meta_shard_jobs(jobs, search_input):
+        offices = set(search_input.get("offices") or [])
+        teams = set(search_input.get("teams") or [])
+        query = (search_input.get("q") or "").lower()
+        return [
+            job for job in jobs
+            if (not offices or offices.intersection(job.get("locations") or []))
+            and (not teams or teams.intersection(job.get("teams") or []))
+            and query in (job.get("title") or "").lower()
+        ]
+
+    def tiktok_page(self, offset, limit):
+        return {
+            "code": 0,
+            "data": {"count": len(self.tiktok_jobs), "job_post_list": self.tiktok_jobs[offset:offset + limit]},
+        }
+
+    def meta_job_details_html(self, job_id):
+        path = os.path.join(FIXTURES_DIR, "meta_job_details", f"{job_id}.html")
+        if os.path.exists(path):
+            with open(path) as f:
+                return f.read()
+        payload = json.dumps({"require": [["ScheduledServerJS", {"job": synthetic.meta_job_details(job_id)}]]})
+        return (
+            "<!DOCTYPE html><html><head>"
+            '<script type="application/json" data-sjs>{"define": []}</script>'
+            f'<script type="application/json" data-content-len="{len(payload)}" data-sjs>{payload}</script>'
+            f"</head><body><span>Apply Now</span></body></html>"
+        )
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type="application/json", status=200):
+        if self.server.data.latency:
+            time.sleep(self.server.data.latency)
+        payload = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def do_POST(self):
+        body = self._read_body()
+        if "posts" in self.path:
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                request = {}
+            offset = int(request.get("offset", 0))
+            limit = int(request.get("limit", 12))
+            self._send(self.server.data.tiktok_page(offset, limit))
+        elif "graphql" in self.path and self.headers.get("x-fb-friendly-name") == "CareersJobSearchResultsV3DataQuery":
+            try:
+                variables = json.loads(parse_qs(body.decode()).get("variables", ["{}"])[0])
+                search_input = variables.get("search_input", {})
+                page = search_input.get("page")
+            except (ValueError, AttributeError):
+                search_input, page = {}, None
+            self._send(self.server.data.meta_search_page(int(page) if page else None, search_input))
+        else:
+            self._send({"error": "not found"}, status=404)
+
+    def do_GET(self):
+        if self.path.startswith("/profile/job_details/"):
+            job_id = self.path.rstrip("/").rsplit("/", 1)[-1]
+            self._send(self.server.data.meta_job_details_html(job_id), content_type="text/html")
+        else:
+            self._send({"error": "not found"}, status=404)
+
+
+class ReplayServer:
+    """
+    Context manager running the replay server on a background thread.
+
+    Example:
+        with ReplayServer(ReplayData(tiktok_count=5000)) as server:
+            url = f"{server.url}/api/v1/public/supplier/search/job/posts"
+    """
+
+    def __init__(self, data=None, host="127.0.0.1", port=0):
+        self.data = data or ReplayData()
+        self.httpd = ThreadingHTTPServer((host, port), ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.data = self.data
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
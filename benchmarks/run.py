@@ -0,0 +1,279 @@
+"""
+Offline benchmarks for crawling, filtering, storage and status reconciliation.
+
+Usage:
+    python -m benchmarks.run [--sizes 1000 100000 1000000] [--only filter storage] [--json report.json] [--rate-limit]
+
+Crawl benchmarks run against the local replay server, so no live site is touched.
+The memory suite reports jobs_df bytes per job, raw payload rows against the Job schema.
+The startup suite times fresh interpreters importing the entry points, and filtering
+a stored history of each size as `main.py show` does (without rendering the table).
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import contextlib
+
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks import synthetic
+from benchmarks.replay_server import ReplayData, ReplayServer
+from companies.http import RequestTemplate
+from companies.meta import MetaCareersScraper
+from companies.tiktok import TikTokCareersScrapper
+
+
+DEFAULT_SIZES = [1_000, 100_000]
+SUITES = ["crawl", "filter", "storage", "status", "memory", "startup"]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a quick command imports before doing any work
+STARTUP_MODULES = ["main", "companies.registry", "companies.tiktok", "companies.meta"]
+
+
+class ReplayMetaScraper(MetaCareersScraper):
+    """
+    Meta scraper whose job detail pages come from the replay server.
+    """
+
+    def __init__(self, server_url, **kwargs):
+        super().__init__(**kwargs)
+        self.server_url = server_url
+
+    def _job_details_url(self, job_id):
+        return f"{self.server_url}/profile/job_details/{job_id}"
+
+
+@contextlib.contextmanager
+def scratch_directory():
+    """
+    Run inside a temporary directory so scrapers write their data/ tree there.
+    """
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(previous)
+
+
+@contextlib.contextmanager
+def quiet():
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+
+def timed(fn, repeat=1):
+    """
+    Best wall-clock time of repeat calls, plus the last return value.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+class Results:
+    def __init__(self):
+        self.rows = []
+
+    def add(self, name, size, seconds, unit="rows"):
+        self.rows.append({"name": name, "size": size, "seconds": seconds, "rate": size / seconds if seconds else 0.0, "unit": unit})
+
+    def add_bytes(self, name, size, nbytes):
+        self.rows.append({"name": name, "size": size, "bytes": nbytes})
+
+    def print(self):
+        table = Table(title="Benchmarks", show_header=True, header_style="bold magenta")
+        table.add_column("Benchmark", style="cyan")
+        table.add_column("Size", justify="right")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Rate", justify="right", style="green")
+        for row in self.rows:
+            if "bytes" in row:
+                table.add_row(row["name"], f"{row['size']:,}", "", f"{row['bytes'] / row['size']:,.0f} bytes/job")
+                continue
+            table.add_row(row["name"], f"{row['size']:,}", f"{row['seconds']:.4f}", f"{row['rate']:,.0f} {row['unit']}/s")
+        Console().print(table)
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.rows, f, indent=2)
+
+
+def bench_crawl(results, sizes):
+    size = min(max(sizes), 10_000)
+    with scratch_directory(), ReplayServer(ReplayData(tiktok_count=size, meta_count=size, latency=0.01)) as server:
+        with quiet():
+            scraper = TikTokCareersScrapper(concurrency=8)
+            template = RequestTemplate(url=f"{server.url}/api/v1/public/supplier/search/job/posts", body={"limit": 12, "offset": 0})
+            seconds, jobs = timed(lambda: scraper._fetch_posts_via_api(template, size))
+        results.add("crawl.tiktok_posts", len(jobs), seconds, unit="jobs")
+
+        # Meta's search replayed page by page, as one query and as one query per office
+        search = RequestTemplate(
+            url=f"{server.url}/api/graphql/",
+            headers={"x-fb-friendly-name": "CareersJobSearchResultsV3DataQuery"},
+            body={"variables": json.dumps({"search_input": {"q": None}})},
+            body_format="form",
+        )
+        for name, shard_by in [("crawl.meta_search", None), ("crawl.meta_search_sharded", "locations")]:
+            with quiet():
+                meta = ReplayMetaScraper(server.url, locations=synthetic.META_LOCATIONS, search_concurrency=8, shard_by=shard_by)
+                meta.max_search_pages = size // 100 + 1
+                seconds, (jobs, _) = timed(lambda: meta._crawl_search(search, []))
+            results.add(name, len(jobs), seconds, unit="jobs")
+
+        details_count = min(size, 1_000)
+        with quiet():
+            meta = ReplayMetaScraper(server.url, description_concurrency=16)
+            meta.jobs_df = synthetic.meta_jobs_df(details_count, described_fraction=0.0)
+            seconds, hydrated = timed(lambda: meta.hydrate_descriptions())
+        results.add("crawl.meta_job_details", hydrated, seconds, unit="jobs")
+
+
+def bench_filter(results, sizes):
+    with scratch_directory():
+        with quiet():
+            tiktok = TikTokCareersScrapper()
+            meta = MetaCareersScraper()
+        for size in sizes:
+            for name, scraper, df in (
+                ("tiktok", tiktok, synthetic.tiktok_jobs_df(size)),
+                ("meta", meta, synthetic.meta_jobs_df(size)),
+            ):
+                scraper.jobs_df = df
+                scraper._mark_jobs_changed()
+                seconds, _ = timed(scraper._sync_search_index)
+                results.add(f"index.{name}.rebuild", size, seconds)
+                seconds, _ = timed(scraper.filter_jobs)
+                results.add(f"filter.{name}.cold", size, seconds)
+                seconds, _ = timed(scraper.filter_jobs, repeat=3)
+                results.add(f"filter.{name}.memoized", size, seconds)
+
+                changed = df["id"].iloc[:10]
+                scraper._mark_jobs_changed(changed)
+                seconds, _ = timed(scraper.filter_jobs)
+                results.add(f"filter.{name}.after_10_changes", size, seconds)
+
+                seconds, _ = timed(lambda: scraper.search_jobs('"software engineer" AND python NOT intern'), repeat=3)
+                results.add(f"search.{name}", size, seconds)
+
+
+def bench_storage(results, sizes):
+    backends = ["sqlite", "csv"]
+    try:
+        import pyarrow  # noqa: F401
+        backends.append("parquet")
+    except ImportError:
+        pass
+
+    for size in sizes:
+        df = synthetic.meta_jobs_df(size)
+        for backend in backends:
+            with scratch_directory(), quiet():
+                scraper = MetaCareersScraper(storage=backend)
+                scraper.jobs_df = df
+                save_seconds, _ = timed(scraper._save_jobs)
+                load_seconds, _ = timed(scraper.store.load)
+                update_seconds, _ = timed(lambda: scraper._save_jobs(df["id"].iloc[:10]))
+            results.add(f"storage.{backend}.save_all", size, save_seconds)
+            results.add(f"storage.{backend}.load", size, load_seconds)
+            results.add(f"storage.{backend}.upsert_10", size, update_seconds)
+
+
+def bench_status(results, sizes):
+    for size in sizes:
+        with scratch_directory(), quiet():
+            meta = MetaCareersScraper()
+            meta.jobs_df = synthetic.meta_jobs_df(size)
+            meta._sync_search_index()
+            checked = meta.jobs_df["id"].iloc[::10]
+            statuses = {job_id: (index % 3 == 0, "Hydrated description") for index, job_id in enumerate(checked)}
+            seconds, _ = timed(lambda: meta._merge_application_statuses(statuses))
+        results.add("status.meta_merge", len(statuses), seconds, unit="jobs")
+
+        with scratch_directory(), quiet():
+            tiktok = TikTokCareersScrapper()
+            tiktok.jobs_df = synthetic.tiktok_jobs_df(size)
+            tiktok._sync_search_index()
+            applied = [{"job_post_info": {"id": job_id}} for job_id in tiktok.jobs_df["id"].iloc[::20]]
+            tiktok.scrape_applied_page = lambda: applied
+            seconds, _ = timed(tiktok.update_applications)
+        results.add("status.tiktok_update_applications", size, seconds)
+
+
+def bench_memory(results, sizes):
+    for size in sizes:
+        for name, raw_df, jobs_df in (
+            ("tiktok", synthetic.tiktok_raw_df(size), synthetic.tiktok_jobs_df(size)),
+            ("meta", synthetic.meta_raw_df(size), synthetic.meta_jobs_df(size)),
+        ):
+            results.add_bytes(f"memory.{name}.raw", size, int(raw_df.memory_usage(deep=True).sum()))
+            results.add_bytes(f"memory.{name}.jobs", size, int(jobs_df.memory_usage(deep=True).sum()))
+
+
+def run_python(args, cwd=None):
+    """
+    Run a fresh interpreter with the repo on its path, discarding its output.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    subprocess.run([sys.executable, *args], cwd=cwd, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def bench_startup(results, sizes):
+    seconds, _ = timed(lambda: run_python(["-c", "pass"]), repeat=3)
+    results.add("startup.python", 1, seconds, unit="runs")
+    for module in STARTUP_MODULES:
+        seconds, _ = timed(lambda: run_python(["-c", f"import {module}"]), repeat=3)
+        results.add(f"startup.import.{module}", 1, seconds, unit="runs")
+
+    for size in sizes:
+        with scratch_directory() as directory:
+            with quiet():
+                for scraper, df in (
+                    (TikTokCareersScrapper(), synthetic.tiktok_jobs_df(size)),
+                    (MetaCareersScraper(), synthetic.meta_jobs_df(size)),
+                ):
+                    scraper.jobs_df = df
+                    scraper._save_jobs()
+            for company in ("tiktok", "meta"):
+                script = f"from companies.registry import scraper_class; scraper_class({company!r})().filter_jobs()"
+                seconds, _ = timed(lambda: run_python(["-c", script], cwd=directory), repeat=3)
+                results.add(f"startup.filter_{company}", size, seconds, unit="jobs")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run offline scraper benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="jobs_df sizes to generate")
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=SUITES)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--rate-limit", action="store_true", help="Keep the per-host rate controller on for the crawl suite")
+    args = parser.parse_args(argv)
+
+    # The replay server is local, so by default measure fetch and parse cost rather than the rate controller
+    if not args.rate_limit:
+        os.environ.setdefault("CRAWLER_RATE", "0")
+
+    results = Results()
+    suites = {"crawl": bench_crawl, "filter": bench_filter, "storage": bench_storage, "status": bench_status, "memory": bench_memory, "startup": bench_startup}
+    for name in args.only:
+        print(f"Running {name} benchmarks...", file=sys.stderr)
+        suites[name](results, args.sizes)
+
+    results.print()
+    if args.json:
+        results.write_json(args.json)
+
+
+if __name__ == "__main__":
+    main()
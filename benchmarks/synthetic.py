@@ -0,0 +1,121 @@
+"""
+Synthetic job data shaped like the TikTok and Meta listings.
+"""
+import numpy as np
+import pandas as pd
+
+from companies.jobs import Job, jobs_frame
+
+
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Machine Learning Engineer",
+    "Software Engineer, Android", "Software Engineer, iOS", "Data Scientist",
+    "Product Manager", "Research Scientist", "Software Engineer Intern",
+    "Staff Machine Learning Engineer", "Engineering Manager", "Site Reliability Engineer",
+]
+TIKTOK_CITIES = [
+    "Austin", "Chicago", "Los Angeles", "New York", "San Francisco", "San Jose",
+    "Seattle", "Washington DC", "London", "Singapore", "Toronto", "Dublin",
+]
+META_LOCATIONS = [
+    "Bellevue, WA", "Menlo Park, CA", "Seattle, WA", "New York, NY", "Sunnyvale, CA",
+    "Remote, US", "London, UK", "Austin, TX", "Burlingame, CA", "Redmond, WA",
+]
+REQUIREMENTS = [
+    "BS in Computer Science or related field. 3+ years of experience with Python or Go.",
+    "Experience with distributed systems. This position does not provide sponsorship.",
+    "PhD in Machine Learning or equivalent experience. Publications at top venues.",
+    "Strong communication skills and experience building large-scale data pipelines.",
+]
+CATEGORIES = ["R&D", "Product", "Data", "Infrastructure", "Security"]
+
+
+def tiktok_job(index, rng):
+    city = TIKTOK_CITIES[rng.integers(len(TIKTOK_CITIES))]
+    return {
+        "id": str(7_000_000_000_000_000_000 + index),
+        "code": f"A{index:08d}",
+        "title": TITLES[rng.integers(len(TITLES))],
+        "requirement": REQUIREMENTS[rng.integers(len(REQUIREMENTS))],
+        "description": "Build systems that serve billions of users.",
+        "city_info": {"code": f"CT_{city[:3].upper()}", "en_name": city, "name": city},
+        "recruit_type": {"id": "101", "en_name": "Regular", "name": "Regular"},
+        "job_category": {"id": "6704215862603155720", "en_name": CATEGORIES[rng.integers(len(CATEGORIES))]},
+    }
+
+
+def meta_job(index, rng):
+    count = int(rng.integers(1, 4))
+    locations = [META_LOCATIONS[i] for i in rng.choice(len(META_LOCATIONS), size=count, replace=False)]
+    return {
+        "id": str(1_000_000_000_000_000 + index),
+        "title": TITLES[rng.integers(len(TITLES))],
+        "locations": locations,
+        "teams": [CATEGORIES[rng.integers(len(CATEGORIES))]],
+        "sub_teams": [],
+    }
+
+
+def tiktok_jobs(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [tiktok_job(index, rng) for index in range(count)]
+
+
+def meta_jobs(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [meta_job(index, rng) for index in range(count)]
+
+
+def tiktok_raw_df(count, seed=0, applied_fraction=0.05):
+    """
+    jobs_df as scrape_and_save_jobs built it before the Job schema: one raw payload per row.
+    """
+    df = pd.DataFrame(tiktok_jobs(count, seed))
+    df["applied"] = np.random.default_rng(seed + 1).random(count) < applied_fraction
+    return df
+
+
+def meta_raw_df(count, seed=0, applied_fraction=0.05, described_fraction=0.5):
+    """
+    Meta jobs_df before the Job schema, with some descriptions hydrated.
+    """
+    rng = np.random.default_rng(seed + 1)
+    df = pd.DataFrame(meta_jobs(count, seed))
+    df["applied"] = rng.random(count) < applied_fraction
+    has_description = rng.random(count) < described_fraction
+    df["description"] = np.where(has_description, np.array(REQUIREMENTS)[rng.integers(len(REQUIREMENTS), size=count)], "")
+    return df
+
+
+def tiktok_jobs_df(count, seed=0, applied_fraction=0.05):
+    """
+    jobs_df as TikTokCareersScrapper.scrape_and_save_jobs builds it.
+    """
+    raw = tiktok_raw_df(count, seed, applied_fraction)
+    jobs = [Job.from_tiktok(payload) for payload in tiktok_jobs(count, seed)]
+    for job, applied in zip(jobs, raw["applied"]):
+        job.applied = bool(applied)
+    return jobs_frame(jobs)
+
+
+def meta_jobs_df(count, seed=0, applied_fraction=0.05, described_fraction=0.5):
+    """
+    jobs_df as MetaCareersScraper.scrape_and_save_jobs builds it, with some descriptions hydrated.
+    """
+    raw = meta_raw_df(count, seed, applied_fraction, described_fraction)
+    jobs = [Job.from_meta(payload) for payload in meta_jobs(count, seed)]
+    for job, applied, description in zip(jobs, raw["applied"], raw["description"]):
+        job.applied = bool(applied)
+        job.description = description
+    return jobs_frame(jobs)
+
+
+def meta_job_details(job_id):
+    """
+    Qualification fields as embedded in a Meta job detail page.
+    """
+    return {
+        "minimum_qualifications": [{"item": f"Bachelor's degree ({job_id})"}, {"item": "3+ years of experience"}],
+        "preferred_qualifications": [{"item": "Experience with PyTorch"}],
+        "responsibilities": [{"item": "Design and build large-scale systems"}],
+    }
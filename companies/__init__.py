@@ -1,4 +1,9 @@
-from .base import BaseCareersScraper
-
 __all__ = ['BaseCareersScraper']
 
+
+def __getattr__(name):
+    # Imported on first use, so importing a light submodule (e.g. the registry) does not load pandas
+    if name == 'BaseCareersScraper':
+        from .base import BaseCareersScraper
+        return BaseCareersScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,224 @@
+import time
+import asyncio
+from abc import abstractmethod
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from .base import BaseCareersScraper
+from .browser import AsyncBrowserManager
+
+
+class AsyncBaseCareersScraper(BaseCareersScraper):
+    """
+    Base class for scrapers built on the async Playwright API.
+
+    Subclasses implement the a-prefixed coroutines (ascrape_careers_page,
+    ascrape_applied_page, ...). Awaiting them lets pagination, status checks,
+    description fetches and several companies interleave on one event loop.
+
+    The sync methods of BaseCareersScraper are kept as thin wrappers that run the
+    coroutine on a fresh event loop, so existing callers work unchanged. Each
+    wrapper call launches its own browser; async callers share one launch per
+    scraper until aclose().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.async_browser_manager = AsyncBrowserManager(self.browser_profile, metrics=self.metrics)
+
+    def _run(self, coroutine):
+        """
+        Run a coroutine to completion and shut down the async browser it launched.
+        """
+        async def run():
+            try:
+                return await coroutine
+            finally:
+                await self.aclose()
+        return asyncio.run(run())
+
+    async def aclose(self):
+        """
+        Shut down the async browser, if one was launched.
+        """
+        await self.async_browser_manager.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+        self.close()
+
+    def scrape_careers_page(self, max_jobs=None):
+        return self._run(self.ascrape_careers_page(max_jobs=max_jobs))
+
+    def scrape_applied_page(self):
+        return self._run(self.ascrape_applied_page())
+
+    def update_applications(self, *args, **kwargs):
+        return self._run(self.aupdate_applications(*args, **kwargs))
+
+    def hydrate_descriptions(self, *args, **kwargs):
+        return self._run(self.ahydrate_descriptions(*args, **kwargs))
+
+    def scrape_and_save_jobs(self, max_jobs=None, incremental=None):
+        return self._run(self.ascrape_and_save_jobs(max_jobs=max_jobs, incremental=incremental))
+
+    async def _map_in_threads(self, func, items, concurrency, desc=None):
+        """
+        Run a blocking func over items in worker threads, at most concurrency at a time.
+
+        Used for the requests-based fetch paths so they interleave with browser work
+        on the event loop.
+
+        Args:
+            func: Callable taking one item
+            items: Items to process
+            concurrency: Maximum number of calls in flight
+            desc: Optional progress bar description
+
+        Returns:
+            List of results in the same order as items
+        """
+        from tqdm import tqdm
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+        progress = tqdm(total=len(items), desc=desc) if desc else None
+
+        async def run(item):
+            async with semaphore:
+                result = await asyncio.to_thread(func, item)
+            if progress is not None:
+                progress.update(1)
+            return result
+
+        try:
+            return await asyncio.gather(*(run(item) for item in items))
+        finally:
+            if progress is not None:
+                progress.close()
+
+    async def _await_response(self, page, predicate, action=None, phase="navigation", budget=0, timeout=None):
+        """
+        _wait_for_response for async pages. action, if given, is a coroutine function.
+        """
+        start = time.monotonic()
+        try:
+            async with page.expect_response(predicate, timeout=timeout or self.wait_timeout) as response_info:
+                if action is not None:
+                    await action()
+            response = await response_info.value
+            self._count_response(response)
+            return response
+        except PlaywrightTimeoutError:
+            print(f"Timed out waiting for response during {phase}")
+            return None
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    async def _await_locator(self, locator, state="visible", phase="navigation", budget=0, timeout=None):
+        """
+        _wait_for_locator for async locators.
+        """
+        start = time.monotonic()
+        try:
+            await locator.wait_for(state=state, timeout=timeout or self.wait_timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    async def _await_load(self, page, state="networkidle", action=None, phase="navigation", budget=0, timeout=None):
+        """
+        _wait_for_load for async pages. action, if given, is a coroutine function.
+        """
+        start = time.monotonic()
+        timeout = timeout or self.wait_timeout
+        try:
+            if action is not None:
+                async with page.expect_navigation(wait_until=state, timeout=timeout):
+                    await action()
+            else:
+                await page.wait_for_load_state(state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    async def _alogin(self, page):
+        """
+        Perform an interactive login on the given async page.
+
+        Subclasses that scrape authenticated pages must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support login")
+
+    async def _ais_logged_in(self, page):
+        """
+        Check whether the async page's context holds a valid authenticated session.
+
+        Subclasses that scrape authenticated pages must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support login")
+
+    async def _aauthenticated_context(self):
+        """
+        _authenticated_context for the async browser.
+
+        Returns:
+            Tuple of (context, page) with the page left on the post-login view.
+            The caller closes the context.
+        """
+        with self.metrics.phase("login"):
+            storage_state = self.session_cache.load()
+            if storage_state is not None:
+                context = await self.async_browser_manager.new_context(storage_state=storage_state)
+                page = await context.new_page()
+                if await self._ais_logged_in(page):
+                    return context, page
+                print("Cached session expired, logging in again...")
+                await context.close()
+                self.session_cache.invalidate()
+
+            context = await self.async_browser_manager.new_context()
+            page = await context.new_page()
+            await self._alogin(page)
+            if await self._ais_logged_in(page):
+                self.session_cache.save(await context.storage_state())
+            return context, page
+
+    @abstractmethod
+    async def ascrape_careers_page(self, max_jobs=None):
+        """
+        Async scrape_careers_page.
+        """
+        pass
+
+    @abstractmethod
+    async def ascrape_applied_page(self):
+        """
+        Async scrape_applied_page.
+        """
+        pass
+
+    @abstractmethod
+    async def aupdate_applications(self):
+        """
+        Async update_applications.
+        """
+        pass
+
+    async def ahydrate_descriptions(self, concurrency=None):
+        """
+        Async hydrate_descriptions. Companies whose listing carries the full description need not override this.
+        """
+        return 0
+
+    @abstractmethod
+    async def ascrape_and_save_jobs(self, max_jobs=None, incremental=None):
+        """
+        Async scrape_and_save_jobs.
+        """
+        pass
@@ -0,0 +1,287 @@
+import asyncio
+
+from companies.async_base import AsyncBaseCareersScraper
+from companies.extract import extract_keys_from_scripts, page_json_scripts_async
+from companies.meta import APPLY_NOW_SELECTOR, DESCRIPTION_KEYS, VIEW_APPLICATION_SELECTOR, MetaCareersScraper
+
+
+class AsyncMetaCareersScraper(AsyncBaseCareersScraper, MetaCareersScraper):
+    """
+    MetaCareersScraper on the async Playwright API.
+
+    Application statuses are checked by concurrent pages in one logged-in
+    context instead of one browser per worker thread, and description fetches
+    share the event loop with them.
+    """
+
+    def find_application_status(self, concurrency=None):
+        return self._run(self.afind_application_status(concurrency=concurrency))
+
+    async def ascrape_careers_page(self, max_jobs=None):
+        """
+        Async scrape_careers_page.
+        """
+        try:
+            jobs_found = []
+            template = None
+            self.last_crawl_complete = False
+            known_ids = self._known_ids() if self.incremental else None
+            async with self.async_browser_manager.page() as page:
+                # Finish as soon as the search results arrive instead of waiting for network idle
+                with self.metrics.phase("navigation"):
+                    response = await self._await_response(
+                        page,
+                        self._is_job_search_response,
+                        action=lambda: page.goto(self.primary_url, wait_until="domcontentloaded"),
+                        phase="navigation",
+                        budget=2000,
+                    )
+                self.metrics.increment("pages_fetched")
+                if response is not None:
+                    try:
+                        with self.metrics.phase("parse"):
+                            response_data = await response.json()
+                        jobs_found = self._jobs_from_search_response(response_data)
+                    except Exception:
+                        pass
+                    template = self._search_template(response.request, await page.context.cookies())
+                self.waits.report()
+
+            # Page through every shard of the search instead of keeping only the first response.
+            # The first response alone is capped, so only a paged crawl that reaches the end
+            # of the listing may mark the crawl complete.
+            if template is not None:
+                session = self._build_session(pool_size=self.search_concurrency)
+                shards = self._search_shards()
+                try:
+                    with self.metrics.phase("pagination"):
+                        results = await self._map_in_threads(
+                            lambda shard: self._crawl_search_shard(template, session, shard, max_jobs=max_jobs, known_ids=known_ids),
+                            shards,
+                            self.search_concurrency,
+                        )
+                finally:
+                    session.close()
+                jobs_found, self.last_crawl_complete = self._merge_search_shards(jobs_found, results, shards)
+            return self._limit_jobs(jobs_found, max_jobs)
+
+        except Exception as e:
+            print(f"Error scraping careers url: {self.primary_url}")
+            print(f"Error details: {str(e)}")
+            return None
+
+    async def _alogin(self, page):
+        try:
+            await page.goto(self.applications_url, wait_until="domcontentloaded")
+
+            email_input = page.locator('input').first
+            await self._await_locator(email_input, phase="login", budget=2000)
+            await email_input.fill(self.login_email)
+
+            login_with_password = page.get_by_text("Log in with your password").first
+            await login_with_password.click()
+            await self._await_locator(page.locator('input[type="password"]').first, phase="login", budget=1000)
+
+            password_input = page.locator('input').first
+            await password_input.fill(self.login_password)
+
+            # Wait for the post-login navigation to fully load
+            login_button = page.get_by_role("button", name="Log in").first
+            await self._await_load(page, "networkidle", action=login_button.click, phase="login", budget=12000)
+        except Exception as e:
+            print(f"Error logging in: {str(e)}")
+            return None
+
+    async def _ais_logged_in(self, page):
+        try:
+            if "login" in page.url or page.url == "about:blank":
+                await page.goto(self.applications_url, wait_until="networkidle")
+            # A valid session redirects away from the login form
+            return (
+                await page.get_by_text("Log in with your password").count() == 0
+                and await page.locator('input[type="password"]').count() == 0
+            )
+        except Exception as e:
+            print(f"Error checking login state: {str(e)}")
+            return False
+
+    async def ascrape_applied_page(self):
+        """
+        Async scrape_applied_page.
+        """
+        try:
+            context, page = await self._aauthenticated_context()
+            async with context:
+                try:
+                    return self._applications_from_scripts(await page_json_scripts_async(page))
+                except Exception as e:
+                    print(f"Error extracting application data from page: {str(e)}")
+                    return None
+
+        except Exception as e:
+            print(f"Error scraping applied page: {self.applications_url}")
+            print(f"Error details: {str(e)}")
+            return None
+
+    async def afind_description_in_page(self, page):
+        try:
+            found = extract_keys_from_scripts(await page_json_scripts_async(page), DESCRIPTION_KEYS)
+        except Exception as e:
+            print(f"Error extracting description: {str(e)}")
+            return None
+        return self._description_from_keys(found) if found else None
+
+    async def afind_application_status(self, concurrency=None):
+        """
+        Async find_application_status.
+
+        Every worker is a page in the same logged-in context, so the login and the
+        browser launch are paid once however many workers run. Failed checks are
+        retried in later rounds on the same context.
+
+        Args:
+            concurrency: Number of concurrent pages. Defaults to self.status_concurrency.
+
+        Returns:
+            Dict mapping each job id that could not be checked to its last error; empty when
+            every job was checked. If the pass aborts, every unchecked job maps to the abort error.
+        """
+        from tqdm import tqdm
+        concurrency = concurrency or self.status_concurrency
+        checkpoint, results, pending = self._plan_status_check()
+        tasks_to_check = list(pending)
+
+        if not pending:
+            if results:
+                self._finish_status_check(results)
+            else:
+                print("No application statuses to check")
+            return {}
+
+        try:
+            retry_queue = self._retry_queue()
+            context, page = await self._aauthenticated_context()
+            async with context:
+                await page.close()
+                with tqdm(total=len(pending), desc="Checking application statuses") as progress, self.metrics.phase("status"):
+                    while pending:
+                        tasks = asyncio.Queue()
+                        for task in pending:
+                            tasks.put_nowait(task)
+                        await asyncio.gather(*(
+                            self._application_status_worker_async(context, tasks, results, progress, checkpoint, retry_queue)
+                            for _ in range(min(concurrency, len(pending)))
+                        ))
+                        # Failed jobs are retried once every other job has been checked
+                        wait = retry_queue.due_in()
+                        if wait is None:
+                            break
+                        await asyncio.sleep(wait)
+                        pending = retry_queue.take_due()
+                        self.metrics.increment("retries", retry_queue.last_retries)
+
+            failed = self._report_failed("status", retry_queue)
+            self._finish_status_check(results)
+            return failed
+        except Exception as e:
+            print(f"Error finding application status: {str(e)}")
+            return {job_id: f"{type(e).__name__}: {str(e)}" for job_id, _ in tasks_to_check if job_id not in results}
+
+    async def _application_status_worker_async(self, context, tasks, results, progress, checkpoint, retry_queue):
+        """
+        Drain the task queue using one page of the shared context.
+        """
+        try:
+            page = await context.new_page()
+            try:
+                while True:
+                    try:
+                        task = tasks.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    job_id, needs_description = task
+                    if not retry_queue.allow(job_id, task):
+                        self._status_task_deferred(job_id, retry_queue, progress)
+                        continue
+                    try:
+                        applied = await self._afind_application_status(job_id, page)
+                    except Exception as e:
+                        self.metrics.increment("failures")
+                        retry_queue.failed_attempt(job_id, task, e)
+                        self._status_task_deferred(job_id, retry_queue, progress)
+                        continue
+                    retry_queue.succeeded(job_id)
+                    description = await self.afind_description_in_page(page) if needs_description else None
+                    results[job_id] = (applied, description)
+                    checkpoint.step(entry={job_id: results[job_id]})
+                    progress.update(1)
+            finally:
+                await page.close()
+        except Exception as e:
+            print(f"Error in application status worker: {str(e)}")
+
+    async def _afind_application_status(self, id, page):
+        """
+        Async _find_application_status. Raises when the status is unknown.
+        """
+        await page.goto(self._job_details_url(id), wait_until="domcontentloaded")
+        self.metrics.increment("pages_fetched")
+        # Either button settles the status, so stop waiting as soon as one renders
+        await self._await_locator(
+            page.locator(f"{VIEW_APPLICATION_SELECTOR}, {APPLY_NOW_SELECTOR}").first,
+            phase="job details",
+            budget=2000,
+        )
+
+        if await page.locator(VIEW_APPLICATION_SELECTOR).first.count() > 0:
+            return True
+        if await page.locator(APPLY_NOW_SELECTOR).first.count() > 0:
+            return False
+        raise RuntimeError(f"No application button rendered for job {id}")
+
+    async def ahydrate_descriptions(self, concurrency=None, ids=None):
+        """
+        Async hydrate_descriptions. The pooled HTTP fetches run in worker threads.
+        """
+        concurrency = concurrency or self.description_concurrency
+        ids, descriptions, to_fetch = self._plan_hydration(ids)
+        if not ids:
+            return 0
+
+        successes, failures = {}, {}
+        if to_fetch:
+            # Reuse the logged-in cookies when a session is cached
+            session = self._build_session(pool_size=concurrency, storage_state=self.session_cache.load())
+            try:
+                with self.metrics.phase("hydrate"):
+                    outcomes = await self._map_in_threads(
+                        lambda job_id: self._fetch_job_details_outcome(job_id, session),
+                        to_fetch,
+                        concurrency,
+                        desc="Hydrating descriptions",
+                    )
+            finally:
+                session.close()
+            for job_id, details, error in outcomes:
+                if details:
+                    successes[job_id] = details
+                else:
+                    failures[job_id] = error
+
+        return self._finish_hydration(ids, descriptions, successes, failures)
+
+    async def aupdate_applications(self, find_status=True, concurrency=None):
+        """
+        Async update_applications.
+        """
+        if find_status:
+            await self.afind_application_status(concurrency=concurrency)
+        self.print_application_details()
+
+    async def ascrape_and_save_jobs(self, max_jobs=None, incremental=None):
+        """
+        Async scrape_and_save_jobs.
+        """
+        if incremental is not None:
+            self.incremental = incremental
+        return self._save_scraped_jobs(await self.ascrape_careers_page(max_jobs=max_jobs))
@@ -0,0 +1,341 @@
+import asyncio
+
+from .async_base import AsyncBaseCareersScraper
+from .http import RequestTemplate
+from .tiktok import LOCATION_OPTIONS_SELECTOR, TikTokCareersScrapper
+
+
+class AsyncTikTokCareersScrapper(AsyncBaseCareersScraper, TikTokCareersScrapper):
+    """
+    TikTokCareersScrapper on the async Playwright API.
+
+    Posts pages fetched over HTTP run in worker threads, so a crawl interleaves
+    with other scrapers on the same event loop.
+    """
+
+    async def _alogin(self, page):
+        try:
+            await page.goto(self.applications_url, wait_until="domcontentloaded")
+
+            sign_in_with_email = page.get_by_text("Sign in with Email").first
+            await self._await_locator(sign_in_with_email, phase="login", budget=2000)
+            await sign_in_with_email.click()
+
+            email_input = page.locator('input[placeholder="Email"]').first
+            await self._await_locator(email_input, phase="login", budget=5000)
+            await email_input.fill(self.login_email)
+            password_input = page.locator('input[placeholder="Password"]').first
+            await password_input.fill(self.login_password)
+
+            agree_terms_checkbox = page.locator('input[type="checkbox"]').first
+            await agree_terms_checkbox.check()
+
+            submit_button = page.get_by_role("button", name="Sign in").first
+            await self._await_response(
+                page,
+                lambda response: "applications" in response.url,
+                action=submit_button.click,
+                phase="login",
+                budget=10000,
+            )
+        except Exception as e:
+            print(f"Error logging in: {str(e)}")
+            return None
+
+    async def _ais_logged_in(self, page):
+        try:
+            if not page.url.startswith(self.applications_url):
+                await page.goto(self.applications_url, wait_until="networkidle")
+            return await page.get_by_text("Sign in with Email").count() == 0
+        except Exception as e:
+            print(f"Error checking login state: {str(e)}")
+            return False
+
+    async def ascrape_applied_page(self):
+        """
+        Async scrape_applied_page.
+        """
+        try:
+            context, page = await self._aauthenticated_context()
+            async with context:
+                # Reload the applications page and read the list from its response
+                response = await self._await_response(
+                    page,
+                    lambda response: "applications" in response.url and response.status == 200,
+                    action=lambda: page.goto(self.applications_url, wait_until="domcontentloaded"),
+                    phase="applied page",
+                    budget=2000,
+                )
+                self.metrics.increment("pages_fetched")
+                self.waits.report()
+                if response is None:
+                    return None
+                try:
+                    response_data = await response.json()
+                    return response_data.get("data", {}).get("delivery_list", [])
+                except Exception:
+                    return None
+
+        except Exception as e:
+            print(f"Error scraping applied page: {self.applications_url}")
+            print(f"Error details: {str(e)}")
+            return None
+
+    async def _aselect_locations(self, page):
+        """
+        Async _select_locations.
+        """
+        print("Clicking on Location filter...")
+        await self.retry_policy.acall(lambda: self._aopen_location_filter(page), on_retry=self._retry_logger("location filter"))
+
+        print(f"Selecting {len(self.locations)} locations...")
+        failed = {}
+        filtered, last_clicked = None, None
+        for location_name in self.locations:
+            try:
+                clicked, response = await self.retry_policy.acall(
+                    lambda: self._aselect_location(page, location_name),
+                    on_retry=self._retry_logger(f"location {location_name}"),
+                )
+            except Exception as e:
+                print(f"  ✗ Failed to select {location_name}: {str(e)}")
+                failed[location_name] = f"{type(e).__name__}: {str(e)}"
+                continue
+            if clicked:
+                filtered, last_clicked = response, location_name
+
+        # Without the response to the last click, the posts template and count may predate it
+        if last_clicked is not None and filtered is None:
+            failed[last_clicked] = "RuntimeError: No posts response after selecting it"
+        if failed:
+            self.metrics.record_failed("location filter", failed)
+        print("Location selection complete!")
+        return failed, filtered
+
+    async def _aopen_location_filter(self, page):
+        location_header = page.get_by_text("Location", exact=True).first
+        await self._await_locator(location_header, phase="location filter")
+        await location_header.click()
+
+        print("Waiting for location options to load...")
+        if not await self._await_locator(page.locator(LOCATION_OPTIONS_SELECTOR).first, phase="location filter", budget=1000, timeout=5000):
+            raise RuntimeError("Location options did not load")
+
+    async def _aselect_location(self, page, location_name):
+        location_label = page.locator(self._location_label_selector(location_name)).first
+        if await location_label.locator('input[type="checkbox"]').is_checked():
+            print(f"  ⊙ Already selected: {location_name}")
+            return False, None
+        response = await self._await_response(page, self._is_posts_response, action=location_label.click, phase="location filter")
+        if not await self._await_locator(
+            location_label.locator('input[type="checkbox"]:checked'),
+            state="attached",
+            phase="location filter",
+            budget=300,
+        ):
+            raise RuntimeError(f"{location_name} did not become checked")
+        print(f"  ✓ Selected: {location_name}")
+        return True, response
+
+    async def ascrape_careers_page(self, max_jobs=None):
+        """
+        Async scrape_careers_page.
+        """
+        try:
+            async with self.async_browser_manager.page() as page:
+                total_jobs = 0
+                jobs_found = {}
+                posts_template = None
+                self.last_crawl_complete = False
+                known_ids = self._known_ids() if self.incremental else None
+
+                def capture_posts_request(request):
+                    if "posts" in request.url and request.method == "POST":
+                        nonlocal posts_template
+                        posts_template = request
+
+                async def handle_count_from_response(response):
+                    if self._is_posts_response(response):
+                        try:
+                            response_data = await response.json()
+                            nonlocal total_jobs
+                            total_jobs = response_data.get("data", {}).get("count", 0)
+                        except Exception:
+                            pass
+
+                page.on("request", capture_posts_request)
+                page.on("response", handle_count_from_response)
+                # The first posts response carries the total count
+                with self.metrics.phase("navigation"):
+                    await self._await_response(
+                        page,
+                        self._is_posts_response,
+                        action=lambda: page.goto(self.primary_url, wait_until="domcontentloaded"),
+                        phase="navigation",
+                        budget=2000,
+                    )
+                self.metrics.increment("pages_fetched")
+                failed_locations, filtered = await self._aselect_locations(page)
+                if filtered is not None:
+                    # Take the template and count from the response to the final filter
+                    # click, not from whichever posts request happened to come last
+                    page.remove_listener("request", capture_posts_request)
+                    page.remove_listener("response", handle_count_from_response)
+                    posts_template = filtered.request
+                    try:
+                        total_jobs = (await filtered.json()).get("data", {}).get("count", 0)
+                    except Exception:
+                        total_jobs = 0
+
+                # The last posts request carries the selected location filters, so
+                # replay it directly instead of clicking through every page
+                if self.use_api and posts_template is not None:
+                    template = RequestTemplate.from_request(posts_template, await page.context.cookies())
+                    await page.context.close()
+                    self.waits.report()
+                    jobs_found = await self._afetch_posts_via_api(template, total_jobs, max_jobs=max_jobs, known_ids=known_ids)
+                    # A search that missed some locations can't tell which jobs closed
+                    self.last_crawl_complete = self.last_crawl_complete and not failed_locations
+                    return jobs_found
+
+                # Click through the pages, reading each page's jobs from the response it triggers
+                total_pages = int((total_jobs / 12)) + 1
+                known_streak = 0
+                complete = not failed_locations
+                failed_pages = {}
+                for index in range(1, total_pages + 1):
+                    print(f"Fetching jobs with offset {index}...")
+                    if max_jobs is not None and len(jobs_found) >= max_jobs:
+                        print("Reached maximum job limit.")
+                        complete = False
+                        break
+                    button_element = page.get_by_role("button", name=str(index)).first
+
+                    async def click_page():
+                        response = await self._await_response(
+                            page,
+                            self._is_posts_response,
+                            action=button_element.click,
+                            phase="pagination",
+                            budget=5000,
+                            timeout=5000,
+                        )
+                        if response is None:
+                            raise RuntimeError(f"Page {index} did not load")
+                        return response
+
+                    jobs = []
+                    try:
+                        with self.metrics.phase("pagination"):
+                            response = await self.retry_policy.acall(click_page, on_retry=self._retry_logger(f"page {index}"))
+                        response_data = await response.json()
+                        jobs = response_data.get("data", {}).get("job_post_list", [])
+                    except Exception as e:
+                        print(f"  ✗ Failed to load page {index}: {str(e)}")
+                        failed_pages[index] = f"{type(e).__name__}: {str(e)}"
+                        complete = False
+                    self.metrics.increment("pages_fetched")
+                    known_streak = self._collect_posts(jobs, jobs_found, max_jobs, known_ids, known_streak)
+                    if known_ids is not None and known_streak >= self.stop_after_known_pages:
+                        print(f"Stopping after {known_streak} pages of known jobs.")
+                        complete = False
+                        break
+                if failed_pages:
+                    self.metrics.record_failed("pagination", failed_pages)
+                # The final page button sits past the count, so its page is short or empty
+                self.last_crawl_complete = complete and self._listing_complete(total_jobs, 12, len(jobs))
+                self.waits.report()
+
+                return jobs_found
+
+        except Exception as e:
+            print(f"Error scraping careers url: {self.primary_url}")
+            print(f"Error details: {str(e)}")
+            return None
+
+    async def _afetch_posts_via_api(self, template, total_jobs, max_jobs=None, known_ids=None):
+        """
+        Async _fetch_posts_via_api. Each wave of pages runs in worker threads, and
+        progress is checkpointed the same way.
+        """
+        page_size = int(template.body.get("limit") or 12)
+        total_jobs = total_jobs if isinstance(total_jobs, int) else 0
+        complete = max_jobs is None or max_jobs >= total_jobs
+        if max_jobs is not None:
+            total_jobs = min(total_jobs, max_jobs)
+        # A full crawl also fetches the page at the count when it falls on a page
+        # boundary, so the final page is short or empty if the count was right
+        offsets = list(range(0, total_jobs + (1 if complete else 0), page_size))
+        final_offset = offsets[-1] if offsets else None
+
+        checkpoint = self._crawl_checkpoint()
+        jobs_found, known_streak, fetched = self._resume_posts(checkpoint, max_jobs, known_ids)
+        if fetched:
+            offsets = [offset for offset in offsets if offset not in fetched]
+            print(f"Skipping {len(fetched)} pages fetched before the checkpoint")
+        print(f"Fetching {len(offsets)} pages directly with concurrency {self.concurrency}...")
+
+        session = self._build_session(pool_size=self.concurrency)
+        retry_queue = self._retry_queue()
+
+        def fetch_page(offset):
+            return self._fetch_posts_page(template, session, offset, page_size, retry_queue)
+
+        def collect(wave, pages):
+            nonlocal known_streak
+            for offset, jobs in zip(wave, pages):
+                if jobs is None:
+                    continue
+                known_streak = self._collect_posts(jobs, jobs_found, max_jobs, known_ids, known_streak)
+                fetched[offset] = len(jobs)
+                checkpoint.step(entry={"offset": offset, "jobs": jobs})
+
+        # A full crawl submits every page at once, or one checkpoint interval at a
+        # time when checkpointing; a delta crawl goes wave by wave
+        if known_ids is not None:
+            wave_size = self.concurrency
+        elif checkpoint.enabled:
+            wave_size = max(self.checkpoint_every, self.concurrency)
+        else:
+            wave_size = len(offsets)
+        try:
+            with self.metrics.phase("pagination"):
+                for wave_start in range(0, len(offsets), max(wave_size, 1)):
+                    wave = offsets[wave_start:wave_start + wave_size]
+                    # Results come back in offset order so max_jobs trims the tail
+                    collect(wave, await self._map_in_threads(fetch_page, wave, self.concurrency))
+                    if known_ids is not None and known_streak >= self.stop_after_known_pages:
+                        print(f"\nStopping after {known_streak} pages of known jobs.")
+                        complete = False
+                        break
+                else:
+                    # Failed pages are retried once every other page is in
+                    wait = retry_queue.due_in()
+                    while wait is not None:
+                        await asyncio.sleep(wait)
+                        wave = retry_queue.take_due()
+                        self.metrics.increment("retries", retry_queue.last_retries)
+                        collect(wave, await self._map_in_threads(fetch_page, wave, self.concurrency))
+                        wait = retry_queue.due_in()
+        finally:
+            session.close()
+
+        print()
+        if self._report_failed("pagination", retry_queue):
+            complete = False
+        self.last_crawl_complete = complete and self._listing_complete(total_jobs, page_size, fetched.get(final_offset))
+        return jobs_found
+
+    async def aupdate_applications(self):
+        """
+        Async update_applications.
+        """
+        self._apply_applications(await self.ascrape_applied_page())
+
+    async def ascrape_and_save_jobs(self, max_jobs=None, incremental=None):
+        """
+        Async scrape_and_save_jobs.
+        """
+        if incremental is not None:
+            self.incremental = incremental
+        return self._save_scraped_jobs(await self.ascrape_careers_page(max_jobs=max_jobs))
@@ -1,6 +1,20 @@
 import os
+import re
+import time
+import hashlib
 from abc import ABC, abstractmethod
-import pandas as pd
+
+from .browser import BrowserManager, BrowserProfile
+from .checkpoint import Checkpoint
+from .filters import FilterCache, FilterEngine
+from .jobs import JOB_DTYPES, apply_schema, is_lean, jobs_frame, legacy_jobs, location_names
+from .metrics import CrawlMetrics
+from .ratelimit import shared_rate_controller
+from .retry import CircuitBreaker, RetryPolicy, RetryQueue
+from .search import fingerprints as search_fingerprints, open_search_index
+from .session import SessionCache
+from .storage import open_job_store, open_raw_store
+from .waits import WaitTracker
 
 
 class BaseCareersScraper(ABC):
@@ -11,7 +25,7 @@ class BaseCareersScraper(ABC):
     scraping logic while inheriting common functionality.
     """
     
-    def __init__(self, company_name: str, base_url: str, file_path: str = None, locations: list = None):
+    def __init__(self, company_name: str, base_url: str, file_path: str = None, locations: list = None, lean: bool = None, storage: str = None):
         """
         Initialize the base scraper.
         
@@ -19,7 +33,11 @@ class BaseCareersScraper(ABC):
             company_name: Name of the company (used for file paths and identification)
             base_url: Base URL of the company's careers page
             file_path: Optional custom file path for CSV storage. If None, uses default format.
+                Other storage backends derive their path from it.
             locations: List of location names to filter by
+            lean: Use the lean headless browser profile. If None, reads CRAWLER_LEAN (default on).
+            storage: Storage backend, one of "sqlite", "parquet" or "csv". If None, reads
+                CRAWLER_STORAGE (default "sqlite").
         """
         self.company_name = company_name
         self.base_url = base_url
@@ -44,12 +62,706 @@ class BaseCareersScraper(ABC):
             "include": [],
             "exclude": []
         }
+        self.description_filters = {
+            "include": [],
+            "exclude": []
+        }
+        
+        # Columns the filters apply to (subclasses override for their data structure)
+        self.qualification_column = "description"
+        self.location_column = "locations"
+        self.location_exact = True
+        self._filter_engine = None
+        self._filter_cache = FilterCache()
+        
+        # Stored jobs, loaded on first access of jobs_df. Only the Job fields are kept in
+        # memory; raw payloads go to the cold raw store (None when CRAWLER_RAW_STORE=0)
+        self.store = open_job_store(storage or os.getenv("CRAWLER_STORAGE", "sqlite"), self.file_path)
+        self.raw_store = open_raw_store(self.file_path)
+        self._jobs_df = None
+        self._jobs_loaded = False
+        # (columns, DataFrame) read by jobs_view() while jobs_df is not loaded yet
+        self._jobs_view = None
+        # Bumped on every save so memoized filter results know when to refresh
+        self.jobs_version = 0
+        # Full-text index over titles, requirements and descriptions, updated as jobs
+        # are saved (None when CRAWLER_SEARCH_INDEX=0). _unindexed holds ids changed
+        # since the last update, or None if the whole index needs rebuilding.
+        # _index_checked holds the columns whose fingerprints were compared this process.
+        self.search_index = open_search_index(self.file_path)
+        self._unindexed = set()
+        self._index_checked = set()
+        self.last_scraped_count = 0
+
+        # Delta crawls stop paginating after this many consecutive pages of known jobs.
+        # Only a crawl that reaches the end of the listing can flag missing jobs as closed.
+        self.incremental = False
+        self.stop_after_known_pages = 2
+        self.last_crawl_complete = False
+
+        # Long crawls and status passes checkpoint their progress every
+        # checkpoint_every pages/jobs (0 disables); resume continues from the last one
+        self.resume = False
+        self.checkpoint_every = int(os.getenv("CRAWLER_CHECKPOINT_EVERY", "10"))
+        self.checkpoint_dir = os.path.join(os.path.dirname(self.file_path), "checkpoints")
+
+        # Login credentials (subclasses set these) and the cached session for them
+        self.login_email = None
+        self.login_password = None
+        self._session_cache = None
+
+        # Browser launch/context settings for every Playwright call site
+        self.browser_profile = BrowserProfile.from_env(lean)
+
+        # Event-driven waits and the time they saved over fixed sleeps
+        self.waits = WaitTracker()
+        self.wait_timeout = 15000
+
+        # Phase timings and counters, written out by write_metrics()
+        self.metrics = CrawlMetrics(company_name)
+        self.metrics_dir = os.getenv("CRAWLER_METRICS_DIR") or os.path.join(os.path.dirname(self.file_path), "metrics")
+
+        # One browser launch shared by every phase; released by close()
+        self.browser_manager = BrowserManager(self.browser_profile, metrics=self.metrics)
+
+        # Per-host rate and concurrency limits shared by every HTTP fetch path in the
+        # process (None when CRAWLER_RATE=0)
+        self.rate_controller = shared_rate_controller()
+
+        # Failed per-job and per-page tasks are retried with exponential backoff at the
+        # end of a pass; ids that still fail are reported instead of guessed
+        self.retry_policy = RetryPolicy()
+
+    @property
+    def jobs_df(self):
+        """
+        Every stored job in the Job schema, loaded on first access (None if nothing is stored).
+        """
+        if not self._jobs_loaded:
+            self.jobs_df = self._load_jobs()
+        return self._jobs_df
+
+    @jobs_df.setter
+    def jobs_df(self, df):
+        self._jobs_df = df
+        self._jobs_loaded = True
+        self._jobs_view = None
+
+    def jobs_view(self, columns):
+        """
+        Read-only jobs frame holding at least the given columns.
+        
+        Until jobs_df is loaded only those columns are read from the store, so
+        read-only commands skip the rest (e.g. descriptions they never show).
+        Anything that changes jobs must go through jobs_df instead.
+        
+        Args:
+            columns: Job schema columns needed; id is always included
+            
+        Returns:
+            DataFrame, or None if nothing is stored
+        """
+        if self._jobs_loaded:
+            return self._jobs_df
+        columns = set(columns) | {"id"}
+        if self._jobs_view is None or not columns.issubset(self._jobs_view[0]):
+            self._jobs_view = (columns, self._load_jobs(columns))
+        return self._jobs_view[1]
+
+    def close(self):
+        """
+        Shut down the shared browser, if one was launched.
+        """
+        self.browser_manager.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def session_cache(self):
+        """
+        Session cache for the current company and login account, created on first use.
+        """
+        if self._session_cache is None:
+            self._session_cache = SessionCache(self.company_name, self.login_email)
+        return self._session_cache
+
+    def _save_jobs(self, ids=None, new=False):
+        """
+        Persist jobs to the storage backend.
+        
+        Args:
+            ids: Optional iterable of job ids that changed. Only those rows are written;
+                if None, every row in self.jobs_df is written.
+            new: Whether the rows are newly scraped jobs (counted as jobs_new, otherwise jobs_updated)
+        """
+        if self.jobs_df is None:
+            return
+        with self.metrics.phase("save"):
+            if ids is None:
+                changed_df = self.jobs_df
+            else:
+                changed_df = self.jobs_df[self.jobs_df['id'].astype(str).isin(set(str(id) for id in ids))]
+            self.store.upsert(changed_df)
+        self.metrics.increment("jobs_new" if new else "jobs_updated", len(changed_df))
+        self._mark_jobs_changed(ids)
+        self._sync_search_index()
+
+    def job_from_payload(self, payload):
+        """
+        Build a Job from one raw job payload as returned by the company's API.
+        
+        Subclasses must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not define a Job mapping")
+
+    def _load_jobs(self, columns=None):
+        """
+        Load the stored jobs in the Job schema, migrating stores saved with raw payload columns.
+        
+        Args:
+            columns: Optional schema columns to load. Defaults to all of them.
+        
+        Returns:
+            DataFrame in the JOB_DTYPES schema, or None if nothing has been stored yet
+        """
+        columns = [column for column in JOB_DTYPES if columns is None or column in columns]
+        df = self.store.load(columns=columns)
+        if df is None:
+            return None
+        if is_lean(df, columns):
+            return apply_schema(df, columns)
+
+        jobs, payloads = legacy_jobs(self.store.load(), self.job_from_payload)
+        print(f"Migrating {len(jobs)} jobs in {self.store.path} to the compact job schema")
+        if self.raw_store is not None:
+            self.raw_store.put_many(payloads)
+        df = jobs_frame(jobs)
+        self.store.upsert(df)
+        return df
+
+    def _new_jobs_frame(self, payloads):
+        """
+        jobs_df rows for newly scraped jobs, keeping their raw payloads in the raw store.
+        
+        Args:
+            payloads: List of raw job payloads
+        """
+        if self.raw_store is not None:
+            self.raw_store.put_many({str(payload['id']): payload for payload in payloads})
+        return jobs_frame(self.job_from_payload(payload) for payload in payloads)
+
+    def raw_payload(self, job_id):
+        """
+        The raw API payload a job was built from, or None if it was not kept.
+        """
+        return self.raw_store.get(job_id) if self.raw_store is not None else None
+
+    def _checkpoint(self, name, key=None):
+        """
+        Checkpoint file for one kind of long-running pass.
+        
+        Args:
+            name: Pass name, used as the file name (e.g. "crawl" or "status")
+            key: Identifies the run; a checkpoint written under another key is not resumed
+        """
+        return Checkpoint(os.path.join(self.checkpoint_dir, f"{name}.json"), key=key, every=self.checkpoint_every)
+
+    def _resume_state(self, checkpoint):
+        """
+        Saved state to continue from when resuming, or None for a fresh start.
+        """
+        if not self.resume or not checkpoint.enabled:
+            return None
+        state = checkpoint.load()
+        if state is not None:
+            print(f"Resuming from checkpoint {checkpoint.path}")
+        return state
+
+    def _known_ids(self):
+        """
+        Ids of every stored job, used to detect pages with nothing new.
+        """
+        if self.jobs_df is None:
+            return set()
+        return set(self.jobs_df['id'].astype(str))
+
+    def _mark_closed_jobs(self, seen_ids):
+        """
+        Flag jobs missing from a complete listing as closed and reopen any that reappeared.
+        
+        Args:
+            seen_ids: Ids of every job in the listing
+        """
+        import pandas as pd
+        seen_ids = set(str(id) for id in seen_ids)
+        if self.jobs_df is None:
+            return
+        # An empty listing is far likelier a broken crawl than every job closing at once
+        if not seen_ids:
+            print("Crawl returned no jobs; not marking any jobs closed")
+            return
+        ids = self.jobs_df['id'].astype(str)
+        closed = ~ids.isin(seen_ids)
+        previous = self.jobs_df['closed'].fillna(False).astype(bool) if 'closed' in self.jobs_df.columns else pd.Series(False, index=self.jobs_df.index)
+        changed = closed != previous
+        self.jobs_df['closed'] = closed
+        if changed.any():
+            self._save_jobs(ids[changed])
+            print(f"Marked {int((closed & changed).sum())} jobs closed, {int((~closed & changed).sum())} reopened")
+
+    def _mark_jobs_changed(self, ids=None):
+        """
+        Record that jobs changed so memoized filter results are refreshed for them.
+        
+        Args:
+            ids: Iterable of changed job ids, or None if any row may have changed
+        """
+        self.jobs_version += 1
+        self._filter_cache.invalidate(ids)
+        if ids is None or self._unindexed is None:
+            self._unindexed = None
+        else:
+            self._unindexed.update(str(id) for id in ids)
+
+    def _sync_search_index(self, columns=None):
+        """
+        Bring the search index up to date with self.jobs_df.
+        
+        Only jobs marked changed are re-indexed. The first sync of each column in
+        a process also compares the index's content fingerprint with the jobs, and
+        rebuilds the index when they differ (e.g. on first use, or after jobs were
+        edited by another process). The index is also rebuilt when every row may
+        have changed.
+        
+        Args:
+            columns: Columns the caller will query the index on. Before jobs_df is
+                loaded, only those columns are read to check the index is current.
+                Defaults to every indexed column.
+        
+        Returns:
+            The SearchIndex, or None if indexing is disabled
+        """
+        if self.search_index is None:
+            return None
+        unchecked = [
+            column for column in self.search_index.columns
+            if (columns is None or column in columns) and column not in self._index_checked
+        ]
+        if not self._jobs_loaded and self._unindexed == set():
+            # Nothing changed since the store was read, so the index is current if it
+            # was built from the same content; only ids and text lengths are compared
+            if not unchecked:
+                return self.search_index
+            df = self.jobs_view(["id", *unchecked])
+            if df is None:
+                return self.search_index
+            if self._index_matches(df, unchecked):
+                self._index_checked.update(unchecked)
+                return self.search_index
+        if self.jobs_df is None:
+            return self.search_index
+        with self.metrics.phase("index"):
+            if self._unindexed:
+                self.search_index.update(self.jobs_df[self.jobs_df['id'].astype(str).isin(self._unindexed)])
+            if self._unindexed is None or not self._index_matches(self.jobs_df, unchecked):
+                self.search_index.rebuild(self.jobs_df)
+                unchecked = self.search_index.columns
+        self._index_checked.update(unchecked)
+        self._unindexed = set()
+        return self.search_index
+
+    def _index_matches(self, df, columns):
+        """
+        Whether the search index's fingerprints for the given columns match df.
+        """
+        if not columns:
+            return True
+        stored = self.search_index.fingerprints()
+        return all(stored.get(column) == value for column, value in search_fingerprints(df, columns).items())
+
+    def _filter_rules(self):
+        return [
+            ("title", self.name_filters),
+            (self.qualification_column, self.qualification_filters),
+            ("description", self.description_filters),
+        ]
+
+    def _filter_config_key(self):
+        """
+        Hash of every setting that affects filter results.
+        """
+        config = (self._filter_rules(), self.location_column, list(self.locations), self.location_exact)
+        return hashlib.sha256(repr(config).encode()).hexdigest()
+
+    def _compiled_filters(self):
+        """
+        FilterEngine for the current filter settings, recompiled only when they change.
+        """
+        rules = self._filter_rules()
+        key = repr(rules)
+        if self._filter_engine is None or self._filter_engine[0] != key:
+            self._filter_engine = (key, FilterEngine(rules))
+        return self._filter_engine[1]
+
+    def _evaluate_filters(self, df):
+        """
+        Text and location filter results for the rows of df.
+        """
+        mask = self._compiled_filters().mask(df, self._sync_search_index(df.columns))
+        return mask & self._location_mask(df, self.location_column, self.locations, exact=self.location_exact)
+
+    def filter_jobs(self):
+        """
+        Jobs not yet applied to that pass the title, qualification, description and location filters.
+        
+        Filter results are memoized per job and only recomputed for jobs saved since
+        the last call or when the filter settings change.
         
-        # Load existing jobs dataframe
-        if os.path.exists(self.file_path):
-            self.jobs_df = pd.read_csv(self.file_path, dtype={"id": str})
+        Returns:
+            Filtered DataFrame (empty if no jobs are loaded)
+        """
+        import pandas as pd
+        df = self.jobs_view(self._filter_columns())
+        if df is None:
+            return pd.DataFrame()
+        with self.metrics.phase("filter"):
+            matches = self._filter_cache.lookup(
+                df, self._filter_config_key(), self.jobs_version, self._evaluate_filters
+            )
+            open_mask = df['closed'] != True if 'closed' in df.columns else True
+            return df[(df['applied'] == False) & open_mask & matches]
+
+    def _filter_columns(self):
+        """
+        Columns filter_jobs() and the application tables read.
+        
+        Columns whose rules are all empty are left out, so e.g. descriptions are
+        not loaded when nothing filters on them.
+        """
+        columns = {"id", "code", "title", "applied", "closed", self.location_column}
+        columns.update(column for column, rules in self._filter_rules() if rules.get("include") or rules.get("exclude"))
+        return columns
+
+    def search_jobs(self, query, limit=20):
+        """
+        Ranked full-text search over job titles, requirements and descriptions.
+        
+        Args:
+            query: FTS5 query: words, "phrases", prefix* terms, AND/OR/NOT and
+                column filters such as title:manager
+            limit: Maximum number of results
+            
+        Returns:
+            DataFrame of matching jobs, best match first, with a score column
+            
+        Raises:
+            ValueError: If the query is not valid
+        """
+        import pandas as pd
+        index = self._sync_search_index()
+        if index is None:
+            raise RuntimeError("Search needs the search index; unset CRAWLER_SEARCH_INDEX=0")
+        df = self.jobs_view(["code", "title", "locations", "applied", "closed"])
+        if df is None:
+            return pd.DataFrame()
+        with self.metrics.phase("search"):
+            scores = dict(index.search(query, limit))
+        ids = df['id'].astype(str)
+        matched = ids.isin(scores.keys())
+        results = df[matched].assign(score=ids[matched].map(scores))
+        return results.sort_values("score", ascending=False)
+
+    def _job_url(self, job_id):
+        """
+        Link to a job's posting, shown next to search results.
+        """
+        return ""
+
+    def print_search_results(self, query, limit=20):
+        """
+        Search the jobs and print the results as a table.
+        """
+        from rich.console import Console
+        from rich.table import Table
+        console = Console()
+        try:
+            results = self.search_jobs(query, limit=limit)
+        except ValueError as e:
+            console.print(f"[red]{str(e)}[/red]")
+            return
+        if len(results) == 0:
+            console.print(f"[yellow]No jobs match {query!r}.[/yellow]")
+            return
+
+        table = Table(title=f"Search results for {query!r}: {len(results)}", show_header=True, header_style="bold magenta")
+        table.add_column("Score", justify="right")
+        table.add_column("Job ID", style="cyan", no_wrap=True)
+        table.add_column("Role", style="green")
+        table.add_column("Locations")
+        table.add_column("Link", style="blue", no_wrap=False)
+        for _, row in results.iterrows():
+            job_code = row['code'] if isinstance(row['code'], str) and row['code'] else row['id']
+            locations = row['locations'] if isinstance(row['locations'], str) else ""
+            status = " (applied)" if row['applied'] else " (closed)" if row['closed'] else ""
+            table.add_row(f"{row['score']:.2f}", str(job_code), f"{row['title']}{status}", locations, self._job_url(row['id']))
+        console.print(table)
+
+    @staticmethod
+    def _normalize_locations(value):
+        """
+        Normalize a job's location field into a list of location names.
+        """
+        return location_names(value)
+
+    def _location_mask(self, df, column, locations, exact=True):
+        """
+        Vectorized location filter.
+        
+        Each job's locations are normalized once into an exploded job -> location
+        Series, which is matched in a single isin or str.contains call.
+        
+        Args:
+            df: Jobs DataFrame
+            column: Column holding each job's locations
+            locations: Location names to keep
+            exact: Match names exactly; if False, keep jobs whose location contains any name
+            
+        Returns:
+            Boolean Series aligned with df
+        """
+        import numpy as np
+        import pandas as pd
+        if column not in df.columns:
+            return pd.Series(False, index=df.index)
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            # Match each distinct location set once, then look the result up by code
+            categories = pd.DataFrame({column: df[column].cat.categories.astype(object)})
+            category_mask = self._location_mask(categories, column, locations, exact).to_numpy()
+            codes = df[column].cat.codes.to_numpy()
+            matched = np.where(codes >= 0, category_mask[codes], False) if len(category_mask) else np.zeros(len(df), dtype=bool)
+            return pd.Series(matched, index=df.index)
+        table = df[column].map(self._normalize_locations).explode().dropna().astype(str)
+        if exact:
+            matches = table.isin(locations)
+        elif locations:
+            matches = table.str.contains('|'.join(re.escape(location) for location in locations), regex=True)
         else:
-            self.jobs_df = None
+            matches = pd.Series(False, index=table.index)
+        mask = matches.groupby(level=0).any()
+        return mask.reindex(df.index, fill_value=False).astype(bool)
+
+    def _record_wait(self, phase, waited, budget):
+        self.waits.record(phase, waited, budget / 1000)
+        self.metrics.increment("wait_seconds", waited)
+
+    def _count_response(self, response):
+        """
+        Count a browser response captured by a wait or listener.
+        
+        Uses the Content-Length header so the body is not fetched just to be measured.
+        """
+        self.metrics.increment("responses_intercepted")
+        try:
+            self.metrics.increment("bytes_transferred", int(response.headers.get("content-length") or 0))
+        except (TypeError, ValueError):
+            pass
+
+    def _build_session(self, pool_size=10, storage_state=None):
+        """
+        build_session throttled by the shared rate controller and credited to this run's metrics.
+        """
+        from .http import build_session
+        return build_session(pool_size=pool_size, storage_state=storage_state, rate_controller=self.rate_controller, metrics=self.metrics)
+
+    def _retry_queue(self):
+        """
+        RetryQueue for one pass, with its own circuit breaker.
+        """
+        return RetryQueue(self.retry_policy, CircuitBreaker())
+
+    def _retry_logger(self, label):
+        """
+        on_retry callback for RetryPolicy.call that counts and prints each retry.
+        """
+        def on_retry(attempt, error):
+            self.metrics.increment("retries")
+            print(f"  ↻ Retrying {label} (attempt {attempt + 1}/{self.retry_policy.attempts}): {str(error)}")
+        return on_retry
+
+    def _report_failed(self, name, retry_queue):
+        """
+        Print and record the ids a pass gave up on after retrying.
+        
+        Returns:
+            Dict mapping each failed id to its last error
+        """
+        failed = dict(retry_queue.failed)
+        if failed:
+            self.metrics.record_failed(name, failed)
+            print(f"{len(failed)} {name} tasks failed after {self.retry_policy.attempts} attempts:")
+            for key, error in sorted(failed.items(), key=lambda item: str(item[0])):
+                print(f"  ✗ {key}: {error}")
+        return failed
+
+    def _count_fetch(self, response):
+        """
+        Count a page fetched over plain HTTP.
+        """
+        self.metrics.increment("pages_fetched")
+        self.metrics.increment("bytes_transferred", len(response.content))
+
+    def write_metrics(self, directory=None):
+        """
+        Write the run's metrics as a timestamped JSON report and a Prometheus text file.
+        
+        The Prometheus file keeps a fixed name so a textfile collector always reads the
+        latest run; point CRAWLER_METRICS_DIR at the collector's directory to export it.
+        
+        Args:
+            directory: Output directory. Defaults to self.metrics_dir.
+            
+        Returns:
+            Tuple of (json_path, prometheus_path)
+        """
+        directory = directory or self.metrics_dir
+        name = self.company_name.lower()
+        json_path = os.path.join(directory, f"{name}_run_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        prometheus_path = os.path.join(directory, f"crawler_{name}.prom")
+        self.metrics.write_json(json_path)
+        self.metrics.write_prometheus(prometheus_path)
+        return json_path, prometheus_path
+
+    def _wait_for_response(self, page, predicate, action=None, phase="navigation", budget=0, timeout=None):
+        """
+        Wait for the first network response matching predicate, optionally triggered by action.
+        
+        Args:
+            page: Playwright Page to listen on
+            predicate: Callable taking a Response and returning True when it is the one to wait for
+            action: Optional callable that triggers the response (e.g. a click or goto)
+            phase: Phase name used in the wait summary
+            budget: Milliseconds of fixed sleep this wait replaces
+            timeout: Milliseconds to wait before giving up. Defaults to self.wait_timeout
+            
+        Returns:
+            The matching Response, or None if it did not arrive in time
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        start = time.monotonic()
+        try:
+            with page.expect_response(predicate, timeout=timeout or self.wait_timeout) as response_info:
+                if action is not None:
+                    action()
+            self._count_response(response_info.value)
+            return response_info.value
+        except PlaywrightTimeoutError:
+            print(f"Timed out waiting for response during {phase}")
+            return None
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    def _wait_for_locator(self, locator, state="visible", phase="navigation", budget=0, timeout=None):
+        """
+        Wait for a locator to reach the given state.
+        
+        Args:
+            locator: Playwright Locator to wait on
+            state: One of "attached", "detached", "visible" or "hidden"
+            phase: Phase name used in the wait summary
+            budget: Milliseconds of fixed sleep this wait replaces
+            timeout: Milliseconds to wait before giving up. Defaults to self.wait_timeout
+            
+        Returns:
+            True if the locator reached the state, False on timeout
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        start = time.monotonic()
+        try:
+            locator.wait_for(state=state, timeout=timeout or self.wait_timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    def _wait_for_load(self, page, state="networkidle", action=None, phase="navigation", budget=0, timeout=None):
+        """
+        Wait for the page to reach a load state, optionally after a navigation triggered by action.
+        
+        Args:
+            page: Playwright Page to wait on
+            state: One of "load", "domcontentloaded" or "networkidle"
+            action: Optional callable that triggers a navigation (e.g. submitting a form)
+            phase: Phase name used in the wait summary
+            budget: Milliseconds of fixed sleep this wait replaces
+            timeout: Milliseconds to wait before giving up. Defaults to self.wait_timeout
+            
+        Returns:
+            True if the state was reached, False on timeout
+        """
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        start = time.monotonic()
+        timeout = timeout or self.wait_timeout
+        try:
+            if action is not None:
+                with page.expect_navigation(wait_until=state, timeout=timeout):
+                    action()
+            else:
+                page.wait_for_load_state(state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+        finally:
+            self._record_wait(phase, time.monotonic() - start, budget)
+
+    def _login(self, page):
+        """
+        Perform an interactive login on the given page.
+        
+        Subclasses that scrape authenticated pages must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support login")
+
+    def _is_logged_in(self, page):
+        """
+        Check whether the page's context holds a valid authenticated session.
+        
+        Subclasses that scrape authenticated pages must override this.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support login")
+
+    def _authenticated_context(self):
+        """
+        Create a logged-in context in the shared browser, reusing the cached session when it is still valid.
+        
+        Returns:
+            Tuple of (context, page) with the page left on the post-login view.
+            The caller closes the context.
+        """
+        with self.metrics.phase("login"):
+            return self._open_authenticated_context()
+
+    def _open_authenticated_context(self):
+        storage_state = self.session_cache.load()
+        if storage_state is not None:
+            context = self.browser_manager.new_context(storage_state=storage_state)
+            page = context.new_page()
+            if self._is_logged_in(page):
+                return context, page
+            print("Cached session expired, logging in again...")
+            context.close()
+            self.session_cache.invalidate()
+
+        context = self.browser_manager.new_context()
+        page = context.new_page()
+        self._login(page)
+        if self._is_logged_in(page):
+            self.session_cache.save(context.storage_state())
+        return context, page
     
     @abstractmethod
     def scrape_careers_page(self, max_jobs=None):
@@ -101,13 +813,31 @@ class BaseCareersScraper(ABC):
         """
         pass
     
+    def hydrate_descriptions(self, concurrency=None):
+        """
+        Fill in missing job descriptions without a browser.
+        
+        Companies whose listing already carries the full description need not
+        override this.
+        
+        Returns:
+            Number of descriptions filled in
+        """
+        return 0
+
     @abstractmethod
-    def scrape_and_save_jobs(self, max_jobs=None):
+    def scrape_and_save_jobs(self, max_jobs=None, incremental=None):
         """
         Scrape jobs and save them to CSV, avoiding duplicates.
         
         Args:
             max_jobs: Optional maximum number of jobs to scrape
+            incremental: Stop paginating once self.stop_after_known_pages consecutive pages
+                hold only known jobs. Defaults to self.incremental.
+            
+        Returns:
+            Number of new jobs saved. Implementations also set self.last_scraped_count
+            to the number of jobs the crawl returned.
             
         Note: Implementation may vary by company based on their data structure
         and scraping requirements.
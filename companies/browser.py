@@ -0,0 +1,333 @@
+import os
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+
+# Resource types that never carry job data
+DEFAULT_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack", "manifest"})
+
+# Analytics and tracking hosts contacted by lifeattiktok.com and metacareers.com
+DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "analytics.tiktok.com",
+    "mon.tiktokv.com",
+    "mon-va.byteoversea.com",
+    "mcs.tiktokw.us",
+    "sentry.io",
+)
+
+# Chromium switches that drop background work a scraper never needs
+DEFAULT_CHROMIUM_ARGS = (
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--mute-audio",
+    "--no-first-run",
+)
+
+
+@dataclass
+class BrowserProfile:
+    """
+    Launch and context settings shared by every Playwright call site.
+
+    The default profile is "lean": headless, with non-essential resources and
+    analytics hosts aborted and reduced Chromium flags. Use BrowserProfile.debug()
+    (or CRAWLER_LEAN=0) to get a visible, unfiltered browser.
+    """
+    headless: bool = True
+    block_requests: bool = True
+    blocked_resource_types: frozenset = DEFAULT_BLOCKED_RESOURCE_TYPES
+    blocked_hosts: tuple = DEFAULT_BLOCKED_HOSTS
+    chromium_args: tuple = DEFAULT_CHROMIUM_ARGS
+    context_options: dict = field(default_factory=lambda: {"viewport": {"width": 1280, "height": 800}})
+
+    @classmethod
+    def debug(cls):
+        """
+        Visible browser with every request allowed, for debugging selectors.
+        """
+        return cls(headless=False, block_requests=False, chromium_args=())
+
+    @classmethod
+    def from_env(cls, lean=None):
+        """
+        Build the lean or debug profile.
+
+        Args:
+            lean: Force the lean (True) or debug (False) profile. If None, reads
+                the CRAWLER_LEAN environment variable (default on).
+        """
+        if lean is None:
+            lean = os.getenv("CRAWLER_LEAN", "1").lower() not in ("0", "false", "no", "off")
+        return cls() if lean else cls.debug()
+
+    def launch(self, playwright):
+        """
+        Launch Chromium with this profile.
+        """
+        return playwright.chromium.launch(headless=self.headless, args=list(self.chromium_args))
+
+    def new_context(self, browser, **kwargs):
+        """
+        Create a browser context with request blocking applied.
+
+        Args:
+            browser: Playwright Browser
+            **kwargs: Extra options for browser.new_context (e.g. storage_state)
+        """
+        context = browser.new_context(**{**self.context_options, **kwargs})
+        if self.block_requests:
+            context.route("**/*", self._route_request)
+        return context
+
+    async def new_context_async(self, browser, **kwargs):
+        """
+        new_context for a browser from the async Playwright API.
+        """
+        context = await browser.new_context(**{**self.context_options, **kwargs})
+        if self.block_requests:
+            await context.route("**/*", self._route_request_async)
+        return context
+
+    def new_page(self, browser, **kwargs):
+        """
+        Create a page in a fresh context with this profile applied.
+        """
+        return self.new_context(browser, **kwargs).new_page()
+
+    def should_block(self, request):
+        if request.resource_type in self.blocked_resource_types:
+            return True
+        host = urlparse(request.url).hostname or ""
+        return any(host == blocked or host.endswith(f".{blocked}") for blocked in self.blocked_hosts)
+
+    def _route_request(self, route):
+        if self.should_block(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_request_async(self, route):
+        if self.should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+class BrowserManager:
+    """
+    Owns one Playwright instance and Chromium browser for a scraper's lifetime.
+
+    The browser is launched on first use and reused by every phase, which gets a
+    fresh context (and so fresh cookies) from context() or page(). Call close()
+    when done, or use the manager as a context manager.
+
+    Playwright's sync API is bound to the thread that started it, so a manager
+    must only be used from that thread; threaded workers create their own.
+    """
+
+    def __init__(self, profile=None, metrics=None):
+        """
+        Args:
+            profile: BrowserProfile to launch with. Defaults to BrowserProfile.from_env().
+            metrics: Optional CrawlMetrics that times the launch as the "launch" phase
+        """
+        self.profile = profile or BrowserProfile.from_env()
+        self.metrics = metrics
+        self._playwright = None
+        self._browser = None
+        self._thread_id = None
+
+    @property
+    def is_running(self):
+        return self._browser is not None
+
+    @property
+    def browser(self):
+        """
+        The shared Browser, launched on first access.
+        """
+        if self._browser is None:
+            self._thread_id = threading.get_ident()
+            if self.metrics is not None:
+                with self.metrics.phase("launch"):
+                    self._launch()
+            else:
+                self._launch()
+        elif self._thread_id != threading.get_ident():
+            raise RuntimeError("BrowserManager used from a different thread than the one that launched it")
+        return self._browser
+
+    def _launch(self):
+        from playwright.sync_api import sync_playwright
+        self._playwright = sync_playwright().start()
+        try:
+            self._browser = self.profile.launch(self._playwright)
+        except Exception:
+            self._playwright.stop()
+            self._playwright = None
+            raise
+
+    def new_context(self, **kwargs):
+        """
+        Create a context in the shared browser. The caller closes it.
+        """
+        return self.profile.new_context(self.browser, **kwargs)
+
+    @contextmanager
+    def context(self, **kwargs):
+        """
+        A context in the shared browser, closed when the block exits.
+        """
+        context = self.new_context(**kwargs)
+        try:
+            yield context
+        finally:
+            _close_quietly(context)
+
+    @contextmanager
+    def page(self, **kwargs):
+        """
+        A page in its own context, closed when the block exits.
+        """
+        with self.context(**kwargs) as context:
+            yield context.new_page()
+
+    def close(self):
+        """
+        Close the browser and stop Playwright. The manager can launch again afterwards.
+        """
+        if self._browser is not None:
+            _close_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+        self._thread_id = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncBrowserManager:
+    """
+    BrowserManager for the async Playwright API.
+
+    Tasks on the same event loop share one browser and may open contexts
+    concurrently. The manager is bound to the loop it launched on.
+    """
+
+    def __init__(self, profile=None, metrics=None):
+        """
+        Args:
+            profile: BrowserProfile to launch with. Defaults to BrowserProfile.from_env().
+            metrics: Optional CrawlMetrics that times the launch as the "launch" phase
+        """
+        self.profile = profile or BrowserProfile.from_env()
+        self.metrics = metrics
+        self._playwright = None
+        self._browser = None
+        self._lock = None
+
+    @property
+    def is_running(self):
+        return self._browser is not None
+
+    async def browser(self):
+        """
+        The shared Browser, launched by the first task that asks for it.
+        """
+        if self._lock is None:
+            import asyncio
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._browser is None:
+                if self.metrics is not None:
+                    with self.metrics.phase("launch"):
+                        await self._launch()
+                else:
+                    await self._launch()
+        return self._browser
+
+    async def _launch(self):
+        from playwright.async_api import async_playwright
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self.profile.launch(self._playwright)
+        except Exception:
+            await self._playwright.stop()
+            self._playwright = None
+            raise
+
+    async def new_context(self, **kwargs):
+        """
+        Create a context in the shared browser. The caller closes it.
+        """
+        return await self.profile.new_context_async(await self.browser(), **kwargs)
+
+    @asynccontextmanager
+    async def context(self, **kwargs):
+        """
+        A context in the shared browser, closed when the block exits.
+        """
+        context = await self.new_context(**kwargs)
+        try:
+            yield context
+        finally:
+            await _close_quietly_async(context)
+
+    @asynccontextmanager
+    async def page(self, **kwargs):
+        """
+        A page in its own context, closed when the block exits.
+        """
+        async with self.context(**kwargs) as context:
+            yield await context.new_page()
+
+    async def close(self):
+        """
+        Close the browser and stop Playwright. The manager can launch again afterwards.
+        """
+        if self._browser is not None:
+            await _close_quietly_async(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        # A later launch may run on a different event loop
+        self._lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+async def _close_quietly_async(target):
+    try:
+        await target.close()
+    except Exception:
+        pass
+
+
+def _close_quietly(target):
+    # The browser may already be gone (crash, or closed from another call path)
+    try:
+        target.close()
+    except Exception:
+        pass
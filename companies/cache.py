@@ -0,0 +1,125 @@
+import json
+import time
+import sqlite3
+import hashlib
+from contextlib import closing
+
+
+class DescriptionCache:
+    """
+    Per-company SQLite cache of extracted job details, keyed by job id.
+
+    Each entry keeps the raw extracted fields, a hash of their content, when they
+    were fetched and how many fetches failed in a row. Successful entries are
+    served from the cache until their TTL expires; failing jobs are retried with
+    exponential backoff and left alone for a long time once they keep failing.
+    """
+
+    def __init__(self, path, ttl=7 * 24 * 3600, negative_ttl=3600, max_failures=5, max_failure_ttl=30 * 24 * 3600):
+        """
+        Args:
+            path: SQLite file path
+            ttl: Seconds a successful fetch stays fresh
+            negative_ttl: Base seconds to wait before retrying a failed fetch; doubles per failure
+            max_failures: Failures after which a job is only retried every max_failure_ttl
+            max_failure_ttl: Seconds to wait between retries of a job that keeps failing
+        """
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_failures = max_failures
+        self.max_failure_ttl = max_failure_ttl
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                "id TEXT PRIMARY KEY, details TEXT, content_hash TEXT, "
+                "fetched_at REAL NOT NULL, failures INTEGER NOT NULL DEFAULT 0, last_error TEXT)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    @staticmethod
+    def content_hash(details):
+        return hashlib.sha256(json.dumps(details, sort_keys=True, default=str).encode()).hexdigest()
+
+    def entries(self, ids):
+        """
+        Cached entries for the given ids.
+
+        Returns:
+            Dict mapping id to a dict with details, content_hash, fetched_at, failures and last_error
+        """
+        ids = [str(id) for id in ids]
+        entries = {}
+        with closing(self._connect()) as conn:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT id, details, content_hash, fetched_at, failures, last_error FROM descriptions "
+                    f"WHERE id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for id, details, content_hash, fetched_at, failures, last_error in rows:
+                    entries[id] = {
+                        "details": json.loads(details) if details else None,
+                        "content_hash": content_hash,
+                        "fetched_at": fetched_at,
+                        "failures": failures,
+                        "last_error": last_error,
+                    }
+        return entries
+
+    def is_fresh(self, entry, now=None):
+        """
+        Whether a cached entry should be used (or left alone) instead of fetching again.
+        """
+        if entry is None:
+            return False
+        age = (now or time.time()) - entry["fetched_at"]
+        failures = entry["failures"]
+        if failures == 0:
+            return age < self.ttl
+        if failures >= self.max_failures:
+            return age < self.max_failure_ttl
+        return age < self.negative_ttl * 2 ** (failures - 1)
+
+    def record(self, successes=None, failures=None):
+        """
+        Store fetch outcomes in one transaction.
+
+        Args:
+            successes: Dict mapping id to the extracted details
+            failures: Dict mapping id to an error message
+
+        Returns:
+            Set of ids whose content changed (or is new) since the last successful fetch
+        """
+        successes = {str(id): details for id, details in (successes or {}).items()}
+        failures = {str(id): error for id, error in (failures or {}).items()}
+        now = time.time()
+        previous = self.entries(list(successes) + list(failures))
+        changed = set()
+
+        with closing(self._connect()) as conn, conn:
+            for id, details in successes.items():
+                content_hash = self.content_hash(details)
+                if previous.get(id, {}).get("content_hash") != content_hash:
+                    changed.add(id)
+                conn.execute(
+                    "INSERT INTO descriptions (id, details, content_hash, fetched_at, failures, last_error) "
+                    "VALUES (?, ?, ?, ?, 0, NULL) ON CONFLICT(id) DO UPDATE SET "
+                    "details = excluded.details, content_hash = excluded.content_hash, "
+                    "fetched_at = excluded.fetched_at, failures = 0, last_error = NULL",
+                    (id, json.dumps(details, default=str), content_hash, now),
+                )
+            for id, error in failures.items():
+                # Keep the last good details; only the failure bookkeeping changes
+                conn.execute(
+                    "INSERT INTO descriptions (id, fetched_at, failures, last_error) VALUES (?, ?, 1, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET fetched_at = excluded.fetched_at, "
+                    "failures = descriptions.failures + 1, last_error = excluded.last_error",
+                    (id, now, str(error)),
+                )
+        return changed
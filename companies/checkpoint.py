@@ -0,0 +1,121 @@
+import os
+import json
+import time
+import threading
+
+
+class Checkpoint:
+    """
+    Small on-disk state file that lets an interrupted crawl or status pass resume.
+
+    Every `every` steps the state is rewritten atomically, so a crash or ban
+    loses at most that many steps of work. The output of each step (a page of
+    jobs, a checked status) is appended to a journal next to the state file
+    instead of being rewritten, so the cost of a write does not grow with the
+    length of the run. A checkpoint records the key of the run that wrote it
+    and is only resumed by a run with the same key.
+    """
+
+    def __init__(self, path, key=None, every=10):
+        """
+        Args:
+            path: JSON file holding the state
+            key: Identifies the run (e.g. the search URL and filters). A checkpoint
+                written under another key is ignored.
+            every: Steps between writes. 0 disables checkpointing.
+        """
+        self.path = path
+        self.journal_path = f"{os.path.splitext(path)[0]}.jsonl"
+        self.key = key
+        self.every = every
+        self.steps = 0
+        self._pending = []
+        # Bytes of the journal covered by the last saved state; anything after them
+        # was written by another run or cut short by a crash
+        self._journal_size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.every > 0
+
+    def load(self):
+        """
+        Load the saved state if it belongs to this run.
+
+        Returns:
+            The state dict passed to save(), or None
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get("key") != self.key:
+            return None
+        self._journal_size = saved.get("journal_size", 0)
+        return saved.get("state")
+
+    def journal(self):
+        """
+        Step entries recorded up to the checkpoint that load() read, oldest first.
+        """
+        if not self._journal_size:
+            return []
+        with open(self.journal_path, "rb") as f:
+            data = f.read(self._journal_size)
+        return [json.loads(line) for line in data.splitlines() if line]
+
+    def _flush_journal(self):
+        # Drop whatever follows the loaded checkpoint, then append the pending entries
+        mode = "r+b" if os.path.exists(self.journal_path) else "wb"
+        with open(self.journal_path, mode) as f:
+            f.seek(self._journal_size)
+            f.truncate()
+            f.write("".join(json.dumps(entry) + "\n" for entry in self._pending).encode())
+            f.flush()
+            os.fsync(f.fileno())
+            self._journal_size = f.tell()
+        self._pending = []
+
+    def save(self, state):
+        """
+        Write a state dict, replacing the previous checkpoint atomically.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._flush_journal()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": self.key, "saved_at": time.time(), "state": state, "journal_size": self._journal_size}, f)
+        os.replace(tmp_path, self.path)
+
+    def step(self, state=None, entry=None):
+        """
+        Count one unit of progress and write a checkpoint every `every` steps.
+
+        Safe to call from several worker threads.
+
+        Args:
+            state: Optional callable returning the state dict, only called when a write is due
+            entry: Optional JSON-serializable output of this step, appended to the journal
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.steps += 1
+            if entry is not None:
+                self._pending.append(entry)
+            if self.steps % self.every == 0:
+                self.save(state() if state is not None else {})
+
+    def clear(self):
+        """
+        Remove the checkpoint once the run it tracks has finished.
+        """
+        for path in (self.path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._pending = []
+        self._journal_size = 0
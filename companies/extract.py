@@ -0,0 +1,98 @@
+import re
+import json
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+_JSON_SCRIPT_PATTERN = re.compile(r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.DOTALL)
+
+
+def find_keys(obj, keys):
+    """
+    Find the first non-null value of each key in a decoded JSON document.
+
+    Walks the document once, iteratively and depth-first in document order, so
+    every key resolves to the same value a recursive pre-order search would find.
+
+    Args:
+        obj: Decoded JSON (dicts, lists and scalars)
+        keys: Iterable of key names to look for
+
+    Returns:
+        Dict mapping each found key to its value; missing keys are omitted
+    """
+    remaining = set(keys)
+    found = {}
+    stack = [obj]
+    while stack and remaining:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in [key for key in remaining if node.get(key) is not None]:
+                found[key] = node[key]
+                remaining.discard(key)
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        # Reverse so the first child is visited first
+        stack.extend(child for child in reversed(list(children)) if isinstance(child, (dict, list)))
+    return found
+
+
+_JSON_SCRIPT_SELECTOR = 'script[type="application/json"]'
+_SCRIPT_TEXT_EXPRESSION = "elements => elements.map(element => element.textContent)"
+
+
+def page_json_scripts(page):
+    """
+    Text of every application/json script tag on a Playwright page, in one round trip.
+    """
+    return page.eval_on_selector_all(_JSON_SCRIPT_SELECTOR, _SCRIPT_TEXT_EXPRESSION)
+
+
+async def page_json_scripts_async(page):
+    """
+    page_json_scripts for a page from the async Playwright API.
+    """
+    return await page.eval_on_selector_all(_JSON_SCRIPT_SELECTOR, _SCRIPT_TEXT_EXPRESSION)
+
+
+def html_json_scripts(html):
+    """
+    Text of every application/json script tag in raw HTML.
+    """
+    return _JSON_SCRIPT_PATTERN.findall(html)
+
+
+def extract_keys_from_scripts(scripts, keys, required=None):
+    """
+    Extract keys from the first script that holds all required keys.
+
+    Scripts that do not mention every required key are skipped before decoding.
+
+    Args:
+        scripts: Iterable of JSON script texts
+        keys: Keys to extract
+        required: Keys that must be present. Defaults to all keys.
+
+    Returns:
+        Dict of found keys and values, or None if no script holds the required keys
+    """
+    required = set(keys if required is None else required)
+    markers = [f'"{key}"' for key in required]
+    for script in scripts:
+        if not script or not all(marker in script for marker in markers):
+            continue
+        try:
+            data = _loads(script)
+        except ValueError:
+            continue
+        found = find_keys(data, keys)
+        if required.issubset(found):
+            return found
+    return None
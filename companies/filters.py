@@ -0,0 +1,202 @@
+import re
+
+from .search import MIN_SUBSTRING_LENGTH
+
+
+# Below this many rows, scanning the texts is cheaper than querying the search index
+INDEX_MIN_ROWS = 1000
+
+
+class ColumnMatcher:
+    """
+    Include/exclude rule sets for one text column, compiled into one matcher.
+
+    All patterns are case-insensitive literals. The exclude patterns form one
+    alternation and each non-empty include group forms its own, so groups whose
+    patterns overlap (e.g. "python" and "python developer") are each checked
+    independently. A text passes when no exclude pattern occurs and each
+    non-empty include group has at least one hit.
+    """
+
+    def __init__(self, rule_sets):
+        """
+        Args:
+            rule_sets: List of {"include": [...], "exclude": [...]} dicts that apply to the column
+        """
+        excludes = sorted({pattern.lower() for rules in rule_sets for pattern in rules.get("exclude", []) if pattern})
+        includes = [sorted({pattern.lower() for pattern in rules.get("include", []) if pattern}) for rules in rule_sets]
+        self.excludes = excludes
+        self.includes = [group for group in includes if group]
+        self.exclude_pattern = self._compile(excludes) if excludes else None
+        self.include_patterns = [self._compile(group) for group in self.includes]
+
+    @staticmethod
+    def _compile(patterns):
+        return re.compile("|".join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+
+    @property
+    def empty(self):
+        """
+        Whether the matcher has no rules and passes every text.
+        """
+        return self.exclude_pattern is None and not self.include_patterns
+
+    def matches(self, text):
+        """
+        Check a single text against the rules.
+        """
+        if self.empty:
+            return True
+        if not isinstance(text, str) or not text:
+            return not self.include_patterns
+        if self.exclude_pattern is not None and self.exclude_pattern.search(text):
+            return False
+        return all(pattern.search(text) for pattern in self.include_patterns)
+
+    @property
+    def indexable(self):
+        """
+        Whether every pattern is long enough for the search index's substring lookup.
+        """
+        patterns = self.excludes + [pattern for group in self.includes for pattern in group]
+        return all(len(pattern) >= MIN_SUBSTRING_LENGTH for pattern in patterns)
+
+    def index_mask(self, ids, index, column):
+        """
+        mask() answered from a SearchIndex instead of scanning the texts.
+
+        Args:
+            ids: Series of job ids whose column is indexed
+            index: SearchIndex holding the current text of every job in ids
+            column: Indexed column the rules apply to
+
+        Returns:
+            Boolean Series aligned with ids
+        """
+        import pandas as pd
+        ids = ids.astype(str)
+        mask = pd.Series(True, index=ids.index)
+        if self.excludes:
+            mask &= ~ids.isin(index.substring_ids(column, self.excludes))
+        for group in self.includes:
+            mask &= ids.isin(index.substring_ids(column, group))
+        return mask
+
+    def mask(self, series):
+        """
+        Boolean Series of texts in series that pass the rules.
+        """
+        import numpy as np
+        import pandas as pd
+        if self.empty:
+            return pd.Series(True, index=series.index)
+        # Titles and requirements repeat heavily, so match each distinct text once
+        codes, uniques = pd.factorize(series, use_na_sentinel=False)
+        results = np.fromiter((self.matches(text) for text in uniques), dtype=bool, count=len(uniques))
+        return pd.Series(results[codes], index=series.index)
+
+
+class FilterEngine:
+    """
+    Compiled text filters over several DataFrame columns.
+    """
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: List of (column, {"include": [...], "exclude": [...]}) pairs. Several
+                rule sets may target the same column; they are compiled into one matcher.
+        """
+        by_column = {}
+        for column, rule_set in rules:
+            by_column.setdefault(column, []).append(rule_set)
+        self.matchers = {column: ColumnMatcher(rule_sets) for column, rule_sets in by_column.items()}
+
+    def mask(self, df, index=None):
+        """
+        Boolean Series aligned with df of rows passing every column's rules.
+
+        Rules on columns missing from df are ignored.
+
+        Args:
+            df: Jobs DataFrame
+            index: Optional SearchIndex in sync with df. Rules on indexed columns are
+                answered from it when df is large enough, instead of scanning every text.
+        """
+        import pandas as pd
+        mask = pd.Series(True, index=df.index)
+        use_index = index is not None and len(df) >= INDEX_MIN_ROWS
+        for column, matcher in self.matchers.items():
+            if column not in df.columns:
+                continue
+            if use_index and column in index.columns and matcher.indexable:
+                mask &= matcher.index_mask(df['id'], index, column)
+            else:
+                mask &= matcher.mask(df[column])
+        return mask
+
+
+class FilterCache:
+    """
+    Memoized per-job filter results.
+
+    Results are keyed on a hash of the filter configuration and the dataset
+    version. Jobs reported as changed (and jobs not seen before) are the only
+    rows re-evaluated; an unchanged dataset returns the cached results directly.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._config_key = None
+        self._version = None
+        self._results = None
+        self._dirty = set()
+
+    def invalidate(self, ids=None):
+        """
+        Mark jobs as changed so they are re-evaluated on the next lookup.
+
+        Args:
+            ids: Iterable of changed job ids, or None to drop every cached result
+        """
+        if ids is None:
+            self.clear()
+        else:
+            self._dirty.update(str(id) for id in ids)
+
+    def lookup(self, df, config_key, version, evaluate):
+        """
+        Filter results for every row of df.
+
+        Args:
+            df: Jobs DataFrame with an id column
+            config_key: Hash of the filter configuration
+            version: Dataset version; must change whenever jobs change
+            evaluate: Callable taking a subset of df and returning a boolean Series aligned with it
+
+        Returns:
+            Boolean Series aligned with df
+        """
+        import pandas as pd
+        ids = df['id'].astype(str)
+        if self._results is None or config_key != self._config_key:
+            stale = pd.Series(True, index=df.index)
+            results = pd.Series(dtype=bool)
+        elif version == self._version and not self._dirty:
+            return ids.map(self._results).fillna(False).astype(bool)
+        else:
+            stale = ~ids.isin(self._results.index) | ids.isin(self._dirty)
+            results = self._results
+
+        if stale.any():
+            fresh = evaluate(df[stale]).astype(bool)
+            fresh.index = ids[stale].values
+            results = pd.concat([results[~results.index.isin(fresh.index)], fresh])
+
+        self._results = results
+        self._config_key = config_key
+        self._version = version
+        self._dirty = set()
+        return ids.map(results).fillna(False).astype(bool)
@@ -0,0 +1,156 @@
+import json
+import time
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import retry_after_seconds
+
+
+# Headers that describe the original browser connection rather than the request
+# itself; requests computes these on its own.
+_SKIPPED_HEADERS = {"content-length", "host", "connection", "cookie"}
+
+
+# Sent with browserless page fetches so sites serve the same HTML as to Chromium
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    requests.Session that sends every request through a per-host rate controller.
+
+    Each request waits for its host's limiter, and its status and latency are fed
+    back so the limiter can back off or ramp up.
+    """
+
+    def __init__(self, rate_controller, metrics=None):
+        """
+        Args:
+            rate_controller: RateController shared with the other fetch paths
+            metrics: Optional CrawlMetrics credited with throttle time and back offs
+        """
+        super().__init__()
+        self.rate_controller = rate_controller
+        self.metrics = metrics
+
+    def request(self, method, url, *args, **kwargs):
+        limiter = self.rate_controller.limiter(url)
+        waited = limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            self._record(waited, limiter.release(time.monotonic() - start, error=True))
+            raise
+        except BaseException:
+            limiter.release(time.monotonic() - start)
+            raise
+        backed_off = limiter.release(
+            time.monotonic() - start,
+            status=response.status_code,
+            retry_after=retry_after_seconds(response),
+        )
+        self._record(waited, backed_off)
+        return response
+
+    def _record(self, waited, backed_off):
+        if self.metrics is None:
+            return
+        self.metrics.increment("throttle_seconds", waited)
+        if backed_off:
+            self.metrics.increment("backoffs")
+
+
+def build_session(pool_size=10, storage_state=None, rate_controller=None, metrics=None):
+    """
+    Build a requests session with a connection pool sized for concurrent use.
+
+    Args:
+        pool_size: Maximum number of pooled connections per host
+        storage_state: Optional Playwright storage state whose cookies are loaded into the session
+        rate_controller: Optional RateController every request is throttled through
+        metrics: Optional CrawlMetrics for the rate controller's throttle time and back offs
+
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session() if rate_controller is None else RateLimitedSession(rate_controller, metrics=metrics)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = DEFAULT_USER_AGENT
+    for cookie in (storage_state or {}).get("cookies", []):
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    return session
+
+
+@dataclass
+class RequestTemplate:
+    """
+    A request captured from the browser that can be replayed with a modified body.
+
+    JSON bodies and form-encoded bodies (as sent to GraphQL endpoints) are both
+    kept as dicts; body_format records which encoding to send them back with.
+    """
+    url: str
+    method: str = "POST"
+    headers: dict = field(default_factory=dict)
+    body: dict = field(default_factory=dict)
+    cookies: dict = field(default_factory=dict)
+    body_format: str = "json"
+
+    @classmethod
+    def from_request(cls, request, cookies=None):
+        """
+        Capture a Playwright request as a template.
+
+        Args:
+            request: Playwright Request object with a JSON body
+            cookies: List of cookie dicts as returned by BrowserContext.cookies()
+        """
+        headers = {
+            key: value for key, value in request.headers.items()
+            if not key.startswith(":") and key.lower() not in _SKIPPED_HEADERS
+        }
+        content_type = next((value for key, value in headers.items() if key.lower() == "content-type"), "")
+        if "application/x-www-form-urlencoded" in content_type:
+            body_format = "form"
+            body = dict(parse_qsl(request.post_data or "", keep_blank_values=True))
+        else:
+            body_format = "json"
+            try:
+                body = json.loads(request.post_data) if request.post_data else {}
+            except ValueError:
+                body = {}
+        return cls(
+            url=request.url,
+            method=request.method,
+            headers=headers,
+            body=body,
+            cookies={cookie["name"]: cookie["value"] for cookie in cookies or []},
+            body_format=body_format,
+        )
+
+    def send(self, session, timeout=30, **body_updates):
+        """
+        Replay the template with the given body fields overridden.
+
+        Returns:
+            The requests.Response
+        """
+        body = {**self.body, **body_updates}
+        encoded = {"data": body} if self.body_format == "form" else {"json": body}
+        return session.request(
+            self.method,
+            self.url,
+            headers=self.headers,
+            cookies=self.cookies,
+            timeout=timeout,
+            **encoded,
+        )
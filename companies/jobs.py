@@ -0,0 +1,218 @@
+from dataclasses import dataclass
+
+from .storage import parse_nested
+
+
+# Joins a job's location (and team) names into one value, so a repeated
+# combination is stored once as a category
+LOCATION_SEPARATOR = "; "
+
+# The jobs_df schema. Fields most jobs share a value for are categoricals;
+# per-job text uses pandas' string dtype.
+JOB_DTYPES = {
+    "id": "string",
+    "title": "string",
+    "code": "string",
+    "locations": "category",
+    "team": "category",
+    "sub_team": "category",
+    "recruit_type": "category",
+    "requirement": "string",
+    "description": "string",
+    "applied": "bool",
+    "closed": "bool",
+}
+
+# Text columns filled with "" rather than left missing, so filters and
+# "needs a description" checks need not special-case NA
+_FILLED_COLUMNS = ("title", "requirement", "description")
+
+
+def _text(value):
+    if isinstance(value, str):
+        return value
+    import pandas as pd
+    if value is None or (not isinstance(value, (list, dict, tuple)) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def _name(value):
+    if isinstance(value, dict):
+        return value.get("en_name") or value.get("name") or ""
+    return _text(value)
+
+
+def location_names(value):
+    """
+    Normalize a job's location field into a list of location names.
+
+    Handles joined name strings (the jobs_df locations column), lists of names
+    (Meta's locations), city dicts with an en_name (TikTok's city_info) and
+    stringified versions of either.
+    """
+    value = parse_nested(value)
+    if isinstance(value, dict):
+        name = _name(value)
+        return [name] if name else []
+    if isinstance(value, (list, tuple)):
+        return [name for name in (_name(item) for item in value) if name]
+    value = _text(value)
+    return [name for name in value.split(LOCATION_SEPARATOR) if name] if value else []
+
+
+def _joined(value):
+    return LOCATION_SEPARATOR.join(location_names(value)) or None
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    One job posting, reduced to the fields the scrapers filter, display and track.
+
+    The raw API payload it was built from is not kept; see RawPayloadStore.
+    """
+    id: str
+    title: str = ""
+    code: str = None
+    locations: tuple = ()
+    team: str = None
+    sub_team: str = None
+    recruit_type: str = None
+    requirement: str = ""
+    description: str = ""
+    applied: bool = False
+    closed: bool = False
+
+    @classmethod
+    def from_tiktok(cls, payload):
+        """
+        Job from a TikTok job post as returned by the posts API.
+        """
+        return cls(
+            id=str(payload["id"]),
+            title=_text(payload.get("title")),
+            code=_text(payload.get("code")) or None,
+            locations=tuple(location_names(payload.get("city_info"))),
+            team=_name(parse_nested(payload.get("job_category"))) or None,
+            recruit_type=_name(parse_nested(payload.get("recruit_type"))) or None,
+            requirement=_text(payload.get("requirement")),
+            description=_text(payload.get("description")),
+        )
+
+    @classmethod
+    def from_meta(cls, payload):
+        """
+        Job from a Meta job search result. The description is hydrated separately.
+        """
+        return cls(
+            id=str(payload["id"]),
+            title=_text(payload.get("title")),
+            locations=tuple(location_names(payload.get("locations"))),
+            team=_joined(payload.get("teams")),
+            sub_team=_joined(payload.get("sub_teams")),
+            description=_text(payload.get("description")),
+        )
+
+    def to_row(self):
+        """
+        The job as a jobs_df row dict.
+        """
+        row = {name: getattr(self, name) for name in JOB_DTYPES}
+        row["locations"] = LOCATION_SEPARATOR.join(self.locations) or None
+        return row
+
+
+def apply_schema(df, columns=None):
+    """
+    Cast df's columns to JOB_DTYPES in place, adding any that are missing.
+
+    Columns outside the schema are left as they are.
+
+    Args:
+        df: Jobs DataFrame
+        columns: Optional schema columns to cast, for a frame loaded with only those
+
+    Returns:
+        df
+    """
+    import pandas as pd
+    for name, dtype in JOB_DTYPES.items():
+        if columns is not None and name not in columns:
+            continue
+        if name not in df.columns:
+            df[name] = False if dtype == "bool" else None
+        column = df[name]
+        if dtype == "bool":
+            if not pd.api.types.is_bool_dtype(column):
+                df[name] = column.map(lambda value: bool(value) if _text(value) else False).astype(bool)
+        elif dtype == "category":
+            if not isinstance(column.dtype, pd.CategoricalDtype):
+                df[name] = column.astype("category")
+        else:
+            column = column.astype("string")
+            df[name] = column.fillna("") if name in _FILLED_COLUMNS else column
+    return df
+
+
+def jobs_frame(jobs):
+    """
+    DataFrame in the JOB_DTYPES schema from Job records.
+    """
+    import pandas as pd
+    return apply_schema(pd.DataFrame([job.to_row() for job in jobs], columns=list(JOB_DTYPES)))
+
+
+def concat_jobs(frames):
+    """
+    Concatenate jobs frames, keeping categorical columns categorical.
+
+    pd.concat falls back to object dtype when categories differ, so each
+    categorical column is first recoded to the union of every frame's categories.
+    """
+    import pandas as pd
+    frames = [df for df in frames if df is not None]
+    for name, dtype in JOB_DTYPES.items():
+        if dtype != "category":
+            continue
+        categories = pd.Index([])
+        for df in frames:
+            categories = categories.union(df[name].cat.categories)
+        for df in frames:
+            df[name] = df[name].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def legacy_jobs(df, from_payload):
+    """
+    Rebuild jobs saved as raw payload rows, before the Job schema.
+
+    Args:
+        df: Jobs frame as stored, one raw payload per row plus the applied/closed flags
+        from_payload: Callable building a Job from one payload dict
+
+    Returns:
+        Tuple of (list of Job, dict mapping job id to its raw payload)
+    """
+    jobs, payloads = [], {}
+    for record in df.to_dict("records"):
+        payload = {key: value for key, value in record.items() if key not in ("applied", "closed") and _text(value)}
+        job = from_payload(payload)
+        job.applied = record.get("applied") == True
+        job.closed = record.get("closed") == True
+        # Older saves stringified missing descriptions
+        if job.description == "nan":
+            job.description = ""
+        jobs.append(job)
+        payloads[job.id] = payload
+    return jobs, payloads
+
+
+def is_lean(df, columns=None):
+    """
+    Whether a loaded jobs frame already holds every schema column (or every one of columns).
+
+    Frames saved before the Job schema hold raw payload columns instead
+    (e.g. TikTok's city_info) and need migrating.
+    """
+    return set(JOB_DTYPES if columns is None else columns).issubset(df.columns)
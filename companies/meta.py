@@ -1,38 +1,49 @@
 import os
 import json
-import ast
-import pandas as pd
-from rich.console import Console
-from rich.table import Table
-from tqdm import tqdm
-
-from playwright.sync_api import sync_playwright
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from companies.base import BaseCareersScraper
+from companies.browser import BrowserManager
+from companies.cache import DescriptionCache
+from companies.extract import extract_keys_from_scripts, html_json_scripts, page_json_scripts
+from companies.jobs import Job, concat_jobs
 
 BASE_URL = "https://www.metacareers.com"
 
+# Embedded job detail keys joined into a job's description
+DESCRIPTION_KEYS = ["minimum_qualifications", "preferred_qualifications", "responsibilities"]
+
+# Job detail page buttons that tell whether the logged-in user already applied
+VIEW_APPLICATION_SELECTOR = 'span:has-text("View application")'
+APPLY_NOW_SELECTOR = 'span:has-text("Apply Now")'
+
 
 class MetaCareersScraper(BaseCareersScraper):
-    def __init__(self, base_url=BASE_URL, locations=None):
+    def __init__(self, base_url=BASE_URL, locations=None, status_concurrency=4, description_concurrency=16, search_concurrency=4, shard_by=None, lean=None, storage=None):
         """
         Initialize Meta Careers Scraper.
         
         Args:
             base_url: Base URL of Meta careers page
             locations: List of location names to filter by
+            status_concurrency: Default number of browser contexts used to check application statuses
+            description_concurrency: Default number of parallel HTTP fetches when hydrating descriptions
+            search_concurrency: Number of search shards paged in parallel
+            shard_by: Split the job search into one query per "locations", "teams" or "keywords"
+                (see search_teams and search_keywords). None pages a single unfiltered query.
+            lean: Use the lean headless browser profile. Pass False to debug with a visible browser.
+            storage: Storage backend ("sqlite", "parquet" or "csv"). Defaults to CRAWLER_STORAGE or sqlite.
         """
         # Initialize base class
         super().__init__(
             company_name="meta",
             base_url=base_url,
-            locations=locations
+            locations=locations,
+            lean=lean,
+            storage=storage
         )
         
-        # Ensure description column is string type after loading
-        if self.jobs_df is not None and 'description' in self.jobs_df.columns:
-            self.jobs_df['description'] = self.jobs_df['description'].astype(str).replace('nan', '')
-        
         default_locations = [
             "Bellevue, WA"
         ]
@@ -43,6 +54,16 @@ class MetaCareersScraper(BaseCareersScraper):
         self.applications_url = "https://www.metacareers.com/login"
         self.login_email = os.getenv("META_LOGIN_EMAIL")
         self.login_password = os.getenv("META_LOGIN_PASSWORD")
+        self.status_concurrency = status_concurrency
+        self.description_concurrency = description_concurrency
+        self.description_cache = DescriptionCache(os.path.join(os.path.dirname(self.file_path), "meta_descriptions.sqlite"))
+
+        # The job search is replayed over HTTP, one paged query per shard
+        self.search_concurrency = search_concurrency
+        self.shard_by = shard_by
+        self.search_teams = []
+        self.search_keywords = []
+        self.max_search_pages = 50
         
         # TODO: Add Meta-specific attributes here as needed
         # Example: self.seaorch_url = f"{self.base_url}/..."
@@ -71,44 +92,176 @@ class MetaCareersScraper(BaseCareersScraper):
                 "does not provide sponsorship",
             ]
         }
+        # Meta has no separate requirement field; qualifications are hydrated into description
+        self.qualification_column = "description"
+        self.location_column = "locations"
+        self.location_exact = False
     
-    def _find_prospective_keys_in_json(self, obj, main_key, path=[]):
-        if isinstance(obj, dict):
-            if main_key in obj:
-                return obj[main_key]
-            for key, value in obj.items():
-                result = self._find_prospective_keys_in_json(value, main_key, path + [key])
-                if result is not None:
-                    return result
-        elif isinstance(obj, list):
-            for item in obj:
-                result = self._find_prospective_keys_in_json(item, main_key, path)
-                if result is not None:
-                    return result
-        return None
+    def job_from_payload(self, payload):
+        return Job.from_meta(payload)
+
+    def _description_from_keys(self, found):
+        qualifications = []
+        for key in DESCRIPTION_KEYS:
+            qualifications.extend([item['item'] for item in found.get(key) or []])
+        return "\n".join(qualifications)
 
     def find_description_in_page(self, page):
-        # Find all script tags with type="application/json"
-        script_tags = page.query_selector_all('script[type="application/json"]')
+        try:
+            found = extract_keys_from_scripts(page_json_scripts(page), DESCRIPTION_KEYS)
+        except Exception as e:
+            print(f"Error extracting description: {str(e)}")
+            return None
+        return self._description_from_keys(found) if found else None
+
+    def _job_details_url(self, job_id):
+        return f"https://www.metacareers.com/profile/job_details/{job_id}"
+
+    def _job_url(self, job_id):
+        return self._job_details_url(job_id)
+
+    def _missing_description_ids(self):
+        if self.jobs_df is None or 'description' not in self.jobs_df.columns:
+            return []
+        missing = self.jobs_df['description'].fillna("").eq("")
+        return self.jobs_df.loc[missing, 'id'].astype(str).tolist()
+
+    def fetch_job_details(self, job_id, session):
+        """
+        Fetch a job detail page over HTTP and extract its qualification fields.
+        
+        Returns:
+            Dict of the DESCRIPTION_KEYS fields, or None if the page holds no job details
+        """
+        response = session.get(self._job_details_url(job_id), timeout=30)
+        self._count_fetch(response)
+        response.raise_for_status()
+        with self.metrics.phase("parse"):
+            return extract_keys_from_scripts(html_json_scripts(response.text), DESCRIPTION_KEYS)
+
+    def hydrate_descriptions(self, concurrency=None, ids=None):
+        """
+        Fill in missing descriptions by fetching job detail HTML over pooled HTTP connections.
+        
+        Details already in the description cache are used directly; only jobs whose
+        cache entry is missing or expired are fetched, and jobs that keep failing
+        are skipped until their negative-cache backoff runs out.
         
-        for script in script_tags:
+        Args:
+            concurrency: Number of parallel fetches. Defaults to self.description_concurrency.
+            ids: Optional job ids to hydrate. Defaults to every job without a description.
+            
+        Returns:
+            Number of descriptions filled in
+        """
+        from tqdm import tqdm
+        concurrency = concurrency or self.description_concurrency
+        ids, descriptions, to_fetch = self._plan_hydration(ids)
+        if not ids:
+            return 0
+
+        successes, failures = {}, {}
+        if to_fetch:
+            # Reuse the logged-in cookies when a session is cached
+            session = self._build_session(pool_size=concurrency, storage_state=self.session_cache.load())
             try:
-                script_content = script.inner_text()
-                if script_content:
-                    json_data = json.loads(script_content)
-
-                    minimum_qualifications = self._find_prospective_keys_in_json(json_data, "minimum_qualifications")
-                    preferred_qualifications = self._find_prospective_keys_in_json(json_data, "preferred_qualifications")
-                    responsibilities = self._find_prospective_keys_in_json(json_data, "responsibilities")
-                    qualifications = []
-                    qualifications.extend([item['item'] for item in minimum_qualifications])
-                    qualifications.extend([item['item'] for item in preferred_qualifications])
-                    qualifications.extend([item['item'] for item in responsibilities])
-                    description = "\n".join(qualifications)
-                    return description
-            except Exception as e:
-                continue
-        return None
+                with self.metrics.phase("hydrate"), ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    fetches = executor.map(lambda job_id: self._fetch_job_details_outcome(job_id, session), to_fetch)
+                    for job_id, details, error in tqdm(fetches, total=len(to_fetch), desc="Hydrating descriptions"):
+                        if details:
+                            successes[job_id] = details
+                        else:
+                            failures[job_id] = error
+            finally:
+                session.close()
+
+        return self._finish_hydration(ids, descriptions, successes, failures)
+
+    def _fetch_job_details_outcome(self, job_id, session):
+        """
+        fetch_job_details that reports failure instead of raising.
+        
+        Returns:
+            Tuple of (job_id, details or None, error message or None)
+        """
+        try:
+            details = self.fetch_job_details(job_id, session)
+            return job_id, details, None if details else "No job details in page"
+        except Exception as e:
+            return job_id, None, str(e)
+
+    def _plan_hydration(self, ids=None):
+        """
+        Split the jobs to hydrate into cached descriptions and ids that need a fetch.
+        
+        Returns:
+            Tuple of (ids, descriptions by id from the cache, ids to fetch)
+        """
+        ids = self._missing_description_ids() if ids is None else [str(id) for id in ids]
+        if not ids:
+            print("No descriptions to hydrate")
+            return [], {}, []
+
+        entries = self.description_cache.entries(ids)
+        descriptions = {
+            job_id: self._description_from_keys(entry["details"])
+            for job_id, entry in entries.items() if entry["details"]
+        }
+        to_fetch = [job_id for job_id in ids if not self.description_cache.is_fresh(entries.get(job_id))]
+        print(f"{len(descriptions)} descriptions cached, fetching {len(to_fetch)} of {len(ids)}")
+        self.metrics.increment("retries", sum(1 for job_id in to_fetch if entries.get(job_id, {}).get("failures")))
+        return ids, descriptions, to_fetch
+
+    def _finish_hydration(self, ids, descriptions, successes, failures):
+        """
+        Record fetch outcomes in the cache and write the descriptions into self.jobs_df.
+
+        Only jobs whose description is new or changed are written, saved and re-indexed:
+        a refetched page with the same content hash is already in jobs_df.
+        
+        Returns:
+            Number of descriptions filled in
+        """
+        changed = set()
+        if successes or failures:
+            self.metrics.increment("failures", len(failures))
+            changed = self.description_cache.record(successes=successes, failures=failures)
+            descriptions.update({job_id: self._description_from_keys(details) for job_id, details in successes.items()})
+
+        descriptions = {job_id: description for job_id, description in descriptions.items() if description}
+        updated = {}
+        if descriptions:
+            job_ids = self.jobs_df['id'].astype(str)
+            matched = job_ids.isin(descriptions.keys())
+            # Cache hits and unchanged refetches only need writing where the job still lacks its description
+            missing = set(job_ids[matched & self.jobs_df['description'].fillna("").eq("")])
+            updated = {job_id: description for job_id, description in descriptions.items() if job_id in changed or job_id in missing}
+        if updated:
+            matched = job_ids.isin(updated.keys())
+            self.jobs_df.loc[matched, 'description'] = job_ids[matched].map(updated)
+            self._save_jobs(updated.keys())
+        print(f"Hydrated {len(descriptions)} of {len(ids)} descriptions ({len(updated)} new or changed, {len(failures)} failed)")
+        return len(descriptions)
+
+    @staticmethod
+    def _is_job_search_response(response):
+        return (
+            "graphql" in response.url and 
+            response.status == 200  and
+            response.request.headers.get("x-fb-friendly-name", "") == "CareersJobSearchResultsV3DataQuery"
+        )
+
+    @staticmethod
+    def _jobs_from_search_response(response_data):
+        """
+        All and featured jobs from a CareersJobSearchResultsV3DataQuery response.
+        """
+        json_data = response_data.get("data", {})
+        jobs_json = json_data.get("job_search_with_featured_jobs", {})
+        featured_jobs = jobs_json.get("featured_jobs", [])
+        all_jobs = jobs_json.get("all_jobs", [])
+        all_jobs.extend(featured_jobs)
+        return all_jobs
 
     def scrape_careers_page(self, max_jobs=None):
         """
@@ -122,76 +275,248 @@ class MetaCareersScraper(BaseCareersScraper):
             Job data should be dictionaries that can be converted to DataFrame rows.
         """
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                page = browser.new_page()
-
-                total_jobs = 0
-                jobs_found = []
-                def handle_jobs_from_response(response):
-                    if (
-                        "graphql" in response.url and 
-                        response.status == 200  and
-                        response.request.headers.get("x-fb-friendly-name", "") == "CareersJobSearchResultsV3DataQuery"
-                    ):
-                        try:
+            jobs_found = []
+            template = None
+            self.last_crawl_complete = False
+            known_ids = self._known_ids() if self.incremental else None
+            with self.browser_manager.page() as page:
+                # Finish as soon as the search results arrive instead of waiting for network idle
+                with self.metrics.phase("navigation"):
+                    response = self._wait_for_response(
+                        page,
+                        self._is_job_search_response,
+                        action=lambda: page.goto(self.primary_url, wait_until="domcontentloaded"),
+                        phase="navigation",
+                        budget=2000,
+                    )
+                self.metrics.increment("pages_fetched")
+                if response is not None:
+                    try:
+                        with self.metrics.phase("parse"):
                             response_data = response.json()
-                            nonlocal total_jobs
-                            nonlocal jobs_found
-                            
-                            json_data = response_data.get("data", {})
-                            jobs_json = json_data.get("job_search_with_featured_jobs", {})
-                            featured_jobs = jobs_json.get("featured_jobs", [])
-                            all_jobs = jobs_json.get("all_jobs", [])
-                            all_jobs.extend(featured_jobs)
-                            jobs_found = all_jobs
-                            total_jobs = len(jobs_found)
-                        except:
-                            pass
-                
-                page.on("response", handle_jobs_from_response)
-                page.goto(self.primary_url, wait_until="networkidle")
-                page.wait_for_load_state("domcontentloaded")
-
-                page.wait_for_timeout(2000)
-
-                browser.close()
-                return jobs_found
+                        jobs_found = self._jobs_from_search_response(response_data)
+                    except:
+                        pass
+                    template = self._search_template(response.request, page.context.cookies())
+                self.waits.report()
 
+            # Page through every shard of the search instead of keeping only the first response.
+            # The first response alone is capped, so only a paged crawl that reaches the end
+            # of the listing may mark the crawl complete.
+            if template is not None:
+                jobs_found, self.last_crawl_complete = self._crawl_search(template, jobs_found, max_jobs=max_jobs, known_ids=known_ids)
+            return self._limit_jobs(jobs_found, max_jobs)
 
         except Exception as e:
             print(f"Error scraping careers url: {self.primary_url}")
             print(f"Error details: {str(e)}")
             return None
+
+    def _search_template(self, request, cookies):
+        """
+        Request template for replaying the job search query, or None if its variables can't be read.
+        """
+        from companies.http import RequestTemplate
+        template = RequestTemplate.from_request(request, cookies)
+        variables = template.body.get("variables")
+        try:
+            variables = json.loads(variables) if isinstance(variables, str) else variables
+        except ValueError:
+            variables = None
+        if not isinstance(variables, dict):
+            print("Could not read the job search query; keeping the first page of results without updating closed jobs")
+            return None
+        return template
+
+    def _crawl_search(self, template, first_page, max_jobs=None, known_ids=None):
+        """
+        Page every shard of the job search by replaying the captured query.
+
+        Args:
+            template: RequestTemplate of the search query
+            first_page: Jobs from the search response fired on page load
+
+        Returns:
+            Tuple of (list of unique jobs, whether the crawl covered the whole listing)
+        """
+        session = self._build_session(pool_size=self.search_concurrency)
+        shards = self._search_shards()
+        try:
+            with self.metrics.phase("pagination"), ThreadPoolExecutor(max_workers=min(self.search_concurrency, len(shards))) as executor:
+                results = list(executor.map(
+                    lambda shard: self._crawl_search_shard(template, session, shard, max_jobs=max_jobs, known_ids=known_ids),
+                    shards,
+                ))
+        finally:
+            session.close()
+        return self._merge_search_shards(first_page, results, shards)
+
+    def _search_shards(self):
+        """
+        search_input overrides, one per shard of the job search.
+
+        The shard keys are not confirmed against the search API, and a key it ignores
+        returns the whole listing. Sharded crawls therefore never count as complete
+        (see _merge_search_shards), so they cannot mark jobs closed.
+        """
+        if self.shard_by == "locations" and self.locations:
+            return [{"offices": [location]} for location in self.locations]
+        if self.shard_by == "teams" and self.search_teams:
+            return [{"teams": [team]} for team in self.search_teams]
+        if self.shard_by == "keywords" and self.search_keywords:
+            return [{"q": keyword} for keyword in self.search_keywords]
+        return [{}]
+
+    def _search_body_updates(self, template, shard, page_number):
+        """
+        Body fields that point the search query at one shard and page.
+        """
+        variables = template.body.get("variables")
+        variables = json.loads(variables) if isinstance(variables, str) else dict(variables)
+        search_input = {**variables.get("search_input", {}), **shard, "page": page_number}
+        variables = {**variables, "search_input": search_input}
+        return {"variables": json.dumps(variables) if template.body_format == "form" else variables}
+
+    @staticmethod
+    def _search_page_info(response_data):
+        """
+        Paging fields of a job search response, where the response has them.
+
+        Returns:
+            Tuple of (whether another page follows, total number of jobs), each None if absent
+        """
+        jobs_json = (response_data.get("data") or {}).get("job_search_with_featured_jobs") or {}
+        page_info = jobs_json.get("page_info") or {}
+        has_next = page_info.get("has_next_page", jobs_json.get("has_next_page"))
+        total = jobs_json.get("total_count", jobs_json.get("count"))
+        return (
+            bool(has_next) if has_next is not None else None,
+            total if isinstance(total, int) else None,
+        )
+
+    def _crawl_search_shard(self, template, session, shard, max_jobs=None, known_ids=None):
+        """
+        Page through one shard of the job search.
+        
+        The shard counts as paged to its end only when the listing says so: an
+        empty page after earlier results, a page shorter than the shard's first one,
+        a response with no next page, or every job of the reported total collected.
+        A page that only repeats jobs the shard already returned means the endpoint
+        ignored the page number (or the shard's search key), so the shard stops
+        without claiming completeness. A failed page is retried with exponential
+        backoff before the shard gives up.
+        
+        Returns:
+            Tuple of (list of job dicts, whether the shard was paged to its end)
+        """
+        jobs_by_id = {}
+        known_streak = 0
+        page_size = None
+        for page_number in range(1, self.max_search_pages + 1):
+            if max_jobs is not None and len(jobs_by_id) >= max_jobs:
+                return list(jobs_by_id.values()), False
+
+            def fetch_page():
+                response = template.send(session, **self._search_body_updates(template, shard, page_number))
+                self._count_fetch(response)
+                response.raise_for_status()
+                with self.metrics.phase("parse"):
+                    response_data = response.json()
+                    return self._jobs_from_search_response(response_data), self._search_page_info(response_data)
+
+            label = f"search page {page_number} of shard {shard or 'all'}"
+            try:
+                jobs, (has_next, total) = self.retry_policy.call(fetch_page, on_retry=self._retry_logger(label))
+            except Exception as e:
+                self.metrics.increment("failures")
+                self.metrics.record_failed("search", {label: f"{type(e).__name__}: {str(e)}"})
+                print(f"  ✗ Failed to fetch {label}: {str(e)}")
+                return list(jobs_by_id.values()), False
+
+            page_ids = [str(job.get("id")) for job in jobs]
+            if not page_ids:
+                # An empty first page only ends the listing if the response confirms it holds nothing
+                return list(jobs_by_id.values()), page_number > 1 or has_next is False or total == 0
+            if all(job_id in jobs_by_id for job_id in page_ids):
+                print(f"  Page {page_number} of shard {shard or 'all'} repeats earlier jobs; the search may ignore paging")
+                return list(jobs_by_id.values()), False
+            for job in jobs:
+                jobs_by_id.setdefault(str(job.get("id")), job)
+
+            page_size = page_size or len(page_ids)
+            if has_next is False or (total is not None and len(jobs_by_id) >= total) or len(page_ids) < page_size:
+                return list(jobs_by_id.values()), True
+
+            if known_ids is not None:
+                known_streak = known_streak + 1 if known_ids.issuperset(page_ids) else 0
+                if known_streak >= self.stop_after_known_pages:
+                    print(f"Stopping shard {shard or 'all'} after {known_streak} pages of known jobs.")
+                    return list(jobs_by_id.values()), False
+        return list(jobs_by_id.values()), False
+
+    def _merge_search_shards(self, first_page, results, shards):
+        """
+        Deduplicate shard results by job id.
+        
+        Args:
+            first_page: Jobs from the search response fired on page load
+            results: List of (jobs, complete) per shard
+            shards: The shards the results belong to
+            
+        Returns:
+            Tuple of (list of unique jobs, whether the crawl covered the whole listing).
+            Only an unsharded search paged to its end covers the whole listing.
+        """
+        jobs_by_id = {str(job.get("id")): job for job in first_page}
+        complete = shards == [{}]
+        for jobs, shard_complete in results:
+            complete = complete and shard_complete
+            for job in jobs:
+                jobs_by_id.setdefault(str(job.get("id")), job)
+        print(f"Found {len(jobs_by_id)} unique jobs across {len(shards)} search shards")
+        return list(jobs_by_id.values()), complete
+
+    def _limit_jobs(self, jobs, max_jobs):
+        if max_jobs is not None and len(jobs) > max_jobs:
+            self.last_crawl_complete = False
+            return jobs[:max_jobs]
+        return jobs
     
     def _login(self, page):
         try:
-            page.goto(self.applications_url, wait_until="networkidle")
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
+            page.goto(self.applications_url, wait_until="domcontentloaded")
 
             email_input = page.locator('input').first
+            self._wait_for_locator(email_input, phase="login", budget=2000)
             email_input.fill(self.login_email)
             
             login_with_password = page.get_by_text("Log in with your password").first
             login_with_password.click()
-            page.wait_for_timeout(1000)
+            self._wait_for_locator(page.locator('input[type="password"]').first, phase="login", budget=1000)
             
             password_input = page.locator('input').first
             password_input.fill(self.login_password)
             
+            # Wait for the post-login navigation to fully load
             login_button = page.get_by_role("button", name="Log in").first
-            login_button.click()
-            page.wait_for_timeout(10000)
-            
-            # Wait for the page to fully load after login
-            page.wait_for_load_state("networkidle")
-            page.wait_for_timeout(2000)
+            self._wait_for_load(page, "networkidle", action=login_button.click, phase="login", budget=12000)
         except Exception as e:
             print(f"Error logging in: {str(e)}")
             return None
+
+    def _is_logged_in(self, page):
+        try:
+            if "login" in page.url or page.url == "about:blank":
+                page.goto(self.applications_url, wait_until="networkidle")
+            # A valid session redirects away from the login form
+            return page.get_by_text("Log in with your password").count() == 0 and page.locator('input[type="password"]').count() == 0
+        except Exception as e:
+            print(f"Error checking login state: {str(e)}")
+            return False
                 
     def print_application_details(self ):
+        from rich.console import Console
+        from rich.table import Table
         df = self.filter_and_find_applications()
         console = Console()
         if len(df) > 0:
@@ -203,13 +528,39 @@ class MetaCareersScraper(BaseCareersScraper):
             for index, row in df.iterrows():
                 job_code = str(row['id'])
                 role = row['title']
-                apply_link = f"https://www.metacareers.com/profile/job_details/{row['id']}"
+                apply_link = self._job_details_url(row['id'])
                 table.add_row(job_code, role, apply_link)
             
             console.print(table)
         else:
             console.print(f"[yellow]No filtered applications found.[/yellow]")
             
+    def _applications_from_scripts(self, scripts):
+        """
+        Prospective applications embedded in the applied page's JSON scripts, or None.
+        """
+        found = extract_keys_from_scripts(
+            scripts,
+            ["prospective_applications", "prospectiveApplications"],
+            required=["prospective_applications"],
+        )
+        application_data = found["prospective_applications"] if found else None
+        
+        # If application_data exists, real_job_data should also exist
+        real_job_data = found.get("prospectiveApplications") if found else None
+        if application_data is not None and real_job_data is not None:
+            # Update IDs in application_data with IDs from real_job_data, matched by index
+            for i, app_item in enumerate(application_data):
+                if isinstance(app_item, dict) and i < len(real_job_data):
+                    real_item = real_job_data[i]
+                    if isinstance(real_item, dict) and 'id' in real_item:
+                        app_item['id'] = real_item['id']
+        
+        if application_data:
+            return application_data
+        print("Could not find prospective_applications in the page data")
+        return None
+
     def scrape_applied_page(self):
         """
         Scrape the user's applied jobs page.
@@ -219,65 +570,11 @@ class MetaCareersScraper(BaseCareersScraper):
             This data will be used by update_applications() to mark jobs as applied.
         """
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                page = browser.new_page()
-                
-                self._login(page)
+            context, page = self._authenticated_context()
+            with context:
                 # Extract JSON data from script tags in the HTML
-                application_data = None
                 try:
-                    # Find all script tags with type="application/json"
-                    script_tags = page.query_selector_all('script[type="application/json"]')
-                    
-                    for script in script_tags:
-                        try:
-                            script_content = script.inner_text()
-                            if script_content:
-                                json_data = json.loads(script_content)
-                                
-                                def find_prospective_applications(obj, main_key, path=[]):
-                                    if isinstance(obj, dict):
-                                        if main_key in obj:
-                                            return obj[main_key]
-                                        for key, value in obj.items():
-                                            result = find_prospective_applications(value, main_key, path + [key])
-                                            if result is not None:
-                                                return result
-                                    elif isinstance(obj, list):
-                                        for item in obj:
-                                            result = find_prospective_applications(item, main_key, path)
-                                            if result is not None:
-                                                return result
-                                    return None
-                                
-                                application_data = find_prospective_applications(json_data, "prospective_applications")
-                                
-                                # If application_data exists, real_job_data should also exist
-                                if application_data is not None:
-                                    real_job_data = find_prospective_applications(json_data, "prospectiveApplications")
-                                    
-                                    if real_job_data is not None:
-                                        # Create a mapping from real_job_data by some identifier (e.g., job_title or index)
-                                        # Update IDs in application_data with IDs from real_job_data
-                                        for i, app_item in enumerate(application_data):
-                                            if isinstance(app_item, dict) and i < len(real_job_data):
-                                                real_item = real_job_data[i]
-                                                if isinstance(real_item, dict) and 'id' in real_item:
-                                                    # Update the ID in application_data with the correct ID from real_job_data
-                                                    app_item['id'] = real_item['id']
-                                    
-                                    break
-                                    
-                        except Exception as e:
-                            continue
-                    
-                    if application_data:
-                        return application_data
-                    else:
-                        print("Could not find prospective_applications in the page data")
-                        return None
-                        
+                    return self._applications_from_scripts(page_json_scripts(page))
                 except Exception as e:
                     print(f"Error extracting application data from page: {str(e)}")
                     return None
@@ -296,98 +593,218 @@ class MetaCareersScraper(BaseCareersScraper):
         2. Display the filtered results in a formatted table
         3. Adapt the format to Meta's data structure
         """
-        filtered_df = self.jobs_df[self.jobs_df['applied'] == False]
-
-        include_mask = self.jobs_df['title'].str.contains('|'.join(self.name_filters['include']), case=False, na=False)
-        exclude_mask = self.jobs_df['title'].str.contains('|'.join(self.name_filters['exclude']), case=False, na=False)
-        final_mask = include_mask & ~exclude_mask
+        return self.filter_jobs()
+    
+    def find_application_status(self, concurrency=None):
+        """
+        Check application status (and missing descriptions) for filtered jobs in parallel.
         
-        # Filter by locations
-        location_mask = pd.Series([False] * len(self.jobs_df), index=self.jobs_df.index)
-        for index, row in self.jobs_df.iterrows():
-            job_locations = row.get('locations', [])
-            # Handle both string representation of list and actual list
-            if isinstance(job_locations, str):
-                try:
-                    job_locations = ast.literal_eval(job_locations)
-                except (ValueError, SyntaxError):
-                    job_locations = []
-            if isinstance(job_locations, list):
-                # Check if any job location matches any of our desired locations
-                for job_loc in job_locations:
-                    if any(desired_loc in str(job_loc) for desired_loc in self.locations):
-                        location_mask.at[index] = True
-                        break
+        Logs in once, then shares the authenticated storage state with a pool of
+        workers, each driving its own browser context.
         
-        final_mask = final_mask & location_mask
-        filtered_df = filtered_df[final_mask]
+        Checked statuses are checkpointed every self.checkpoint_every jobs; with
+        self.resume set, jobs checked before the checkpoint are not checked again.
         
-        return filtered_df
-    
-    def find_application_status(self):
-        filtered_df = self.filter_and_find_applications()
-        total_updated = 0
+        A job whose check fails is retried with exponential backoff once the other
+        jobs are done. Jobs that still fail are reported and left unchanged rather
+        than marked not applied.
+        
+        Args:
+            concurrency: Number of parallel workers. Defaults to self.status_concurrency.
+            
+        Returns:
+            Dict mapping each job id that could not be checked to its last error; empty when
+            every job was checked. If the pass aborts, every unchecked job maps to the abort error.
+        """
+        from tqdm import tqdm
+        concurrency = concurrency or self.status_concurrency
+        checkpoint, results, pending = self._plan_status_check()
+        tasks_to_check = list(pending)
+
+        if not pending:
+            if results:
+                self._finish_status_check(results)
+            else:
+                print("No application statuses to check")
+            return {}
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                page = browser.new_page()
-                
-                # Login once before checking all application statuses
-                self._login(page)
-                
-                # Check application status for all jobs using the same page
-                for index, row in tqdm(filtered_df.iterrows(), total=len(filtered_df), desc="Checking application statuses"):
-                    job_id = row['id']
-                    applied = self.jobs_df.at[index, 'applied']
-                    description = self.jobs_df.at[index, 'description']
-                    if not applied:
-                        applied = self._find_application_status(job_id, page)
-                        if applied:
-                            total_updated += 1
-                    self.jobs_df.at[index, 'applied'] = applied
-                    # Check if description is NaN or empty string
-                    if pd.isna(description) or (isinstance(description, str) and (description == 'nan' or len(description) == 0)):
-                        description = self.find_description_in_page(page)
-                        print(f"Description: {description}")
-                        if description:
-                            self.jobs_df.at[index, 'description'] = str(description)
-                
-                browser.close()
-            
-            # Ensure description column is string type before saving
-            if 'description' in self.jobs_df.columns:
-                self.jobs_df['description'] = self.jobs_df['description'].astype(str).replace('nan', '')
-            # Save the updated dataframe to CSV after all checks are done
-            self.jobs_df.to_csv(self.file_path, index=False)
-            print(f"Updated application status for {total_updated} jobs and saved to {self.file_path}")
+            # Login once (or reuse the cached session) and hand it to every worker
+            context, _ = self._authenticated_context()
+            with context:
+                storage_state = context.storage_state()
+
+            retry_queue = self._retry_queue()
+            with tqdm(total=len(pending), desc="Checking application statuses") as progress, self.metrics.phase("status"):
+                while pending:
+                    tasks = queue.Queue()
+                    for task in pending:
+                        tasks.put(task)
+                    workers = min(concurrency, len(pending))
+                    if workers == 1:
+                        # A single worker can reuse the already running browser
+                        self._application_status_worker(tasks, storage_state, results, progress, checkpoint, retry_queue, self.browser_manager)
+                    else:
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            for _ in range(workers):
+                                executor.submit(self._application_status_worker, tasks, storage_state, results, progress, checkpoint, retry_queue)
+                    # Failed jobs are retried once every other job has been checked
+                    pending = retry_queue.next_round()
+                    self.metrics.increment("retries", retry_queue.last_retries)
+
+            failed = self._report_failed("status", retry_queue)
+            self._finish_status_check(results)
+            return failed
         except Exception as e:
             print(f"Error finding application status: {str(e)}")
-            return False    
+            return {job_id: f"{type(e).__name__}: {str(e)}" for job_id, _ in tasks_to_check if job_id not in results}
+
+    def _status_tasks(self):
+        """
+        (job_id, needs_description) for every filtered job whose status should be checked.
+        """
+        import pandas as pd
+        tasks = []
+        for _, row in self.filter_and_find_applications().iterrows():
+            description = row.get('description')
+            needs_description = pd.isna(description) or (isinstance(description, str) and (description == 'nan' or len(description) == 0))
+            tasks.append((str(row['id']), needs_description))
+        return tasks
+
+    def _plan_status_check(self):
+        """
+        Load the status checkpoint when resuming and list the jobs still to check.
         
-    def _find_application_status(self, id, page):
+        Returns:
+            Tuple of (checkpoint, results checked before the checkpoint, remaining tasks)
+        """
+        checkpoint = self._status_checkpoint()
+        results = {}
+        if self._resume_state(checkpoint) is not None:
+            for entry in checkpoint.journal():
+                results.update({job_id: tuple(result) for job_id, result in entry.items()})
+        if results:
+            print(f"Skipping {len(results)} jobs checked before the checkpoint")
+        tasks = [task for task in self._status_tasks() if task[0] not in results]
+        return checkpoint, results, tasks
+
+    def _status_checkpoint(self):
+        """
+        Checkpoint for the status check, keyed by the account and the filters that pick the jobs.
+        """
+        return self._checkpoint("status", key=json.dumps([self.login_email, self._filter_config_key()]))
+
+    def _finish_status_check(self, results):
+        """
+        Merge checked statuses into self.jobs_df and save the checked rows.
+        """
+        total_updated = self._merge_application_statuses(results)
+        self.waits.report()
+
+        # Save only the checked rows after all checks are done
+        self._save_jobs(results.keys())
+        print(f"Updated application status for {total_updated} jobs and saved to {self.store.path}")
+        self._status_checkpoint().clear()
+
+    def _application_status_worker(self, tasks, storage_state, results, progress, checkpoint, retry_queue, browser_manager=None):
+        """
+        Drain the task queue using a dedicated browser context.
+        
+        Playwright's sync API is bound to the thread that started it, so a worker
+        thread runs its own BrowserManager seeded with the shared login state.
+        
+        Args:
+            checkpoint: Checkpoint shared by the workers, stepped once per checked job
+            retry_queue: RetryQueue that failed checks are deferred to
+            browser_manager: Manager to open the context in. If None, a private one is
+                launched and closed when the queue is drained.
+        """
+        owned = browser_manager is None
+        if owned:
+            browser_manager = BrowserManager(self.browser_profile, metrics=self.metrics)
         try:
-            page.goto(f"https://www.metacareers.com/profile/job_details/{id}", wait_until="networkidle")
-            page.wait_for_load_state("domcontentloaded")
-            page.wait_for_timeout(2000)
-            
-            # Check for "View application" span - means already applied
-            view_application = page.locator('span:has-text("View application")').first
-            if view_application.count() > 0:
-                return True
-            
-            # Check for "Apply Now" - means not applied
-            apply_now = page.locator('span:has-text("Apply Now")').first
-            if apply_now.count() > 0:
-                return False
-            
-            # If neither found, default to False (not applied)
-            return False
+            with browser_manager.page(storage_state=storage_state) as page:
+                while True:
+                    try:
+                        task = tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    job_id, needs_description = task
+                    if not retry_queue.allow(job_id, task):
+                        self._status_task_deferred(job_id, retry_queue, progress)
+                        continue
+                    try:
+                        applied = self._find_application_status(job_id, page)
+                    except Exception as e:
+                        self.metrics.increment("failures")
+                        retry_queue.failed_attempt(job_id, task, e)
+                        self._status_task_deferred(job_id, retry_queue, progress)
+                        continue
+                    retry_queue.succeeded(job_id)
+                    description = self.find_description_in_page(page) if needs_description else None
+                    results[job_id] = (applied, description)
+                    checkpoint.step(entry={job_id: results[job_id]})
+                    progress.update(1)
         except Exception as e:
-            print(f"Error finding application status: {str(e)}")
-            return False    
-    
-    def update_applications(self, find_status=True):
+            print(f"Error in application status worker: {str(e)}")
+        finally:
+            if owned:
+                browser_manager.close()
+
+    @staticmethod
+    def _status_task_deferred(job_id, retry_queue, progress):
+        # A job only leaves the progress bar once it is checked or given up on
+        if job_id in retry_queue.failed:
+            progress.update(1)
+
+    def _merge_application_statuses(self, results):
+        """
+        Merge worker results back into self.jobs_df by job id.
+        
+        Returns:
+            Number of jobs newly marked as applied
+        """
+        applied_by_id = {job_id: applied for job_id, (applied, _) in results.items()}
+        description_by_id = {job_id: str(description) for job_id, (_, description) in results.items() if description}
+
+        ids = self.jobs_df['id'].astype(str)
+        newly_applied = ids.map(applied_by_id).eq(True) & (self.jobs_df['applied'] != True)
+        self.jobs_df.loc[newly_applied, 'applied'] = True
+
+        has_description = ids.isin(description_by_id.keys())
+        self.jobs_df.loc[has_description, 'description'] = ids[has_description].map(description_by_id)
+        return int(newly_applied.sum())
+        
+    def _find_application_status(self, id, page):
+        """
+        Whether the logged-in user has applied to a job, read from its detail page.
+        
+        Raises:
+            RuntimeError: If neither the "View application" nor the "Apply Now" button
+                rendered, so the status is unknown. Navigation errors propagate as well.
+        """
+        page.goto(self._job_details_url(id), wait_until="domcontentloaded")
+        self.metrics.increment("pages_fetched")
+        # Either button settles the status, so stop waiting as soon as one renders
+        self._wait_for_locator(
+            page.locator(f"{VIEW_APPLICATION_SELECTOR}, {APPLY_NOW_SELECTOR}").first,
+            phase="job details",
+            budget=2000,
+        )
+        
+        # Check for "View application" span - means already applied
+        view_application = page.locator(VIEW_APPLICATION_SELECTOR).first
+        if view_application.count() > 0:
+            return True
+        
+        # Check for "Apply Now" - means not applied
+        apply_now = page.locator(APPLY_NOW_SELECTOR).first
+        if apply_now.count() > 0:
+            return False
+        
+        raise RuntimeError(f"No application button rendered for job {id}")
+
+    def update_applications(self, find_status=True, concurrency=None):
         """
         Update the jobs dataframe to mark jobs as applied.
         
@@ -396,45 +813,67 @@ class MetaCareersScraper(BaseCareersScraper):
         2. Match applied jobs with jobs in self.jobs_df
         3. Update the 'applied' column in self.jobs_df
         4. Save the updated dataframe to CSV
+        
+        Args:
+            find_status: Whether to check application status on the website
+            concurrency: Optional number of parallel status workers for this run
         """
         # Find applications of interest using filtered df and check if the status is applied on the website
         if find_status:
-            self.find_application_status()
+            self.find_application_status(concurrency=concurrency)
         self.print_application_details()
 
     
-    def scrape_and_save_jobs(self, max_jobs=None):
+    def scrape_and_save_jobs(self, max_jobs=None, incremental=None):
         """
         Scrape jobs and save them to CSV, avoiding duplicates.
         
         Args:
             max_jobs: Optional maximum number of jobs to scrape
+            incremental: Stop paging a search shard once self.stop_after_known_pages
+                consecutive pages hold only known jobs. Defaults to self.incremental.
+            
+        Returns:
+            Number of new jobs saved
+        """
+        if incremental is not None:
+            self.incremental = incremental
+        return self._save_scraped_jobs(self.scrape_careers_page(max_jobs=max_jobs))
+
+    def _save_scraped_jobs(self, jobs):
         """
-        jobs = self.scrape_careers_page(max_jobs=max_jobs)
+        Append the new jobs from a crawl to self.jobs_df, save them and flag closed jobs.
+        
+        Args:
+            jobs: List of job dicts returned by scrape_careers_page, or None if it failed
+            
+        Returns:
+            Number of new jobs saved
+        """
+        if jobs is None:
+            print("No jobs scraped")
+            return 0
+        self.last_scraped_count = len(jobs)
         previous_jobs = set(str(id) for id in self.jobs_df["id"].values) if self.jobs_df is not None else set()
         new_jobs = {job['id']: job for job in jobs if str(job['id']) not in previous_jobs}
 
         if new_jobs:
-            # convert jobs dictionary to dataframe
-            jobs_list = list(new_jobs.values())
-            new_jobs_df = pd.DataFrame(jobs_list)
-            new_jobs_df["applied"] = False
-            new_jobs_df['description'] = ""
-            new_jobs_df["id"] = new_jobs_df["id"].astype(str)
-            new_jobs_df["description"] = new_jobs_df["description"].astype(str)
+            new_jobs_df = self._new_jobs_frame(list(new_jobs.values()))
             try:
                 if self.jobs_df is not None:
-                    self.jobs_df = pd.concat([self.jobs_df, new_jobs_df], ignore_index=True)
+                    self.jobs_df = concat_jobs([self.jobs_df, new_jobs_df])
                 else:
                     self.jobs_df = new_jobs_df
-                # Ensure description column is string type after concat
-                if 'description' in self.jobs_df.columns:
-                    self.jobs_df['description'] = self.jobs_df['description'].astype(str).replace('nan', '')
-                self.jobs_df.to_csv(self.file_path, index=False)
-                print(f"Updated {len(new_jobs)} new jobs to {self.file_path}")
+                self._save_jobs(new_jobs_df["id"], new=True)
+                print(f"Updated {len(new_jobs)} new jobs to {self.store.path}")
             except Exception as e:
                 print(f"Error updating jobs dataframe: {str(e)}")
                 self.jobs_df = new_jobs_df
         else:
             print("No new jobs found")
 
+        # Only a crawl that covered the whole listing can tell which jobs disappeared
+        if self.last_crawl_complete:
+            self._mark_closed_jobs([job['id'] for job in jobs])
+        return len(new_jobs)
+
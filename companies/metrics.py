@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
+
+
+# Counters every run reports, even when they stay at zero
+COUNTERS = {
+    "pages_fetched": "Pages and API pages requested",
+    "responses_intercepted": "Browser responses captured by a wait or listener",
+    "bytes_transferred": "Response body bytes received",
+    "jobs_new": "New jobs saved",
+    "jobs_updated": "Existing jobs re-saved",
+    "wait_seconds": "Seconds spent in page waits that replaced fixed sleeps",
+    "retries": "Fetches retried after an earlier failure",
+    "failures": "Fetches that failed",
+    "throttle_seconds": "Seconds fetches waited on the per-host rate controller",
+    "backoffs": "Times the rate controller backed off after a 429, 5xx, error or latency spike",
+}
+
+
+class CrawlMetrics:
+    """
+    Phase timings and counters for one scraper run.
+
+    Phases are timed with the phase() context manager and accumulate across calls
+    (and across threads, so a threaded phase reports total worker time). Counters
+    are free-form; the ones in COUNTERS are always exported.
+    """
+
+    def __init__(self, company_name):
+        self.company_name = company_name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.phases = defaultdict(lambda: {"count": 0, "seconds": 0.0})
+            self.counters = defaultdict(float, {name: 0 for name in COUNTERS})
+            self.failed = defaultdict(dict)
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the enclosed block as one occurrence of the named phase.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record_time(name, time.monotonic() - start)
+
+    def record_time(self, name, seconds):
+        with self._lock:
+            stats = self.phases[name]
+            stats["count"] += 1
+            stats["seconds"] += seconds
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+
+    def record_failed(self, name, failed):
+        """
+        Record ids a pass gave up on after retrying.
+
+        Args:
+            name: Pass name, e.g. "status" or "pagination"
+            failed: Dict mapping each failed id to its last error
+        """
+        with self._lock:
+            self.failed[name].update({str(key): error for key, error in failed.items()})
+
+    def snapshot(self):
+        """
+        The run so far as a JSON-serializable dict.
+        """
+        with self._lock:
+            return {
+                "company": self.company_name,
+                "started_at": self.started_at,
+                "finished_at": time.time(),
+                "phases": {name: dict(stats) for name, stats in self.phases.items()},
+                "counters": dict(self.counters),
+                "failed": {name: dict(failed) for name, failed in self.failed.items()},
+            }
+
+    def write_json(self, path):
+        """
+        Write the run report as JSON.
+        """
+        _atomic_write(path, json.dumps(self.snapshot(), indent=2))
+
+    def write_prometheus(self, path):
+        """
+        Write the run in Prometheus text exposition format, e.g. for node_exporter's textfile collector.
+        """
+        snapshot = self.snapshot()
+        label = f'company="{self.company_name}"'
+        lines = [
+            "# HELP crawler_phase_seconds Seconds spent in each scraping phase",
+            "# TYPE crawler_phase_seconds gauge",
+        ]
+        lines += [f'crawler_phase_seconds{{{label},phase="{name}"}} {stats["seconds"]:.6f}' for name, stats in snapshot["phases"].items()]
+        lines += [
+            "# HELP crawler_phase_count Times each scraping phase ran",
+            "# TYPE crawler_phase_count gauge",
+        ]
+        lines += [f'crawler_phase_count{{{label},phase="{name}"}} {stats["count"]}' for name, stats in snapshot["phases"].items()]
+        for name, value in snapshot["counters"].items():
+            lines.append(f"# HELP crawler_{name} {COUNTERS.get(name, name.replace('_', ' ').capitalize())}")
+            lines.append(f"# TYPE crawler_{name} gauge")
+            lines.append(f"crawler_{name}{{{label}}} {value:g}")
+        lines += [
+            "# HELP crawler_failed_ids Ids a pass gave up on after retrying",
+            "# TYPE crawler_failed_ids gauge",
+        ]
+        lines += [f'crawler_failed_ids{{{label},pass="{name}"}} {len(failed)}' for name, failed in snapshot["failed"].items()]
+        lines += [
+            "# HELP crawler_last_run_timestamp_seconds When the run's metrics were written",
+            "# TYPE crawler_last_run_timestamp_seconds gauge",
+            f"crawler_last_run_timestamp_seconds{{{label}}} {snapshot['finished_at']:.0f}",
+        ]
+        _atomic_write(path, "\n".join(lines) + "\n")
+
+    def report(self):
+        """
+        Print the phase timings and counters.
+        """
+        from rich.console import Console
+        from rich.table import Table
+        snapshot = self.snapshot()
+        table = Table(title=f"Crawl Metrics: {self.company_name}", show_header=True, header_style="bold magenta")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Count", justify="right")
+        table.add_column("Value", justify="right", style="green")
+        for name, stats in sorted(snapshot["phases"].items(), key=lambda item: -item[1]["seconds"]):
+            table.add_row(f"{name} (s)", str(stats["count"]), f"{stats['seconds']:.2f}")
+        for name, value in snapshot["counters"].items():
+            table.add_row(name, "", f"{value:,.2f}" if name.endswith("_seconds") else f"{value:,.0f}")
+        for name, failed in snapshot["failed"].items():
+            table.add_row(f"failed ids ({name})", str(len(failed)), ", ".join(sorted(failed))[:80])
+        Console().print(table)
+
+
+def _atomic_write(path, text):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(text)
+    os.replace(temp_path, path)
@@ -0,0 +1,258 @@
+import time
+import queue
+import traceback
+import multiprocessing
+from dataclasses import dataclass, field
+
+
+PHASES = ("crawl", "hydrate", "update")
+
+
+@dataclass
+class CrawlTask:
+    """
+    One company's work for the orchestrator.
+
+    The scraper is built inside the worker process from its class and keyword
+    arguments, so any BaseCareersScraper subclass can be scheduled.
+    """
+    scraper_class: type
+    kwargs: dict = field(default_factory=dict)
+    phases: tuple = ("crawl",)
+    max_jobs: int = None
+    incremental: bool = None
+    resume: bool = None
+    timeout: float = None
+
+    @property
+    def name(self):
+        return self.scraper_class.__name__
+
+
+@dataclass
+class CrawlResult:
+    name: str
+    status: str = "pending"
+    new_jobs: int = 0
+    scraped_jobs: int = 0
+    seconds: float = 0.0
+    phase_seconds: dict = field(default_factory=dict)
+    error: str = None
+
+    @property
+    def throughput(self):
+        return self.scraped_jobs / self.seconds if self.seconds > 0 else 0.0
+
+
+def _run_task(index, task, results):
+    """
+    Worker process entry point: run every phase of a task and report back.
+    """
+    result = CrawlResult(name=task.name)
+    start = time.monotonic()
+    scraper = None
+    try:
+        scraper = task.scraper_class(**task.kwargs)
+        result.name = scraper.company_name
+        if task.resume is not None:
+            scraper.resume = task.resume
+        for phase in task.phases:
+            phase_start = time.monotonic()
+            if phase == "crawl":
+                result.new_jobs += scraper.scrape_and_save_jobs(max_jobs=task.max_jobs, incremental=task.incremental) or 0
+                result.scraped_jobs += scraper.last_scraped_count
+            elif phase == "hydrate":
+                scraper.hydrate_descriptions()
+            elif phase == "update":
+                scraper.update_applications()
+            else:
+                raise ValueError(f"Unknown phase: {phase}")
+            result.phase_seconds[phase] = time.monotonic() - phase_start
+        result.status = "ok"
+    except Exception as e:
+        result.status = "failed"
+        result.error = f"{type(e).__name__}: {str(e)}"
+        traceback.print_exc()
+    if scraper is not None:
+        try:
+            scraper.write_metrics()
+        except Exception as e:
+            print(f"Error writing metrics for {result.name}: {str(e)}")
+        # Every phase shared one browser launch; release it before reporting back
+        scraper.close()
+    result.seconds = time.monotonic() - start
+    results.put((index, result))
+
+
+def run_crawls(tasks, workers=None, timeout=None):
+    """
+    Run crawl tasks concurrently, one worker process per company.
+
+    A task that raises or exceeds its timeout is recorded as failed without
+    affecting the others.
+
+    Args:
+        tasks: List of CrawlTask
+        workers: Maximum number of processes running at once. Defaults to len(tasks).
+        timeout: Default per-task timeout in seconds, used when a task sets none
+
+    Returns:
+        List of CrawlResult in the same order as tasks
+    """
+    context = multiprocessing.get_context("spawn")
+    results_queue = context.Queue()
+    workers = workers or len(tasks)
+
+    pending = list(enumerate(tasks))
+    running = {}
+    finished = {}
+
+    def collect(wait=0):
+        # A worker that just exited may still be flushing its result into the queue
+        try:
+            while True:
+                index, result = results_queue.get(timeout=wait) if wait else results_queue.get_nowait()
+                finished[index] = result
+                wait = 0
+        except queue.Empty:
+            pass
+
+    while pending or running:
+        while pending and len(running) < workers:
+            index, task = pending.pop(0)
+            process = context.Process(target=_run_task, args=(index, task, results_queue), name=task.name)
+            process.start()
+            task_timeout = task.timeout or timeout
+            started = time.monotonic()
+            running[index] = (process, started + task_timeout if task_timeout else None, started)
+
+        time.sleep(0.2)
+        collect()
+        for index, (process, deadline, started) in list(running.items()):
+            if index in finished:
+                process.join()
+                del running[index]
+            elif not process.is_alive():
+                collect(wait=1.0)
+                if index not in finished:
+                    finished[index] = CrawlResult(
+                        name=tasks[index].name,
+                        status="failed",
+                        seconds=time.monotonic() - started,
+                        error=f"Worker exited with code {process.exitcode}",
+                    )
+                del running[index]
+            elif deadline is not None and time.monotonic() > deadline:
+                process.terminate()
+                process.join()
+                finished[index] = CrawlResult(
+                    name=tasks[index].name,
+                    status="timeout",
+                    seconds=time.monotonic() - started,
+                    error="Timed out",
+                )
+                del running[index]
+
+    return [finished[index] for index in range(len(tasks))]
+
+
+async def _run_task_async(task, timeout=None):
+    """
+    Run every phase of a task on the current event loop.
+    """
+    import asyncio
+    result = CrawlResult(name=task.name)
+    start = time.monotonic()
+    scraper = None
+
+    async def run_phases():
+        for phase in task.phases:
+            phase_start = time.monotonic()
+            if phase == "crawl":
+                result.new_jobs += await scraper.ascrape_and_save_jobs(max_jobs=task.max_jobs, incremental=task.incremental) or 0
+                result.scraped_jobs += scraper.last_scraped_count
+            elif phase == "hydrate":
+                await scraper.ahydrate_descriptions()
+            elif phase == "update":
+                await scraper.aupdate_applications()
+            else:
+                raise ValueError(f"Unknown phase: {phase}")
+            result.phase_seconds[phase] = time.monotonic() - phase_start
+
+    try:
+        scraper = task.scraper_class(**task.kwargs)
+        result.name = scraper.company_name
+        if task.resume is not None:
+            scraper.resume = task.resume
+        await asyncio.wait_for(run_phases(), task.timeout or timeout)
+        result.status = "ok"
+    except asyncio.TimeoutError:
+        result.status = "timeout"
+        result.error = "Timed out"
+    except Exception as e:
+        result.status = "failed"
+        result.error = f"{type(e).__name__}: {str(e)}"
+        traceback.print_exc()
+    if scraper is not None:
+        try:
+            scraper.write_metrics()
+        except Exception as e:
+            print(f"Error writing metrics for {result.name}: {str(e)}")
+        await scraper.aclose()
+        scraper.close()
+    result.seconds = time.monotonic() - start
+    return result
+
+
+async def run_crawls_async(tasks, timeout=None):
+    """
+    Run crawl tasks concurrently on one event loop.
+
+    Task scraper classes must derive from AsyncBaseCareersScraper. Unlike
+    run_crawls, every company shares this process, so CPU-bound work (parsing,
+    filtering, saving) is not parallel; browser waits and network I/O are.
+
+    Args:
+        tasks: List of CrawlTask
+        timeout: Default per-task timeout in seconds, used when a task sets none
+
+    Returns:
+        List of CrawlResult in the same order as tasks
+    """
+    import asyncio
+    return list(await asyncio.gather(*(_run_task_async(task, timeout) for task in tasks)))
+
+
+def print_crawl_summary(results, wall_seconds=None):
+    """
+    Print a combined table of per-company status, new jobs and throughput.
+    """
+    from rich.console import Console
+    from rich.table import Table
+    table = Table(title="Crawl Summary", show_header=True, header_style="bold magenta")
+    table.add_column("Company", style="cyan")
+    table.add_column("Status")
+    table.add_column("New Jobs", justify="right")
+    table.add_column("Scraped", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Jobs/s", justify="right")
+    table.add_column("Error", style="red")
+
+    status_styles = {"ok": "green", "failed": "red", "timeout": "yellow"}
+    for result in results:
+        style = status_styles.get(result.status, "white")
+        table.add_row(
+            result.name,
+            f"[{style}]{result.status}[/{style}]",
+            str(result.new_jobs),
+            str(result.scraped_jobs),
+            f"{result.seconds:.1f}",
+            f"{result.throughput:.1f}",
+            result.error or "",
+        )
+
+    total_scraped = sum(result.scraped_jobs for result in results)
+    total_new = sum(result.new_jobs for result in results)
+    if wall_seconds:
+        table.add_row("total", "", str(total_new), str(total_scraped), f"{wall_seconds:.1f}", f"{total_scraped / wall_seconds:.1f}", "", style="bold")
+    Console().print(table)
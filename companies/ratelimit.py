@@ -0,0 +1,236 @@
+import os
+import time
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+
+# Statuses that mean the host wants us to slow down, on top of any 5xx
+_BACKOFF_STATUSES = {403, 429}
+
+# Longest Retry-After pause honored, in seconds
+_MAX_RETRY_AFTER = 120.0
+
+
+class HostLimiter:
+    """
+    Rate and concurrency limit for one host.
+
+    A token bucket caps the request rate, and an AIMD controller caps the number
+    of requests in flight. Both are halved when the host pushes back (a 429 or
+    403, a 5xx, a connection error or a latency spike) and grow additively while
+    responses stay healthy, so throughput settles just under what the host
+    tolerates. Until the first back off both double once per window of healthy
+    responses, as in TCP slow start, so a tolerant host is found quickly.
+    """
+
+    def __init__(self, rate=10.0, max_rate=100.0, min_rate=0.5, concurrency=4, max_concurrency=32,
+                 latency_factor=3.0, latency_floor=0.5, cooldown=1.0):
+        """
+        Args:
+            rate: Initial requests per second
+            max_rate: Ceiling the rate ramps up to
+            min_rate: Floor the rate backs off to
+            concurrency: Initial number of requests in flight
+            max_concurrency: Ceiling the concurrency ramps up to
+            latency_factor: A response this many times slower than the running
+                average latency counts as a latency spike
+            latency_floor: Responses faster than this many seconds never count as a spike
+            cooldown: Seconds after a back off during which further bad responses
+                (usually requests already in flight) do not back off again
+        """
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, rate)
+        self.limit = concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_factor = latency_factor
+        self.latency_floor = latency_floor
+        self.cooldown = cooldown
+
+        self.tokens = 1.0
+        self.in_flight = 0
+        self.latency = None
+        self.samples = 0
+        self.healthy_streak = 0
+        self.slow_start = True
+        self.paused_until = 0.0
+        self.last_backoff = float("-inf")
+        self._refilled_at = time.monotonic()
+        self._condition = threading.Condition()
+
+    def _refill(self, now):
+        # The bucket holds one concurrency window's worth of tokens
+        capacity = max(1.0, float(self.limit))
+        self.tokens = min(capacity, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.paused_until:
+                    timeout = self.paused_until - now
+                elif self.in_flight >= self.limit:
+                    timeout = None
+                elif self.tokens < 1:
+                    timeout = (1 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return time.monotonic() - start
+                self._condition.wait(timeout)
+
+    def release(self, latency, status=None, error=False, retry_after=None):
+        """
+        Report a finished request and adapt the limits to it.
+
+        Args:
+            latency: Seconds the request took
+            status: HTTP status code, if a response arrived
+            error: Whether the request failed without a response
+            retry_after: Seconds the host asked us to wait, if it said so
+
+        Returns:
+            True if the response made the limiter back off
+        """
+        with self._condition:
+            self.in_flight -= 1
+            overloaded = error or status in _BACKOFF_STATUSES or (status is not None and status >= 500)
+            if not overloaded and self.latency is not None and self.samples >= 5:
+                overloaded = latency > max(self.latency * self.latency_factor, self.latency_floor)
+            if not error:
+                self.latency = latency if self.latency is None else 0.9 * self.latency + 0.1 * latency
+                self.samples += 1
+
+            if overloaded:
+                overloaded = self._back_off(retry_after)
+            else:
+                self._ramp_up()
+            self._condition.notify_all()
+            return overloaded
+
+    def _back_off(self, retry_after):
+        now = time.monotonic()
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + min(retry_after, _MAX_RETRY_AFTER))
+        self.healthy_streak = 0
+        if now - self.last_backoff < self.cooldown:
+            return False
+        self.last_backoff = now
+        self.slow_start = False
+        self.limit = max(1, self.limit // 2)
+        self.rate = max(self.min_rate, self.rate / 2)
+        return True
+
+    def _ramp_up(self):
+        # One step per window of healthy responses, i.e. roughly once per round trip
+        self.healthy_streak += 1
+        if self.healthy_streak >= self.limit:
+            self.healthy_streak = 0
+            if self.slow_start:
+                self.limit = min(self.max_concurrency, self.limit * 2)
+                self.rate = min(self.max_rate, self.rate * 2)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1)
+                self.rate = min(self.max_rate, self.rate + 1)
+
+    def snapshot(self):
+        with self._condition:
+            return {"rate": self.rate, "concurrency": self.limit, "in_flight": self.in_flight, "latency": self.latency}
+
+
+class RateController:
+    """
+    Per-host limiters shared by every HTTP fetch path.
+
+    Requests to the same host share one HostLimiter however many sessions,
+    threads or scrapers send them.
+    """
+
+    def __init__(self, **limiter_kwargs):
+        """
+        Args:
+            limiter_kwargs: Settings for each host's HostLimiter
+        """
+        self.limiter_kwargs = limiter_kwargs
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """
+        Controller configured from CRAWLER_RATE, CRAWLER_MAX_RATE and CRAWLER_MAX_CONCURRENCY.
+
+        Returns:
+            RateController, or None if CRAWLER_RATE is 0 (rate control disabled)
+        """
+        rate = float(os.getenv("CRAWLER_RATE", "10"))
+        if rate <= 0:
+            return None
+        return cls(
+            rate=rate,
+            max_rate=max(rate, float(os.getenv("CRAWLER_MAX_RATE", "100"))),
+            max_concurrency=int(os.getenv("CRAWLER_MAX_CONCURRENCY", "32")),
+        )
+
+    def limiter(self, url):
+        """
+        The limiter for the host of url, created on first use.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._limiters:
+                self._limiters[host] = HostLimiter(**self.limiter_kwargs)
+            return self._limiters[host]
+
+    def snapshot(self):
+        """
+        Current limits of every host seen so far.
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {host: limiter.snapshot() for host, limiter in limiters.items()}
+
+
+_shared_controller = None
+_shared_lock = threading.Lock()
+
+
+def shared_rate_controller():
+    """
+    The process-wide RateController, created from the environment on first use.
+
+    Returns:
+        RateController, or None if rate control is disabled
+    """
+    global _shared_controller
+    with _shared_lock:
+        if _shared_controller is None:
+            _shared_controller = RateController.from_env() or False
+        return _shared_controller or None
+
+
+def retry_after_seconds(response):
+    """
+    Seconds from a response's Retry-After header, or None.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
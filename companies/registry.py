@@ -0,0 +1,31 @@
+import importlib
+
+
+# Scraper classes by company, as "module:class" so a command only imports the company it uses
+SCRAPERS = {
+    "meta": "companies.meta:MetaCareersScraper",
+    "tiktok": "companies.tiktok:TikTokCareersScrapper",
+}
+
+ASYNC_SCRAPERS = {
+    "meta": "companies.async_meta:AsyncMetaCareersScraper",
+    "tiktok": "companies.async_tiktok:AsyncTikTokCareersScrapper",
+}
+
+
+def scraper_class(company, use_async=False):
+    """
+    Import and return a company's scraper class.
+
+    Args:
+        company: Company name, a key of SCRAPERS
+        use_async: Return the async scraper (from ASYNC_SCRAPERS) instead
+
+    Returns:
+        The scraper class
+    """
+    registry = ASYNC_SCRAPERS if use_async else SCRAPERS
+    if company not in registry:
+        raise ValueError(f"Unknown company: {company}")
+    module_name, class_name = registry[company].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
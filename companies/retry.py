@@ -0,0 +1,242 @@
+import time
+import random
+import threading
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling a host whose circuit breaker is open.
+    """
+    pass
+
+
+class RetryPolicy:
+    """
+    How often and how long to wait before retrying a failed task.
+    """
+
+    def __init__(self, attempts=3, base_delay=1.0, max_delay=30.0, jitter=0.25):
+        """
+        Args:
+            attempts: Total attempts per task, including the first
+            base_delay: Seconds before the first retry; doubled for every later one
+            max_delay: Longest delay between attempts
+            jitter: Random fraction added to each delay so retries do not line up
+        """
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """
+        Seconds to wait before the given retry (1 for the first retry).
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 + random.random() * self.jitter)
+
+    def call(self, func, on_retry=None):
+        """
+        Call func, retrying with exponential backoff until it succeeds or attempts run out.
+
+        Args:
+            func: Callable taking no arguments
+            on_retry: Optional callable taking (attempt, error), called before each retry
+
+        Returns:
+            func's return value. The last error is raised if every attempt fails.
+        """
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return func()
+            except Exception as e:
+                if attempt == self.attempts:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, e)
+                time.sleep(self.delay(attempt))
+
+    async def acall(self, func, on_retry=None):
+        """
+        call() for a coroutine function, sleeping on the event loop between attempts.
+        """
+        import asyncio
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await func()
+            except Exception as e:
+                if attempt == self.attempts:
+                    raise
+                if on_retry is not None:
+                    on_retry(attempt, e)
+                await asyncio.sleep(self.delay(attempt))
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a host after repeated consecutive failures.
+
+    After `threshold` failures in a row the circuit opens and every call is
+    refused for `reset_after` seconds. Then a single probe call is let through:
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, threshold=5, reset_after=30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def retry_at(self):
+        """
+        Monotonic time at which an open circuit lets a probe through (0 when closed).
+        """
+        return self.opened_at + self.reset_after if self.opened_at is not None else 0.0
+
+    def allow(self):
+        """
+        Whether a call may go ahead now. Claims the probe of a half-open circuit.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.probing or time.monotonic() < self.retry_at:
+                return False
+            self.probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.threshold:
+                if self.opened_at is None:
+                    print(f"Circuit opened after {self.failures} consecutive failures; pausing for {self.reset_after:.0f}s")
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+
+class RetryQueue:
+    """
+    Deferred retries for one pass of per-item work.
+
+    Failed items are set aside with an exponential backoff instead of being
+    retried in place, so one slow or flaky item does not stall the pass. Once
+    the pass has been through every item, next_round() hands back the deferred
+    ones as they come due. Items that run out of attempts are kept in `failed`
+    with their last error.
+
+    Items held back by an open circuit were never tried, so those deferrals are
+    counted apart from attempts and do not replace an item's last real error.
+    After each take_due() (or next_round()), `last_retries` holds how many of the
+    items handed back are real re-attempts of a failure rather than circuit deferrals.
+    """
+
+    def __init__(self, policy=None, breaker=None, max_deferrals=10):
+        """
+        Args:
+            policy: RetryPolicy. Defaults to RetryPolicy().
+            breaker: CircuitBreaker for the host the pass talks to. Defaults to CircuitBreaker().
+            max_deferrals: Times an item may be held back by an open circuit before it is given up on
+        """
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.max_deferrals = max_deferrals
+        self.attempts = {}
+        self.deferrals = {}
+        self.errors = {}
+        self.failed = {}
+        self.last_retries = 0
+        self._deferred = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._deferred)
+
+    def allow(self, key, item):
+        """
+        Check the circuit breaker before working on an item.
+
+        Returns:
+            True if the item may be worked on now. Otherwise it has been deferred
+            until the circuit lets a probe through (or failed, if the circuit has
+            held it back max_deferrals times) and the caller should move on.
+        """
+        if self.breaker.allow():
+            return True
+        with self._lock:
+            deferrals = self.deferrals.get(key, 0) + 1
+            self.deferrals[key] = deferrals
+            if deferrals > self.max_deferrals:
+                self.failed[key] = self.errors.get(key, f"{CircuitOpenError.__name__}: circuit stayed open, never sent")
+            else:
+                self._deferred.append((self.breaker.retry_at, key, item, False))
+        return False
+
+    def succeeded(self, key):
+        self.breaker.record_success()
+        with self._lock:
+            self.failed.pop(key, None)
+
+    def failed_attempt(self, key, item, error):
+        """
+        Record a failed attempt and defer the item, or give up on it.
+
+        Returns:
+            True if the item will be retried
+        """
+        self.breaker.record_failure()
+        with self._lock:
+            attempt = self.attempts.get(key, 0) + 1
+            self.attempts[key] = attempt
+            self.errors[key] = f"{type(error).__name__}: {str(error)}"
+            if attempt >= self.policy.attempts:
+                self.failed[key] = self.errors[key]
+                return False
+            self._deferred.append((time.monotonic() + self.policy.delay(attempt), key, item, True))
+            return True
+
+    def due_in(self):
+        """
+        Seconds until the earliest deferred item comes due, or None if nothing is deferred.
+        """
+        with self._lock:
+            if not self._deferred:
+                return None
+            return max(0.0, min(entry[0] for entry in self._deferred) - time.monotonic())
+
+    def take_due(self):
+        """
+        Remove and return every deferred item that is due now.
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [entry for entry in self._deferred if entry[0] <= now]
+            self._deferred = [entry for entry in self._deferred if entry[0] > now]
+            self.last_retries = sum(1 for entry in due if entry[3])
+        return [item for _, _, item, _ in sorted(due, key=lambda entry: entry[0])]
+
+    def next_round(self):
+        """
+        Wait for the earliest deferred item to come due and return every item due by then.
+
+        Async callers await asyncio.sleep(due_in()) and call take_due() instead.
+
+        Returns:
+            List of items, empty when nothing is left to retry
+        """
+        wait = self.due_in()
+        if wait is None:
+            self.last_retries = 0
+            return []
+        time.sleep(wait)
+        return self.take_due()
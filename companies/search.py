@@ -0,0 +1,265 @@
+import os
+import sqlite3
+from contextlib import closing
+
+
+# Indexed jobs_df columns, and their BM25 weights in ranked search
+INDEXED_COLUMNS = {"title": 5.0, "requirement": 1.0, "description": 1.0}
+
+# The trigram tokenizer cannot match substrings shorter than this
+MIN_SUBSTRING_LENGTH = 3
+
+# Bumped whenever the index layout changes; an index with another version is rebuilt
+INDEX_VERSION = 2
+
+_FINGERPRINT_MASK = 2 ** 64 - 1
+
+
+def _hash_ids(ids):
+    import numpy as np
+    import pandas as pd
+    return pd.util.hash_array(np.asarray(ids, dtype=object))
+
+
+def _hash_lengths(id_hashes, lengths):
+    # Sum of per-row hashes of (id, length), so rows can be added and replaced
+    # without rehashing the rest
+    import numpy as np
+    import pandas as pd
+    if len(id_hashes) == 0:
+        return 0
+    length_hashes = pd.util.hash_array(np.asarray(lengths, dtype="int64"))
+    return int((id_hashes ^ (length_hashes * np.uint64(0x9E3779B97F4A7C15))).sum()) & _FINGERPRINT_MASK
+
+
+def _row_fingerprints(rows):
+    # fingerprints() of (id, *texts) rows as stored in the index
+    id_hashes = _hash_ids([row[0] for row in rows])
+    return {
+        column: _hash_lengths(id_hashes, [len(row[position + 1]) for row in rows])
+        for position, column in enumerate(INDEXED_COLUMNS)
+    }
+
+
+def fingerprints(df, columns=None):
+    """
+    Order-independent fingerprint of a jobs frame's indexed content, per column:
+    every job id and the length of its text in that column.
+
+    Cheap enough to compare on every sync, and it changes when a job is added,
+    replaced or has its text edited (to a different length) outside this process.
+
+    Args:
+        df: Jobs DataFrame
+        columns: Indexed columns to fingerprint. Defaults to every indexed column.
+
+    Returns:
+        Dict mapping column to its fingerprint
+    """
+    import numpy as np
+    id_hashes = _hash_ids(df["id"].astype(str).to_numpy(dtype=object))
+    result = {}
+    for column in INDEXED_COLUMNS if columns is None else columns:
+        if column in df.columns:
+            lengths = df[column].astype("string").str.len().fillna(0).to_numpy(dtype="int64")
+        else:
+            lengths = np.zeros(len(df), dtype="int64")
+        result[column] = _hash_lengths(id_hashes, lengths)
+    return result
+
+
+class SearchIndex:
+    """
+    Persistent full-text index over job titles, requirements and descriptions.
+
+    Job texts live once in a docs table, indexed by two external-content FTS5 tables:
+
+    - words: porter-stemmed words, for ranked BM25 search with boolean operators
+      (AND, OR, NOT), "phrase" queries, prefix* terms and column filters (title:...)
+    - grams: trigrams, answering the case-insensitive substring rules of the job
+      filters exactly without scanning every text
+
+    Updates only re-index jobs whose text changed, so the index is kept current
+    incrementally as jobs are saved.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = list(INDEXED_COLUMNS)
+        with closing(self._connect()) as conn, conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                self._create(conn)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _create(self, conn):
+        for table in ("words", "grams", "docs", "meta"):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        columns = ", ".join(self.columns)
+        conn.execute(f"CREATE TABLE docs (rowid INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL, {columns})")
+        conn.execute(f"CREATE VIRTUAL TABLE words USING fts5({columns}, content='docs', content_rowid='rowid', tokenize='porter unicode61 remove_diacritics 2')")
+        conn.execute(f"CREATE VIRTUAL TABLE grams USING fts5({columns}, content='docs', content_rowid='rowid', tokenize='trigram')")
+        conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT count(*) FROM docs").fetchone()[0]
+
+    def fingerprints(self):
+        """
+        fingerprints() of the jobs the index was last brought in line with (empty if unknown).
+        """
+        with closing(self._connect()) as conn:
+            return self._stored_fingerprints(conn)
+
+    @staticmethod
+    def _stored_fingerprints(conn):
+        rows = conn.execute("SELECT key, value FROM meta WHERE key LIKE 'fingerprint:%'").fetchall()
+        return {key.split(":", 1)[1]: int(value) for key, value in rows}
+
+    @staticmethod
+    def _set_fingerprints(conn, values):
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(f"fingerprint:{column}", str(value & _FINGERPRINT_MASK)) for column, value in values.items()],
+        )
+
+    @staticmethod
+    def _rows(df):
+        ids = df["id"].astype(str).tolist()
+        texts = [df[column].fillna("").astype(str).tolist() if column in df.columns else [""] * len(df) for column in INDEXED_COLUMNS]
+        return zip(ids, *texts)
+
+    def _stored(self, conn, ids):
+        # Stay under SQLite's bound-parameter limit
+        stored = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT id, rowid, {', '.join(self.columns)} FROM docs WHERE id IN ({', '.join('?' for _ in chunk)})", chunk
+            ).fetchall()
+            stored.update({row[0]: (row[1], row[2:]) for row in rows})
+        return stored
+
+    def _index_docs(self, conn, ids=None):
+        # Add the current text of the given docs (all when ids is None) to both FTS tables.
+        # Set-based inserts are far faster than one insert (or trigger) per row.
+        columns = ", ".join(self.columns)
+        if ids is None:
+            selections = [("", ())]
+        else:
+            chunks = [ids[start:start + 500] for start in range(0, len(ids), 500)]
+            selections = [(f" WHERE id IN ({', '.join('?' for _ in chunk)})", chunk) for chunk in chunks]
+        for where, params in selections:
+            for table in ("words", "grams"):
+                conn.execute(f"INSERT INTO {table}(rowid, {columns}) SELECT rowid, {columns} FROM docs{where}", params)
+
+    def update(self, df):
+        """
+        Index new jobs and re-index jobs whose text changed.
+
+        Args:
+            df: Jobs DataFrame holding the rows to index
+        """
+        if df is None or len(df) == 0:
+            return
+        rows = list(self._rows(df))
+        columns = ", ".join(self.columns)
+        with closing(self._connect()) as conn, conn:
+            stored = self._stored(conn, [row[0] for row in rows])
+            changed = [(stored[row[0]], row) for row in rows if row[0] in stored and stored[row[0]][1] != row[1:]]
+            new = [row for row in rows if row[0] not in stored]
+
+            # An external-content FTS table forgets a row by being given its old text
+            for table in ("words", "grams"):
+                conn.executemany(
+                    f"INSERT INTO {table}({table}, rowid, {columns}) VALUES ('delete', ?, {', '.join('?' for _ in self.columns)})",
+                    [(rowid, *old) for (rowid, old), _ in changed],
+                )
+            conn.executemany(
+                f"UPDATE docs SET {', '.join(f'{column} = ?' for column in self.columns)} WHERE rowid = ?",
+                [(*row[1:], rowid) for (rowid, _), row in changed],
+            )
+            conn.executemany(f"INSERT INTO docs (id, {columns}) VALUES ({', '.join('?' for _ in range(len(self.columns) + 1))})", new)
+            self._index_docs(conn, [row[0] for _, row in changed] + [row[0] for row in new])
+
+            # Swap the replaced rows' share of the fingerprints for the new texts'
+            current = self._stored_fingerprints(conn)
+            if current:
+                removed = _row_fingerprints([(row[0], *old) for (_, old), row in changed])
+                added = _row_fingerprints([row for _, row in changed] + new)
+                self._set_fingerprints(conn, {column: value - removed[column] + added[column] for column, value in current.items()})
+
+    def rebuild(self, df):
+        """
+        Replace the whole index with the jobs in df.
+        """
+        columns = ", ".join(self.columns)
+        with closing(self._connect()) as conn, conn:
+            self._create(conn)
+            rows = list(self._rows(df))
+            conn.executemany(f"INSERT INTO docs (id, {columns}) VALUES ({', '.join('?' for _ in range(len(self.columns) + 1))})", rows)
+            self._index_docs(conn)
+            self._set_fingerprints(conn, _row_fingerprints(rows))
+
+    @staticmethod
+    def _phrase(text):
+        return '"' + text.replace('"', '""') + '"'
+
+    def substring_ids(self, column, patterns):
+        """
+        Ids of jobs whose column contains any of the patterns, ignoring case.
+
+        Args:
+            column: One of the indexed columns
+            patterns: Literal substrings, each at least MIN_SUBSTRING_LENGTH characters long
+
+        Returns:
+            Set of job ids
+        """
+        query = f"{column} : ({' OR '.join(self._phrase(pattern) for pattern in patterns)})"
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT docs.id FROM grams JOIN docs ON docs.rowid = grams.rowid WHERE grams MATCH ?", (query,)).fetchall()
+        return {row[0] for row in rows}
+
+    def search(self, query, limit=20):
+        """
+        Ranked full-text search.
+
+        Args:
+            query: FTS5 query, e.g. 'python AND "distributed systems" NOT intern' or 'title:manager'
+            limit: Maximum number of results
+
+        Returns:
+            List of (job_id, score) tuples, best match first
+
+        Raises:
+            ValueError: If the query is not valid FTS5 syntax
+        """
+        weights = ", ".join(str(weight) for weight in INDEXED_COLUMNS.values())
+        statement = (
+            f"SELECT docs.id, -bm25(words, {weights}) AS score FROM words JOIN docs ON docs.rowid = words.rowid "
+            f"WHERE words MATCH ? ORDER BY bm25(words, {weights}) LIMIT ?"
+        )
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(statement, (query, limit)).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query {query!r}: {str(e)}") from e
+
+
+def open_search_index(csv_path):
+    """
+    Open the search index next to a company's jobs, unless CRAWLER_SEARCH_INDEX=0.
+
+    Returns:
+        A SearchIndex, or None if jobs are not indexed
+    """
+    if os.getenv("CRAWLER_SEARCH_INDEX", "1") == "0":
+        return None
+    root, _ = os.path.splitext(csv_path)
+    return SearchIndex(f"{root}_index.sqlite")
@@ -0,0 +1,77 @@
+import os
+import json
+import time
+import hashlib
+
+
+class SessionCache:
+    """
+    On-disk cache of a logged-in browser storage state (cookies and local storage).
+
+    One file is kept per company and account so later runs can skip the
+    interactive login until the session expires.
+    """
+
+    def __init__(self, company_name, account, directory=None, max_age=7 * 24 * 3600):
+        """
+        Args:
+            company_name: Name of the company the session belongs to
+            account: Account identifier (login email); only its hash is written to disk
+            directory: Optional directory for session files. Defaults to data/<company>_careers/sessions
+            max_age: Maximum age in seconds before a cached session is considered stale
+        """
+        if directory is None:
+            directory = f"data/{company_name.lower()}_careers/sessions"
+        account_key = hashlib.sha256((account or "anonymous").encode()).hexdigest()[:16]
+        self.path = os.path.join(directory, f"{account_key}.json")
+        self.max_age = max_age
+
+    def load(self):
+        """
+        Load the cached storage state if it passes the cheap expiry checks.
+
+        Returns:
+            Storage state dict usable with browser.new_context(storage_state=...), or None
+        """
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not self.is_fresh(cached):
+            return None
+        return cached.get("storage_state")
+
+    def is_fresh(self, cached):
+        """
+        Check the cached entry's age and cookie expiry without touching the network.
+        """
+        now = time.time()
+        if now - cached.get("saved_at", 0) > self.max_age:
+            return False
+        cookies = cached.get("storage_state", {}).get("cookies", [])
+        # Session cookies report expires == -1 and live as long as the state does
+        expiring = [cookie["expires"] for cookie in cookies if cookie.get("expires", -1) > 0]
+        if expiring and max(expiring) < now:
+            return False
+        return bool(cookies)
+
+    def save(self, storage_state):
+        """
+        Persist a storage state, readable only by the current user.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"saved_at": time.time(), "storage_state": storage_state}, f)
+        os.replace(tmp_path, self.path)
+
+    def invalidate(self):
+        """
+        Drop the cached session so the next run logs in again.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,353 @@
+import os
+import ast
+import glob
+import json
+import time
+import zlib
+import sqlite3
+from abc import ABC, abstractmethod
+from contextlib import closing
+
+
+def _is_missing(value):
+    if value is None or isinstance(value, str):
+        return value is None
+    import pandas as pd
+    return not isinstance(value, (list, dict, tuple)) and pd.isna(value)
+
+
+def parse_nested(value):
+    """
+    Parse a stringified list/dict written by an older CSV save back into Python objects.
+    """
+    if isinstance(value, str) and value[:1] in ("[", "{"):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+    return value
+
+
+def read_legacy_csv(path):
+    """
+    Read a jobs CSV written by DataFrame.to_csv, restoring nested columns.
+
+    Returns:
+        DataFrame, or None if the file does not exist
+    """
+    import pandas as pd
+    if not os.path.exists(path):
+        return None
+    df = pd.read_csv(path, dtype={"id": str})
+    for column in df.columns:
+        if df[column].dtype == object or pd.api.types.is_string_dtype(df[column]):
+            sample = df[column].dropna()
+            if len(sample) > 0 and str(sample.iloc[0])[:1] in ("[", "{"):
+                df[column] = df[column].map(parse_nested).astype(object)
+    return df
+
+
+class JobStore(ABC):
+    """
+    Storage backend for a company's jobs, keyed by job id.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @abstractmethod
+    def load(self, columns=None):
+        """
+        Load stored jobs.
+
+        Args:
+            columns: Optional list of columns to load. The id column is always included.
+
+        Returns:
+            DataFrame of jobs, or None if nothing has been stored yet
+        """
+        pass
+
+    @abstractmethod
+    def upsert(self, df):
+        """
+        Insert new jobs and update existing ones, matching on the id column.
+
+        Args:
+            df: DataFrame holding only the rows that changed
+        """
+        pass
+
+
+class CSVJobStore(JobStore):
+    """
+    Legacy single-file CSV store. Every save rewrites the whole file.
+    """
+
+    def load(self, columns=None):
+        df = read_legacy_csv(self.path)
+        if df is not None and columns is not None:
+            df = df[["id"] + [column for column in columns if column != "id" and column in df.columns]]
+        return df
+
+    def upsert(self, df):
+        import pandas as pd
+        existing = read_legacy_csv(self.path)
+        if existing is not None:
+            df = pd.concat([existing, df], ignore_index=True).drop_duplicates(subset="id", keep="last")
+        df.to_csv(self.path, index=False)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite store with one row per job.
+
+    Columns are added as new fields appear. Nested values (lists and dicts such as
+    Meta's locations or TikTok's city_info) are stored as JSON and decoded back to
+    Python objects on load, so callers never re-parse stringified values.
+    """
+
+    def __init__(self, path, legacy_csv_path=None):
+        super().__init__(path)
+        if not os.path.exists(path) and legacy_csv_path is not None:
+            legacy_df = read_legacy_csv(legacy_csv_path)
+            if legacy_df is not None:
+                print(f"Migrating {len(legacy_df)} jobs from {legacy_csv_path} to {path}")
+                self.upsert(legacy_df)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY)")
+        conn.execute("CREATE TABLE IF NOT EXISTS job_columns (name TEXT PRIMARY KEY, kind TEXT NOT NULL, position INTEGER NOT NULL)")
+        return conn
+
+    @staticmethod
+    def _quote(name):
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @staticmethod
+    def _infer_kind(series):
+        import numpy as np
+        import pandas as pd
+        sample = series.dropna()
+        if len(sample) == 0:
+            return "text"
+        value = sample.iloc[0]
+        if isinstance(value, (list, dict, tuple)):
+            return "json"
+        if pd.api.types.is_bool_dtype(series) or isinstance(value, (bool, np.bool_)):
+            return "bool"
+        if pd.api.types.is_integer_dtype(series):
+            return "int"
+        if pd.api.types.is_float_dtype(series):
+            return "real"
+        return "text"
+
+    @staticmethod
+    def _encode(value, kind):
+        if _is_missing(value):
+            return None
+        if kind == "json":
+            return json.dumps(value, default=str)
+        if kind == "bool":
+            return int(bool(value))
+        if kind == "int":
+            return int(value)
+        if kind == "real":
+            return float(value)
+        return str(value)
+
+    def _column_kinds(self, conn):
+        rows = conn.execute("SELECT name, kind FROM job_columns ORDER BY position").fetchall()
+        return dict(rows)
+
+    def load(self, columns=None):
+        import pandas as pd
+        if not os.path.exists(self.path):
+            return None
+        with closing(self._connect()) as conn:
+            kinds = self._column_kinds(conn)
+            if not kinds:
+                return None
+            names = [name for name in kinds if columns is None or name in columns or name == "id"]
+            query = f"SELECT {', '.join(self._quote(name) for name in names)} FROM jobs"
+            df = pd.read_sql_query(query, conn)
+
+        for name in names:
+            kind = kinds[name]
+            if kind == "json":
+                df[name] = df[name].map(lambda value: json.loads(value) if isinstance(value, str) else None).astype(object)
+            elif kind == "bool":
+                df[name] = df[name].map({1: True, 0: False}).fillna(False).astype(bool)
+        df["id"] = df["id"].astype(str)
+        return df
+
+    def upsert(self, df):
+        if df is None or len(df) == 0:
+            return
+        df = df.copy()
+        df["id"] = df["id"].astype(str)
+        with closing(self._connect()) as conn, conn:
+            kinds = self._column_kinds(conn)
+            if "id" not in kinds:
+                conn.execute("INSERT INTO job_columns VALUES ('id', 'text', 0)")
+                kinds["id"] = "text"
+            for name in df.columns:
+                if name not in kinds:
+                    kind = self._infer_kind(df[name])
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {self._quote(name)}")
+                    conn.execute("INSERT INTO job_columns VALUES (?, ?, ?)", (name, kind, len(kinds)))
+                    kinds[name] = kind
+
+            names = list(df.columns)
+            placeholders = ", ".join("?" for _ in names)
+            updates = ", ".join(f"{self._quote(name)} = excluded.{self._quote(name)}" for name in names if name != "id")
+            statement = (
+                f"INSERT INTO jobs ({', '.join(self._quote(name) for name in names)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+            )
+            column_kinds = [kinds[name] for name in names]
+            rows = (
+                tuple(self._encode(value, kind) for value, kind in zip(record, column_kinds))
+                for record in df.itertuples(index=False, name=None)
+            )
+            conn.executemany(statement, rows)
+
+
+class ParquetJobStore(JobStore):
+    """
+    Parquet store written as append-only delta files in a directory.
+
+    Each upsert writes only the changed rows to a new part file; loading keeps the
+    latest version of each id. Parts are compacted into one file once there are
+    more than max_parts of them. Requires pyarrow.
+    """
+
+    def __init__(self, path, legacy_csv_path=None, max_parts=32):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("The parquet storage backend requires pyarrow (pip install pyarrow)") from e
+        super().__init__(path)
+        self.max_parts = max_parts
+        if not os.path.exists(path) and legacy_csv_path is not None:
+            legacy_df = read_legacy_csv(legacy_csv_path)
+            if legacy_df is not None:
+                print(f"Migrating {len(legacy_df)} jobs from {legacy_csv_path} to {path}")
+                self.upsert(legacy_df)
+
+    def _parts(self):
+        return sorted(glob.glob(os.path.join(self.path, "part-*.parquet")))
+
+    @staticmethod
+    def _part_columns(part, columns):
+        # Older parts may predate some of the requested columns
+        if columns is None:
+            return None
+        import pyarrow.parquet as pq
+        names = set(pq.read_schema(part).names)
+        return ["id"] + [column for column in columns if column != "id" and column in names]
+
+    def load(self, columns=None):
+        import pandas as pd
+        parts = self._parts()
+        if not parts:
+            return None
+        frames = [pd.read_parquet(part, columns=self._part_columns(part, columns)) for part in parts]
+        df = pd.concat(frames, ignore_index=True).drop_duplicates(subset="id", keep="last")
+        return df.reset_index(drop=True)
+
+    def upsert(self, df):
+        if df is None or len(df) == 0:
+            return
+        os.makedirs(self.path, exist_ok=True)
+        df = df.copy()
+        df["id"] = df["id"].astype(str)
+        df.to_parquet(os.path.join(self.path, f"part-{time.time_ns()}.parquet"), index=False)
+
+        parts = self._parts()
+        if len(parts) > self.max_parts:
+            compacted = self.load()
+            compacted.to_parquet(os.path.join(self.path, f"part-{time.time_ns()}.parquet"), index=False)
+            for part in parts:
+                os.remove(part)
+
+
+class RawPayloadStore:
+    """
+    Cold storage for the raw API payload of every job, keyed by job id.
+
+    jobs_df keeps only the normalized Job fields; the full payloads are kept
+    here, zlib-compressed, for the rare cases that need a field the schema
+    dropped. Nothing reads them during a normal crawl or filter pass.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS payloads (id TEXT PRIMARY KEY, payload BLOB NOT NULL)")
+        return conn
+
+    def put_many(self, payloads):
+        """
+        Store payloads, replacing any stored under the same id.
+
+        Args:
+            payloads: Dict mapping job id to its raw payload dict
+        """
+        if not payloads:
+            return
+        rows = (
+            (str(job_id), zlib.compress(json.dumps(payload, default=str).encode()))
+            for job_id, payload in payloads.items()
+        )
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO payloads VALUES (?, ?)", rows)
+
+    def get(self, job_id):
+        """
+        The raw payload stored for a job, or None.
+        """
+        if not os.path.exists(self.path):
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT payload FROM payloads WHERE id = ?", (str(job_id),)).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+
+def open_raw_store(csv_path):
+    """
+    Open the raw payload store next to a company's jobs, unless CRAWLER_RAW_STORE=0.
+
+    Returns:
+        A RawPayloadStore, or None if raw payloads are not kept
+    """
+    if os.getenv("CRAWLER_RAW_STORE", "1") == "0":
+        return None
+    root, _ = os.path.splitext(csv_path)
+    return RawPayloadStore(f"{root}_raw.sqlite")
+
+
+def open_job_store(backend, csv_path):
+    """
+    Open the job store for a backend name, deriving its path from the CSV path.
+
+    Args:
+        backend: One of "sqlite", "parquet" or "csv"
+        csv_path: Path of the company's jobs CSV; existing CSV data is migrated on first use
+
+    Returns:
+        A JobStore instance
+    """
+    root, _ = os.path.splitext(csv_path)
+    if backend == "sqlite":
+        return SQLiteJobStore(f"{root}.sqlite", legacy_csv_path=csv_path)
+    if backend == "parquet":
+        return ParquetJobStore(f"{root}.parquet", legacy_csv_path=csv_path)
+    if backend == "csv":
+        return CSVJobStore(csv_path)
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -1,16 +1,17 @@
 import os
-import ast
-from playwright.sync_api import sync_playwright
-import pandas as pd
-from rich.console import Console
-from rich.table import Table
+import json
+from concurrent.futures import ThreadPoolExecutor
 from .base import BaseCareersScraper
+from .jobs import Job, concat_jobs
 
 
 BASE_URL = "https://lifeattiktok.com"
 
+# Checkbox group that appears once the location filter is open
+LOCATION_OPTIONS_SELECTOR = '[data-testid="checkbox-group"]'
+
 class TikTokCareersScrapper(BaseCareersScraper):
-    def __init__(self, base_url=BASE_URL, keyword="software engineer", recruitment_id_list="", job_category_id_list="", subject_id_list="", locations=None):
+    def __init__(self, base_url=BASE_URL, keyword="software engineer", recruitment_id_list="", job_category_id_list="", subject_id_list="", locations=None, use_api=True, concurrency=8, lean=None, storage=None):
         # TikTok-specific default locations
         default_locations = [
             "Austin", "Chicago", "Los Angeles", "New York", "San Francisco", "San Jose", "Seattle", "Washington DC"
@@ -20,7 +21,9 @@ class TikTokCareersScrapper(BaseCareersScraper):
         super().__init__(
             company_name="tiktok",
             base_url=base_url,
-            locations=default_locations
+            locations=default_locations,
+            lean=lean,
+            storage=storage
         )
         
         # TikTok-specific attributes
@@ -28,6 +31,9 @@ class TikTokCareersScrapper(BaseCareersScraper):
         self.recruitment_id_list = recruitment_id_list
         self.job_category_id_list = job_category_id_list
         self.subject_id_list = subject_id_list
+        # Page the posts endpoint directly instead of clicking through the UI
+        self.use_api = use_api
+        self.concurrency = concurrency
         self.primary_url = f"{self.base_url}/search?keyword={self.keyword.replace(' ', '+')}&recruitment_id_list={self.recruitment_id_list}&job_category_id_list={self.job_category_id_list}&subject_id_list={self.subject_id_list}&location_code_list="
 
         # Also scrapes the applied page and compares the job and updates the csv file
@@ -61,28 +67,20 @@ class TikTokCareersScrapper(BaseCareersScraper):
                 "does not provide sponsorship",
             ]
         }
+        self.qualification_column = "requirement"
+        self.location_column = "locations"
+        self.location_exact = True
     
-    def filter_and_find_applications(self):
-        filtered_df = self.jobs_df[self.jobs_df['applied'] == False]
+    def job_from_payload(self, payload):
+        return Job.from_tiktok(payload)
 
-        include_mask = self.jobs_df['title'].str.contains('|'.join(self.name_filters['include']), case=False, na=False)
-        exclude_mask = self.jobs_df['title'].str.contains('|'.join(self.name_filters['exclude']), case=False, na=False)
-        qualification_include_mask = self.jobs_df['requirement'].str.contains('|'.join(self.qualification_filters['include']), case=False, na=False)
-        qualification_exclude_mask = self.jobs_df['requirement'].str.contains('|'.join(self.qualification_filters['exclude']), case=False, na=False)
-        final_mask = include_mask & ~exclude_mask & ~qualification_exclude_mask & qualification_include_mask
-        
-        filtered_df = filtered_df[final_mask]
-        filter_indices = []
-        for index, row in filtered_df.iterrows():
-            # Handle both string and dict types for city_info
-            city_info = row.city_info
-            if isinstance(city_info, str):
-                city_info = ast.literal_eval(city_info)
-            city_name = city_info.get("en_name", "") if isinstance(city_info, dict) else ""
-            if city_name in self.location_filters:
-                filter_indices.append(index)
-        
-        final_filtered_df = filtered_df.loc[filter_indices]
+    def _job_url(self, job_id):
+        return f"{self.base_url}/search/{job_id}"
+
+    def filter_and_find_applications(self):
+        from rich.console import Console
+        from rich.table import Table
+        final_filtered_df = self.filter_jobs()
         console = Console()
         
         if len(final_filtered_df) > 0:
@@ -94,7 +92,7 @@ class TikTokCareersScrapper(BaseCareersScraper):
             for index, row in final_filtered_df.iterrows():
                 job_code = str(row['code'])
                 role = row['title']
-                apply_link = f"{self.base_url}/search/{row['id']}"
+                apply_link = self._job_url(row['id'])
                 table.add_row(job_code, role, apply_link)
             
             console.print(table)
@@ -102,8 +100,17 @@ class TikTokCareersScrapper(BaseCareersScraper):
             console.print(f"[yellow]No filtered applications found.[/yellow]")
 
 
+    def print_application_details(self):
+        # filter_and_find_applications prints the TikTok table itself
+        self.filter_and_find_applications()
+
     def update_applications(self):
-        applications = self.scrape_applied_page()
+        self._apply_applications(self.scrape_applied_page())
+
+    def _apply_applications(self, applications):
+        """
+        Mark the jobs in the scraped application list as applied and save them.
+        """
         print(f"Total applications found: {len(applications) if applications else 0}")
 
         if applications is None or self.jobs_df is None:
@@ -111,59 +118,134 @@ class TikTokCareersScrapper(BaseCareersScraper):
             return
         
         applied_job_ids = set(str(job['job_post_info']['id']) for job in applications)
-        for index, row in self.jobs_df.iterrows():
-            if row['id'] in applied_job_ids:
-                self.jobs_df.at[index, 'applied'] = True
+        newly_applied = self.jobs_df['id'].isin(applied_job_ids) & (self.jobs_df['applied'] != True)
+        self.jobs_df.loc[newly_applied, 'applied'] = True
         
-        self.jobs_df.to_csv(self.file_path, index=False)
+        self._save_jobs(self.jobs_df.loc[newly_applied, 'id'])
         print("Updated applications in the jobs dataframe.")
 
-    def scrape_and_save_jobs(self, max_jobs=None):
-        jobs = self.scrape_careers_page(max_jobs=max_jobs)
+    def scrape_and_save_jobs(self, max_jobs=None, incremental=None):
+        if incremental is not None:
+            self.incremental = incremental
+        return self._save_scraped_jobs(self.scrape_careers_page(max_jobs=max_jobs))
+
+    def _save_scraped_jobs(self, jobs):
+        """
+        Append the new jobs from a crawl to self.jobs_df, save them and flag closed jobs.
+        
+        Args:
+            jobs: Dictionary mapping job_id to job data from scrape_careers_page, or None
+            
+        Returns:
+            Number of new jobs saved
+        """
+        if jobs is None:
+            print("No jobs scraped")
+            return 0
+        self.last_scraped_count = len(jobs)
         previous_jobs = set(str(id) for id in self.jobs_df["id"].values) if self.jobs_df is not None else set()
         new_jobs = {job_id: job for job_id, job in jobs.items() if str(job_id) not in previous_jobs}
 
         if new_jobs:
-            # Convert jobs dictionary to DataFrame
-            jobs_list = list(new_jobs.values())
-            new_jobs_df = pd.DataFrame(jobs_list)
-            new_jobs_df["applied"] = False
-            new_jobs_df["id"] = new_jobs_df["id"].astype(str)
-            # Save to CSV
+            new_jobs_df = self._new_jobs_frame(list(new_jobs.values()))
             try:
                 if self.jobs_df is not None:
-                    self.jobs_df = pd.concat([self.jobs_df, new_jobs_df], ignore_index=True)
+                    self.jobs_df = concat_jobs([self.jobs_df, new_jobs_df])
                 else:
                     self.jobs_df = new_jobs_df
-                self.jobs_df.to_csv(self.file_path, index=False)
-                print(f"Updated {len(new_jobs)} new jobs to {self.file_path}")
+                self._save_jobs(new_jobs_df["id"], new=True)
+                print(f"Updated {len(new_jobs)} new jobs to {self.store.path}")
             except Exception as e:
                 print(f"Error updating jobs dataframe: {str(e)}")
                 self.jobs_df = new_jobs_df
         else:
             print("No new jobs found")
+
+        # Only a crawl that covered the whole listing can tell which jobs disappeared
+        if self.last_crawl_complete:
+            self._mark_closed_jobs(jobs.keys())
+        # The crawl's jobs are stored now, so its checkpoint is no longer needed
+        self._crawl_checkpoint().clear()
+        return len(new_jobs)
+
+    def _crawl_checkpoint(self):
+        """
+        Checkpoint for the posts crawl, keyed by the search URL and selected locations.
+        """
+        return self._checkpoint("crawl", key=json.dumps([self.primary_url, sorted(self.locations)]))
+
+    @staticmethod
+    def _listing_complete(total_jobs, page_size, last_page_size):
+        """
+        Whether a crawl reached the end of the posts listing.
+
+        Only a known, positive posts count whose final page came back short or
+        empty shows that. A missing or stale count can't tell which jobs closed.
+
+        Args:
+            total_jobs: Posts count reported by the endpoint (0 or None if never captured)
+            page_size: Posts per page
+            last_page_size: Number of posts on the final page fetched, or None if it was not fetched
+        """
+        return isinstance(total_jobs, int) and total_jobs > 0 and last_page_size is not None and last_page_size < page_size
+
+    def _resume_posts(self, checkpoint, max_jobs=None, known_ids=None):
+        """
+        Replay the pages journaled by an interrupted crawl when resuming.
+
+        Returns:
+            Tuple of (jobs found, run of consecutive all-known pages, dict mapping each
+            fetched offset to the number of posts on its page)
+        """
+        jobs_found, known_streak, fetched = {}, 0, {}
+        if self._resume_state(checkpoint) is not None:
+            for entry in checkpoint.journal():
+                known_streak = self._collect_posts(entry["jobs"], jobs_found, max_jobs, known_ids, known_streak)
+                fetched[entry["offset"]] = len(entry["jobs"])
+        return jobs_found, known_streak, fetched
     
-    def scrape_applied_page(self):
+    def _login(self, page):
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                page = browser.new_page()
-                page.goto(self.applications_url, wait_until="networkidle")
-                page.wait_for_load_state("domcontentloaded")
-                page.wait_for_timeout(2000)
+            page.goto(self.applications_url, wait_until="domcontentloaded")
+
+            sign_in_with_email = page.get_by_text("Sign in with Email").first
+            self._wait_for_locator(sign_in_with_email, phase="login", budget=2000)
+            sign_in_with_email.click()
 
-                sign_in_with_email = page.get_by_text("Sign in with Email").first
-                sign_in_with_email.click()
-                page.wait_for_timeout(5000)
+            email_input = page.locator('input[placeholder="Email"]').first
+            self._wait_for_locator(email_input, phase="login", budget=5000)
+            email_input.fill(self.login_email)
+            password_input = page.locator('input[placeholder="Password"]').first
+            password_input.fill(self.login_password)
 
-                email_input = page.locator('input[placeholder="Email"]').first
-                email_input.fill(self.login_email)
-                password_input = page.locator('input[placeholder="Password"]').first
-                password_input.fill(self.login_password)
+            agree_terms_checkbox = page.locator('input[type="checkbox"]').first
+            agree_terms_checkbox.check()
 
-                agree_terms_checkbox = page.locator('input[type="checkbox"]').first
-                agree_terms_checkbox.check()
+            submit_button = page.get_by_role("button", name="Sign in").first
+            self._wait_for_response(
+                page,
+                lambda response: "applications" in response.url,
+                action=submit_button.click,
+                phase="login",
+                budget=10000,
+            )
+        except Exception as e:
+            print(f"Error logging in: {str(e)}")
+            return None
+
+    def _is_logged_in(self, page):
+        try:
+            if not page.url.startswith(self.applications_url):
+                page.goto(self.applications_url, wait_until="networkidle")
+            return page.get_by_text("Sign in with Email").count() == 0
+        except Exception as e:
+            print(f"Error checking login state: {str(e)}")
+            return False
 
+    def scrape_applied_page(self):
+        try:
+            context, page = self._authenticated_context()
+            with context:
                 application_data = None
                 def handle_application_data_from_response(response):
                     if "applications" in response.url and response.status == 200:
@@ -179,11 +261,16 @@ class TikTokCareersScrapper(BaseCareersScraper):
                 
                 page.on("response", handle_application_data_from_response)
                 
-                submit_button = page.get_by_role("button", name="Sign in").first
-                submit_button.click()
-                page.wait_for_timeout(10000)
-
-                
+                # Reload the applications page with the handler attached to capture the list
+                self._wait_for_response(
+                    page,
+                    lambda response: "applications" in response.url and response.status == 200,
+                    action=lambda: page.goto(self.applications_url, wait_until="domcontentloaded"),
+                    phase="applied page",
+                    budget=2000,
+                )
+                self.metrics.increment("pages_fetched")
+                self.waits.report()
                 return application_data
 
         except Exception as e:
@@ -191,16 +278,111 @@ class TikTokCareersScrapper(BaseCareersScraper):
             print(f"Error details: {str(e)}")
             return None
 
+    @staticmethod
+    def _location_label_selector(location_name):
+        # Handle "Washington DC" vs "Washington D.C." in HTML
+        if location_name == "Washington DC":
+            return 'label:has-text("Washington D.C."), label:has-text("Washington DC")'
+        # Find the label containing the location name text
+        return f'label:has-text("{location_name}")'
+
+    @staticmethod
+    def _is_posts_response(response):
+        return "posts" in response.url and response.status == 200
+
+    def _select_locations(self, page):
+        """
+        Open the location filter and tick every location in self.locations.
+        
+        Each click is retried with exponential backoff.
+        
+        Returns:
+            Tuple of (dict mapping each location that could not be selected to its last
+            error, the posts response to the last location click or None if nothing was
+            clicked). The search misses the failed locations' jobs.
+        """
+        # Click on the "Location" text element to open the location filter
+        print("Clicking on Location filter...")
+        self.retry_policy.call(lambda: self._open_location_filter(page), on_retry=self._retry_logger("location filter"))
+        
+        # Select each location from our list
+        print(f"Selecting {len(self.locations)} locations...")
+        failed = {}
+        filtered, last_clicked = None, None
+        for location_name in self.locations:
+            try:
+                clicked, response = self.retry_policy.call(
+                    lambda: self._select_location(page, location_name),
+                    on_retry=self._retry_logger(f"location {location_name}"),
+                )
+            except Exception as e:
+                print(f"  ✗ Failed to select {location_name}: {str(e)}")
+                failed[location_name] = f"{type(e).__name__}: {str(e)}"
+                continue
+            if clicked:
+                filtered, last_clicked = response, location_name
+
+        # Without the response to the last click, the posts template and count may predate it
+        if last_clicked is not None and filtered is None:
+            failed[last_clicked] = "RuntimeError: No posts response after selecting it"
+        if failed:
+            self.metrics.record_failed("location filter", failed)
+        print("Location selection complete!")
+        return failed, filtered
+
+    def _open_location_filter(self, page):
+        location_header = page.get_by_text("Location", exact=True).first
+        self._wait_for_locator(location_header, phase="location filter")
+        location_header.click()
+        
+        # Wait for the location dropdown/checkbox group to appear
+        print("Waiting for location options to load...")
+        if not self._wait_for_locator(page.locator(LOCATION_OPTIONS_SELECTOR).first, phase="location filter", budget=1000, timeout=5000):
+            raise RuntimeError("Location options did not load")
+
+    def _select_location(self, page, location_name):
+        """
+        Tick one location.
+
+        Returns:
+            Tuple of (whether it was clicked, the posts response the click triggered or None)
+        """
+        location_label = page.locator(self._location_label_selector(location_name)).first
+        
+        # Check if the checkbox is already checked
+        checkbox = location_label.locator('input[type="checkbox"]')
+        if checkbox.is_checked():
+            print(f"  ⊙ Already selected: {location_name}")
+            return False, None
+        
+        # Click on the label (which will toggle the checkbox) and catch the posts
+        # request it fires with the updated filters
+        response = self._wait_for_response(page, self._is_posts_response, action=location_label.click, phase="location filter")
+        if not self._wait_for_locator(
+            location_label.locator('input[type="checkbox"]:checked'),
+            state="attached",
+            phase="location filter",
+            budget=300,
+        ):
+            raise RuntimeError(f"{location_name} did not become checked")
+        print(f"  ✓ Selected: {location_name}")
+        return True, response
+
     def scrape_careers_page(self, max_jobs=None):
+        from .http import RequestTemplate
         try:
-            with sync_playwright() as p:
-                # headless=True means the browser runs in the background (no visible window)
-                # headless=False would show you the browser window (useful for debugging)
-                browser = p.chromium.launch(headless=False)
-                page = browser.new_page()
-
+            # The lean profile runs headless; pass lean=False to watch the browser
+            with self.browser_manager.page() as page:
                 total_jobs = 0
                 jobs_found = {}
+                posts_template = None
+                self.last_crawl_complete = False
+                known_ids = self._known_ids() if self.incremental else None
+                def capture_posts_request(request):
+                    if "posts" in request.url and request.method == "POST":
+                        nonlocal posts_template
+                        posts_template = request
+
                 def handle_count_from_response(response):
                     if "posts" in response.url and response.status == 200:
                         try:
@@ -212,64 +394,52 @@ class TikTokCareersScrapper(BaseCareersScraper):
                             pass
                             
                 
+                page.on("request", capture_posts_request)
                 page.on("response", handle_count_from_response)
-                page.goto(self.primary_url, wait_until="networkidle")
-                page.wait_for_load_state("domcontentloaded")
-                
-                page.wait_for_timeout(2000)  # Wait 2 seconds for JavaScript to execute
-                
-                # Click on the "Location" text element to open the location filter
-                print("Clicking on Location filter...")
-                location_header = page.get_by_text("Location", exact=True).first
-                location_header.click()
-                
-                # Wait for the location dropdown/checkbox group to appear
-                print("Waiting for location options to load...")
-                page.wait_for_selector('[data-testid="checkbox-group"]', timeout=5000)
-                page.wait_for_timeout(1000)  # Give it a moment to fully render
-                
-                # Select each location from our list
-                print(f"Selecting {len(self.locations)} locations...")
-                for location_name in self.locations:
+                # The first posts response carries the total count
+                with self.metrics.phase("navigation"):
+                    self._wait_for_response(
+                        page,
+                        self._is_posts_response,
+                        action=lambda: page.goto(self.primary_url, wait_until="domcontentloaded"),
+                        phase="navigation",
+                        budget=2000,
+                    )
+                self.metrics.increment("pages_fetched")
+                failed_locations, filtered = self._select_locations(page)
+                if filtered is not None:
+                    # Take the template and count from the response to the final filter
+                    # click, not from whichever posts request happened to come last
+                    page.remove_listener("request", capture_posts_request)
+                    page.remove_listener("response", handle_count_from_response)
+                    posts_template = filtered.request
                     try:
-                        # Handle "Washington DC" vs "Washington D.C." in HTML
-                        search_text = location_name
-                        if location_name == "Washington DC":
-                            # Try both variations
-                            location_label = page.locator(f'label:has-text("Washington D.C."), label:has-text("Washington DC")').first
-                        else:
-                            # Find the label containing the location name text
-                            location_label = page.locator(f'label:has-text("{location_name}")').first
-                        
-                        # Check if the checkbox is already checked
-                        checkbox = location_label.locator('input[type="checkbox"]')
-                        is_checked = checkbox.is_checked()
-                        
-                        if not is_checked:
-                            # Click on the label (which will toggle the checkbox)
-                            location_label.click()
-                            print(f"  ✓ Selected: {location_name}")
-                            page.wait_for_timeout(300)  # Small delay between clicks
-                        else:
-                            print(f"  ⊙ Already selected: {location_name}")
-                            
-                    except Exception as e:
-                        print(f"  ✗ Failed to select {location_name}: {str(e)}")
-                
-                print("Location selection complete!")
-                
-                # Wait a bit for the page to update with the selected filters
-                page.wait_for_timeout(5000)
+                        total_jobs = filtered.json().get("data", {}).get("count", 0)
+                    except Exception:
+                        total_jobs = 0
+
+                # The last posts request carries the selected location filters, so
+                # replay it directly instead of clicking through every page
+                if self.use_api and posts_template is not None:
+                    template = RequestTemplate.from_request(posts_template, page.context.cookies())
+                    page.context.close()
+                    self.waits.report()
+                    jobs_found = self._fetch_posts_via_api(template, total_jobs, max_jobs=max_jobs, known_ids=known_ids)
+                    # A search that missed some locations can't tell which jobs closed
+                    self.last_crawl_complete = self.last_crawl_complete and not failed_locations
+                    return jobs_found
                 
                 # Locations are selected by this point
                 # now retreive the job data from the response by changing offset from 0 to n with limit = 12
+                page_ids = []
                 def handle_jobs_from_response(response):
                     if "posts" in response.url and response.status == 200:
                         try:
                             response_data = response.json()
                             json_data = response_data.get("data", {})
                             jobs = json_data.get("job_post_list", [])
-                            nonlocal jobs_found
+                            nonlocal jobs_found, page_ids
+                            page_ids = [str(job.get("id")) for job in jobs]
                             for job in jobs:
                                 if max_jobs is not None and len(jobs_found) >= max_jobs:
                                     break
@@ -283,17 +453,49 @@ class TikTokCareersScrapper(BaseCareersScraper):
                 page.on("response", handle_jobs_from_response)
 
                 total_pages = int((total_jobs / 12)) + 1
+                known_streak = 0
+                complete = not failed_locations
+                failed_pages = {}
                 for index in range(1, total_pages+1):
                     print(f"Fetching jobs with offset {index}...")
                     if max_jobs is not None and len(jobs_found) >= max_jobs:
                         print("Reached maximum job limit.")
+                        complete = False
                         break
+                    page_ids = []
                     button_element = page.get_by_role("button", name=str(index)).first
-                    button_element.click()
-                    page.wait_for_timeout(5000)
-                
-                # Close the browser to free up resources
-                browser.close()
+
+                    def click_page():
+                        response = self._wait_for_response(
+                            page,
+                            self._is_posts_response,
+                            action=button_element.click,
+                            phase="pagination",
+                            budget=5000,
+                            timeout=5000,
+                        )
+                        if response is None:
+                            raise RuntimeError(f"Page {index} did not load")
+
+                    try:
+                        with self.metrics.phase("pagination"):
+                            self.retry_policy.call(click_page, on_retry=self._retry_logger(f"page {index}"))
+                    except Exception as e:
+                        print(f"  ✗ Failed to load page {index}: {str(e)}")
+                        failed_pages[index] = f"{type(e).__name__}: {str(e)}"
+                        complete = False
+                    self.metrics.increment("pages_fetched")
+                    if known_ids is not None:
+                        known_streak = known_streak + 1 if page_ids and known_ids.issuperset(page_ids) else 0
+                        if known_streak >= self.stop_after_known_pages:
+                            print(f"Stopping after {known_streak} pages of known jobs.")
+                            complete = False
+                            break
+                if failed_pages:
+                    self.metrics.record_failed("pagination", failed_pages)
+                # The final page button sits past the count, so its page is short or empty
+                self.last_crawl_complete = complete and self._listing_complete(total_jobs, 12, len(page_ids))
+                self.waits.report()
                 
                 return jobs_found
                
@@ -302,6 +504,126 @@ class TikTokCareersScrapper(BaseCareersScraper):
             print(f"Error details: {str(e)}")
             return None
 
+    def _fetch_posts_page(self, template, session, offset, page_size, retry_queue):
+        """
+        Fetch one page of posts with a captured request template.
+        
+        Args:
+            retry_queue: RetryQueue the page is deferred to if it fails or its
+                host's circuit breaker is open
+        
+        Returns:
+            List of job dicts, or None if the page was deferred or given up on
+        """
+        if not retry_queue.allow(offset, offset):
+            return None
+        try:
+            response = template.send(session, offset=offset, limit=page_size)
+            self._count_fetch(response)
+            response.raise_for_status()
+            with self.metrics.phase("parse"):
+                jobs = response.json().get("data", {}).get("job_post_list", [])
+        except Exception as e:
+            self.metrics.increment("failures")
+            print(f"  ✗ Failed to fetch offset {offset}: {str(e)}")
+            retry_queue.failed_attempt(offset, offset, e)
+            return None
+        retry_queue.succeeded(offset)
+        return jobs
 
-            
-         
\ No newline at end of file
+    def _collect_posts(self, jobs, jobs_found, max_jobs=None, known_ids=None, known_streak=0):
+        """
+        Add one page of posts to jobs_found.
+        
+        Returns:
+            The run of consecutive all-known pages, updated for this page
+        """
+        for job in jobs:
+            if max_jobs is not None and len(jobs_found) >= max_jobs:
+                break
+            jobs_found[job.get("id")] = job
+        if known_ids is not None:
+            page_known = bool(jobs) and all(str(job.get("id")) in known_ids for job in jobs)
+            known_streak = known_streak + 1 if page_known else 0
+        print(f"Found {len(jobs_found)} Number of jobs", end="\r")
+        return known_streak
+
+    def _fetch_posts_via_api(self, template, total_jobs, max_jobs=None, known_ids=None):
+        """
+        Page through the posts endpoint using a captured request template.
+
+        Args:
+            template: RequestTemplate captured from the browser's posts request
+            total_jobs: Total number of jobs reported by the endpoint
+            max_jobs: Optional maximum number of jobs to scrape
+            known_ids: Optional set of stored job ids. When given, pages are fetched in
+                waves of self.concurrency and paging stops once self.stop_after_known_pages
+                consecutive pages hold only known jobs.
+
+        Each fetched page is journaled in the crawl checkpoint, which is written every
+        self.checkpoint_every pages. With self.resume set, the journaled pages are
+        replayed and their offsets skipped.
+        Failed pages are retried with exponential backoff after the other pages.
+
+        Returns:
+            Dictionary mapping job_id to job data, same shape as the click-through mode.
+        """
+        page_size = int(template.body.get("limit") or 12)
+        total_jobs = total_jobs if isinstance(total_jobs, int) else 0
+        complete = max_jobs is None or max_jobs >= total_jobs
+        if max_jobs is not None:
+            total_jobs = min(total_jobs, max_jobs)
+        # A full crawl also fetches the page at the count when it falls on a page
+        # boundary, so the final page is short or empty if the count was right
+        offsets = list(range(0, total_jobs + (1 if complete else 0), page_size))
+        final_offset = offsets[-1] if offsets else None
+
+        checkpoint = self._crawl_checkpoint()
+        jobs_found, known_streak, fetched = self._resume_posts(checkpoint, max_jobs, known_ids)
+        if fetched:
+            offsets = [offset for offset in offsets if offset not in fetched]
+            print(f"Skipping {len(fetched)} pages fetched before the checkpoint")
+        print(f"Fetching {len(offsets)} pages directly with concurrency {self.concurrency}...")
+
+        session = self._build_session(pool_size=self.concurrency)
+        retry_queue = self._retry_queue()
+
+        def fetch_page(offset):
+            return self._fetch_posts_page(template, session, offset, page_size, retry_queue)
+
+        def collect(wave, pages):
+            nonlocal known_streak
+            for offset, jobs in zip(wave, pages):
+                if jobs is None:
+                    continue
+                known_streak = self._collect_posts(jobs, jobs_found, max_jobs, known_ids, known_streak)
+                fetched[offset] = len(jobs)
+                checkpoint.step(entry={"offset": offset, "jobs": jobs})
+
+        # A full crawl submits every page at once; a delta crawl goes wave by wave
+        wave_size = len(offsets) if known_ids is None else self.concurrency
+        try:
+            with self.metrics.phase("pagination"), ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                for wave_start in range(0, len(offsets), max(wave_size, 1)):
+                    wave = offsets[wave_start:wave_start + wave_size]
+                    # map keeps pages in offset order so max_jobs trims the tail
+                    collect(wave, executor.map(fetch_page, wave))
+                    if known_ids is not None and known_streak >= self.stop_after_known_pages:
+                        print(f"\nStopping after {known_streak} pages of known jobs.")
+                        complete = False
+                        break
+                else:
+                    # Failed pages are retried once every other page is in
+                    wave = retry_queue.next_round()
+                    while wave:
+                        self.metrics.increment("retries", retry_queue.last_retries)
+                        collect(wave, executor.map(fetch_page, wave))
+                        wave = retry_queue.next_round()
+        finally:
+            session.close()
+
+        print()
+        if self._report_failed("pagination", retry_queue):
+            complete = False
+        self.last_crawl_complete = complete and self._listing_complete(total_jobs, page_size, fetched.get(final_offset))
+        return jobs_found
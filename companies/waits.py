@@ -0,0 +1,65 @@
+import threading
+from collections import defaultdict
+
+
+class WaitTracker:
+    """
+    Records how long each scraping phase actually waited, next to the fixed
+    sleep budget the event-driven wait replaced.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phases = defaultdict(lambda: {"waits": 0, "waited": 0.0, "budget": 0.0})
+
+    def record(self, phase, waited, budget):
+        """
+        Args:
+            phase: Name of the phase the wait belongs to
+            waited: Seconds actually spent waiting
+            budget: Seconds the replaced fixed sleep would have taken
+        """
+        with self._lock:
+            stats = self.phases[phase]
+            stats["waits"] += 1
+            stats["waited"] += waited
+            stats["budget"] += budget
+
+    def reset(self):
+        with self._lock:
+            self.phases.clear()
+
+    def report(self):
+        """
+        Print the per-phase wait summary, including the wall-clock time saved.
+
+        The tracker is reset afterwards, so each report covers only the waits
+        recorded since the previous one.
+        """
+        from rich.console import Console
+        from rich.table import Table
+        with self._lock:
+            phases = {phase: dict(stats) for phase, stats in self.phases.items()}
+            self.phases.clear()
+        if not phases:
+            return
+        table = Table(title="Wait Summary", show_header=True, header_style="bold magenta")
+        table.add_column("Phase", style="cyan")
+        table.add_column("Waits", justify="right")
+        table.add_column("Waited (s)", justify="right")
+        table.add_column("Fixed Sleep (s)", justify="right")
+        table.add_column("Saved (s)", style="green", justify="right")
+
+        total_waited = total_budget = 0.0
+        for phase, stats in phases.items():
+            total_waited += stats["waited"]
+            total_budget += stats["budget"]
+            table.add_row(
+                phase,
+                str(stats["waits"]),
+                f"{stats['waited']:.1f}",
+                f"{stats['budget']:.1f}",
+                f"{stats['budget'] - stats['waited']:.1f}",
+            )
+        table.add_row("total", "", f"{total_waited:.1f}", f"{total_budget:.1f}", f"{total_budget - total_waited:.1f}", style="bold")
+        Console().print(table)
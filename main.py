@@ -1,8 +1,9 @@
+import time
+import argparse
 from dataclasses import dataclass
 from enum import Enum
-from playwright.sync_api import sync_playwright
-from companies.meta import MetaCareersScraper
-from companies.tiktok import TikTokCareersScrapper
+from companies.orchestrator import PHASES, CrawlTask, run_crawls, run_crawls_async, print_crawl_summary
+from companies.registry import SCRAPERS, scraper_class
 from dotenv import load_dotenv
 
 # load env files
@@ -14,121 +15,83 @@ united_states_locations = [
 ] 
 
 def scrape_tiktok_careers_page(url):
+    """
+    Scrape TikTok job listings for a search URL.
 
-    try:
-        with sync_playwright() as p:
-            # headless=True means the browser runs in the background (no visible window)
-            # headless=False would show you the browser window (useful for debugging)
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
-
-            total_jobs = 0
-            jobs_found = {}
-            def handle_count_from_response(response):
-                if "posts" in response.url and response.status == 200:
-                    try:
-                        response_data = response.json()
-                        nonlocal total_jobs
-                        json_data = response_data.get("data", {})
-                        total_jobs = json_data.get("count", 0)
-                    except:
-                        pass
-                        
-            
-            page.on("response", handle_count_from_response)
-            page.goto(url, wait_until="networkidle")
-            page.wait_for_load_state("domcontentloaded")
-            
-            page.wait_for_timeout(2000)  # Wait 2 seconds for JavaScript to execute
-            
-            # Click on the "Location" text element to open the location filter
-            print("Clicking on Location filter...")
-            location_header = page.get_by_text("Location", exact=True).first
-            location_header.click()
-            
-            # Wait for the location dropdown/checkbox group to appear
-            print("Waiting for location options to load...")
-            page.wait_for_selector('[data-testid="checkbox-group"]', timeout=5000)
-            page.wait_for_timeout(1000)  # Give it a moment to fully render
-            
-            # Select each location from our list
-            print(f"Selecting {len(united_states_locations)} locations...")
-            for location_name in united_states_locations:
-                try:
-                    # Handle "Washington DC" vs "Washington D.C." in HTML
-                    search_text = location_name
-                    if location_name == "Washington DC":
-                        # Try both variations
-                        location_label = page.locator(f'label:has-text("Washington D.C."), label:has-text("Washington DC")').first
-                    else:
-                        # Find the label containing the location name text
-                        location_label = page.locator(f'label:has-text("{location_name}")').first
-                    
-                    # Check if the checkbox is already checked
-                    checkbox = location_label.locator('input[type="checkbox"]')
-                    is_checked = checkbox.is_checked()
-                    
-                    if not is_checked:
-                        # Click on the label (which will toggle the checkbox)
-                        location_label.click()
-                        print(f"  ✓ Selected: {location_name}")
-                        page.wait_for_timeout(300)  # Small delay between clicks
-                    else:
-                        print(f"  ⊙ Already selected: {location_name}")
-                        
-                except Exception as e:
-                    print(f"  ✗ Failed to select {location_name}: {str(e)}")
-            
-            print("Location selection complete!")
-            
-            # Wait a bit for the page to update with the selected filters
-            page.wait_for_timeout(5000)
-            
-            # Locations are updated by this point
-            # now retreive the job data from the response by changing offset from 0 to n with limit = 12
-            def handle_jobs_from_response(response):
-                if "posts" in response.url and response.status == 200:
-                    try:
-                        response_data = response.json()
-                        json_data = response_data.get("data", {})
-                        jobs = json_data.get("job_post_list", [])
-                        nonlocal jobs_found
-                        for job in jobs:
-                            job_id = job.get("id")
-                            jobs_found[job_id] = job
-                    except:
-                        pass
-            page.on("response", handle_jobs_from_response)
-
-            total_pages = int((total_jobs / 12)) + 1
-            for index in range(1, total_pages+1):
-                print(f"Fetching jobs with offset {index}...")
-                button_element = page.get_by_role("button", name=str(index)).first
-                button_element.click()
-                page.wait_for_timeout(5000)
-            
-            # Close the browser to free up resources
-            browser.close()
-            
-            return jobs_found
-            
-    except Exception as e:
-        print(f"Error scraping careers url: {url}")
-        print(f"Error details: {str(e)}")
-        return None
+    Thin wrapper around TikTokCareersScrapper.scrape_careers_page, which launches
+    the browser once through the scraper's BrowserManager.
+    """
+    with scraper_class("tiktok")(locations=united_states_locations) as scraper:
+        scraper.primary_url = url
+        return scraper.scrape_careers_page()
+
+
+TIKTOK_BASE_URL = "https://lifeattiktok.com"
+META_BASE_URL = "https://www.metacareers.com/jobsearch"
+
+# Constructor arguments per company; the scraper classes are imported on demand from companies.registry
+SCRAPER_KWARGS = {
+    "meta": {"base_url": META_BASE_URL},
+    "tiktok": {"base_url": TIKTOK_BASE_URL},
+}
+
+
+def crawl(companies, phases=("crawl",), workers=None, timeout=None, max_jobs=None, incremental=None, resume=None, use_async=False):
+    """
+    Run the given phases for several companies in parallel worker processes,
+    or on one event loop with the async scrapers when use_async is set.
+    """
+    tasks = [
+        CrawlTask(scraper_class(company, use_async), SCRAPER_KWARGS[company], phases=tuple(phases), max_jobs=max_jobs, incremental=incremental, resume=resume)
+        for company in companies
+    ]
+    start = time.monotonic()
+    if use_async:
+        import asyncio
+        results = asyncio.run(run_crawls_async(tasks, timeout=timeout))
+    else:
+        results = run_crawls(tasks, workers=workers, timeout=timeout)
+    print_crawl_summary(results, wall_seconds=time.monotonic() - start)
+    return results
 
 
 def main():
-    TIKTOK_BASE_URL = "https://lifeattiktok.com"
-    META_BASE_URL = "https://www.metacareers.com/jobsearch"
-
-    # scrapper = TikTokCareersScrapper(base_url=TIKTOK_BASE_URL)
-    scrapper = MetaCareersScraper(base_url=META_BASE_URL)
-    # scrapper.scrape_and_save_jobs(max_jobs=None)
-    # scrapper.update_applications(find_status=True)
-    # scrapper.filter_and_find_applications()
-    scrapper.print_application_details()
-    
+    parser = argparse.ArgumentParser(description="Crawl company careers pages and track applications")
+    subparsers = parser.add_subparsers(dest="command")
+
+    crawl_parser = subparsers.add_parser("crawl", help="Crawl several companies concurrently")
+    crawl_parser.add_argument("companies", nargs="*", default=None, help=f"Companies to crawl (default: all of {', '.join(SCRAPERS)})")
+    crawl_parser.add_argument("--phases", nargs="+", choices=PHASES, default=["crawl"])
+    crawl_parser.add_argument("--workers", type=int, default=None, help="Maximum concurrent companies")
+    crawl_parser.add_argument("--timeout", type=float, default=None, help="Per-company timeout in seconds")
+    crawl_parser.add_argument("--max-jobs", type=int, default=None)
+    crawl_parser.add_argument("--incremental", action="store_true", default=None, help="Stop paginating once pages hold only known jobs")
+    crawl_parser.add_argument("--resume", action="store_true", default=None, help="Continue interrupted crawls and status checks from their last checkpoint")
+    crawl_parser.add_argument("--async", dest="use_async", action="store_true", help="Run every company on one event loop with the async scrapers")
+
+    show_parser = subparsers.add_parser("show", help="Print filtered applications for a company")
+    show_parser.add_argument("company", nargs="?", choices=list(SCRAPERS), default="meta")
+
+    search_parser = subparsers.add_parser("search", help="Full-text search over a company's job titles, requirements and descriptions")
+    search_parser.add_argument("company", choices=list(SCRAPERS))
+    search_parser.add_argument("query", nargs="+", help='FTS5 query, e.g. python AND "distributed systems" NOT intern')
+    search_parser.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+    if args.command == "crawl":
+        # argparse checks a list default against choices as a whole, so names are validated here
+        companies = args.companies or list(SCRAPERS)
+        unknown = [company for company in companies if company not in SCRAPERS]
+        if unknown:
+            crawl_parser.error(f"unknown companies: {', '.join(unknown)} (choose from {', '.join(SCRAPERS)})")
+        crawl(companies, phases=args.phases, workers=args.workers, timeout=args.timeout, max_jobs=args.max_jobs, incremental=args.incremental, resume=args.resume, use_async=args.use_async)
+    elif args.command == "search":
+        with scraper_class(args.company)(**SCRAPER_KWARGS[args.company]) as scraper:
+            scraper.print_search_results(" ".join(args.query), limit=args.limit)
+    else:
+        company = getattr(args, "company", "meta")
+        with scraper_class(company)(**SCRAPER_KWARGS[company]) as scraper:
+            scraper.print_application_details()
     
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from companies.filters import INDEX_MIN_ROWS, ColumnMatcher, FilterEngine
+from companies.search import SearchIndex
+
+
+class ColumnMatcherTest(unittest.TestCase):
+
+    def test_include_groups_sharing_a_start_offset_are_each_counted(self):
+        matcher = ColumnMatcher([{"include": ["python"]}, {"include": ["python developer"]}])
+        self.assertTrue(matcher.matches("Senior Python Developer"))
+        self.assertFalse(matcher.matches("Python engineer"))
+
+    def test_include_groups_on_the_same_column(self):
+        # Meta applies its qualification and description filters to the description column
+        engine = FilterEngine([
+            ("description", {"include": ["python"], "exclude": ["intern"]}),
+            ("description", {"include": ["python developer", "backend"]}),
+        ])
+        df = pd.DataFrame({
+            "id": ["1", "2", "3", "4"],
+            "description": ["python developer", "python backend role", "python only", "python developer intern"],
+        })
+        self.assertEqual(engine.mask(df).tolist(), [True, True, False, False])
+
+    def test_exclude_wins_over_include_at_the_same_offset(self):
+        matcher = ColumnMatcher([{"include": ["data"], "exclude": ["data entry"]}])
+        self.assertFalse(matcher.matches("Data Entry Clerk"))
+        self.assertTrue(matcher.matches("Data Scientist"))
+
+    def test_missing_text_passes_only_without_includes(self):
+        self.assertTrue(ColumnMatcher([{"exclude": ["intern"]}]).matches(None))
+        self.assertFalse(ColumnMatcher([{"include": ["python"]}]).matches(""))
+
+
+class IndexMaskTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = SearchIndex(os.path.join(self.tmp.name, "jobs_index.sqlite"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_index_path_matches_scan_path(self):
+        texts = ["python developer", "python backend role", "python only", "python developer intern", "Go engineer", None]
+        df = pd.DataFrame({
+            "id": [str(i) for i in range(INDEX_MIN_ROWS)],
+            "title": [f"Engineer {i}" for i in range(INDEX_MIN_ROWS)],
+            "description": [texts[i % len(texts)] for i in range(INDEX_MIN_ROWS)],
+        })
+        self.index.rebuild(df)
+        engine = FilterEngine([
+            ("description", {"include": ["python"], "exclude": ["intern"]}),
+            ("description", {"include": ["python developer", "backend"]}),
+            ("title", {"exclude": ["engineer 7"]}),
+        ])
+        scanned = engine.mask(df)
+        indexed = engine.mask(df, index=self.index)
+        self.assertTrue(scanned.any())
+        self.assertEqual(df.loc[scanned != indexed, "id"].tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()